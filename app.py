@@ -9,7 +9,7 @@ import streamlit as st
 import json
 from pathlib import Path
 from models import Mentor, Mentee
-from services import MatchingService
+from services.registry import get_matching_service
 
 
 # 페이지 설정
@@ -36,6 +36,40 @@ def load_mentees():
         return [Mentee(**mentee) for mentee in data]
 
 
+def render_recommendation(idx, rec):
+    """추천 프로그램 카드 표시"""
+    program = rec.program
+    
+    with st.container():
+        st.markdown(f"### 🏆 추천 {idx}: {program.title}")
+        
+        # 점수 프로그레스 바
+        st.progress(rec.match_score / 100)
+        st.markdown(f"**매칭 점수**: {rec.match_score:.1f}/100")
+        
+        # 프로그램 정보
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("📍 위치", program.location)
+            st.metric("🎯 활동", program.activity_type)
+        with col2:
+            st.metric("💰 비용", f"{program.estimated_cost:,}원")
+            st.metric("⏱️ 시간", f"{program.duration_minutes}분")
+        with col3:
+            st.metric("👥 추천 직군", ", ".join(program.recommended_for[:2]))
+        
+        # 추천 이유
+        st.markdown("**💡 추천 이유:**")
+        st.info(rec.reason)
+        
+        # 프로그램 설명
+        with st.expander("📝 상세 설명"):
+            st.write(program.description)
+            st.markdown(f"**태그**: {', '.join(program.tags)}")
+        
+        st.markdown("---")
+
+
 def main():
     """메인 애플리케이션"""
     
@@ -137,58 +171,32 @@ def main():
         st.markdown("---")
         st.header("✨ 추천 프로그램")
         
-        with st.spinner("🔍 최적의 프로그램을 찾는 중..."):
-            try:
-                # 매칭 서비스 실행
-                matching_service = MatchingService(use_ai=use_ai)
-                matching_service.load_programs_from_file("data/sample_programs.json")
-                
-                recommendations = matching_service.find_matches(
+        status = st.empty()
+        status.info("🔍 최적의 프로그램을 찾는 중...")
+        
+        try:
+            # 매칭 서비스 실행 (모드별로 미리 준비된 서비스 재사용)
+            matching_service = get_matching_service(use_ai=use_ai)
+            
+            # 추천이 하나 완성될 때마다 바로 카드로 표시
+            count = 0
+            for count, rec in enumerate(
+                matching_service.find_matches_stream(
                     mentor=mentor,
                     mentee=mentee,
                     top_k=top_k
-                )
-                
-                if not recommendations:
-                    st.warning("❌ 예산 내에서 추천 가능한 프로그램이 없습니다.")
-                else:
-                    st.success(f"🎉 {len(recommendations)}개의 프로그램을 찾았습니다!")
-                    
-                    # 추천 프로그램 표시
-                    for idx, rec in enumerate(recommendations, 1):
-                        program = rec.program
-                        
-                        with st.container():
-                            st.markdown(f"### 🏆 추천 {idx}: {program.title}")
-                            
-                            # 점수 프로그레스 바
-                            st.progress(rec.match_score / 100)
-                            st.markdown(f"**매칭 점수**: {rec.match_score:.1f}/100")
-                            
-                            # 프로그램 정보
-                            col1, col2, col3 = st.columns(3)
-                            with col1:
-                                st.metric("📍 위치", program.location)
-                                st.metric("🎯 활동", program.activity_type)
-                            with col2:
-                                st.metric("💰 비용", f"{program.estimated_cost:,}원")
-                                st.metric("⏱️ 시간", f"{program.duration_minutes}분")
-                            with col3:
-                                st.metric("👥 추천 직군", ", ".join(program.recommended_for[:2]))
-                            
-                            # 추천 이유
-                            st.markdown("**💡 추천 이유:**")
-                            st.info(rec.reason)
-                            
-                            # 프로그램 설명
-                            with st.expander("📝 상세 설명"):
-                                st.write(program.description)
-                                st.markdown(f"**태그**: {', '.join(program.tags)}")
-                            
-                            st.markdown("---")
-                
-            except Exception as e:
-                st.error(f"❌ 매칭 중 오류 발생: {e}")
+                ),
+                1
+            ):
+                render_recommendation(count, rec)
+            
+            if not count:
+                status.warning("❌ 예산 내에서 추천 가능한 프로그램이 없습니다.")
+            else:
+                status.success(f"🎉 {count}개의 프로그램을 찾았습니다!")
+            
+        except Exception as e:
+            status.error(f"❌ 매칭 중 오류 발생: {e}")
         
         # 초기화
         st.session_state['run_matching'] = False
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+비동기 AI 추천 경로 점검 (모의 HTTP 전송)
+
+`AzureOpenAIService.agenerate_recommendations`를 httpx `MockTransport` 위에서 실행해
+실제 엔드포인트 없이 세 가지 동작을 확인합니다. 조건을 벗어나면 종료 코드 1로 끝납니다.
+
+1. 동시성 제한: 쌍 `--pairs`개를 `asyncio.gather`로 보내도 진행 중인 요청이
+   `--concurrency`개를 넘지 않고, 전체 시간이 ⌈쌍 수 / 동시성⌉ × 응답 지연 근처인지
+2. 타임아웃: 응답이 `--timeout`보다 늦으면 재시도 횟수만큼 다시 요청한 뒤 타임아웃 오류를 내는지
+3. 429 재시도: 첫 응답이 429 + `Retry-After`면 그만큼 기다린 뒤 다시 요청해 성공하는지
+
+    python benchmarks/bench_ai_async.py
+    python benchmarks/bench_ai_async.py --pairs 200 --latency 0.1 --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import openai
+
+try:
+    import httpx
+except ImportError:  # httpx를 httpx2라는 이름으로 포함하는 openai 배포판
+    import httpx2 as httpx
+
+# 실제 엔드포인트 / 디스크 캐시를 쓰지 않도록 서비스 생성 전에 설정
+os.environ.update(
+    AZURE_OPENAI_API_KEY="mock-key",
+    AZURE_OPENAI_ENDPOINT="https://mock.openai.azure.com",
+    AZURE_OPENAI_CACHE_PATH="",
+)
+
+from services.azure_openai_service import AzureOpenAIService
+from services.response_cache import ResponseCache
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+
+class MockedAzureOpenAIService(AzureOpenAIService):
+    """비동기 클라이언트의 HTTP 전송만 `handler`로 바꾼 서비스"""
+
+    def __init__(self, handler: Handler, **kwargs):
+        self._handler = handler
+        super().__init__(**kwargs)
+
+    def _create_async_client(self):
+        return openai.AsyncAzureOpenAI(
+            api_key=self.api_key,
+            api_version=self.api_version,
+            azure_endpoint=self.endpoint,
+            timeout=self.request_timeout,
+            max_retries=0,
+            http_client=openai.DefaultAsyncHttpxClient(transport=httpx.MockTransport(self._handler)),
+        )
+
+
+def completion(program_id: str) -> Any:
+    """추천 하나가 담긴 Chat Completion 응답"""
+    content = json.dumps({
+        "recommendations": [{"program_id": program_id, "match_score": 90, "reason": "모의 응답"}]
+    })
+    return httpx.Response(200, json={
+        "id": "mock",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "mock",
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+        ],
+    })
+
+
+def make_service(handler: Handler, concurrency: int, timeout: float, retries: int) -> AzureOpenAIService:
+    # 점검마다 실제 요청이 나가도록 응답 캐시는 비활성화 (메모리 0개, 디스크 없음)
+    service = MockedAzureOpenAIService(handler, cache=ResponseCache(max_entries=0))
+    service.max_concurrency = concurrency
+    service.request_timeout = timeout
+    service.max_retries = retries
+    return service
+
+
+def make_requests(count: int, programs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """서로 다른 멘토/멘티 쌍의 요청 인자 (캐시 / 요청 합치기에 걸리지 않도록 이름을 모두 다르게)"""
+    return [
+        {
+            "mentor_profile": {"name": f"멘토{i}", "interests": ["카페"]},
+            "mentee_profile": {"name": f"멘티{i}", "budget_limit": 50000},
+            "available_programs": programs,
+            "top_k": 1,
+        }
+        for i in range(count)
+    ]
+
+
+async def check_concurrency(args, programs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """쌍 `--pairs`개를 동시에 요청해 최대 동시 요청 수와 전체 시간 측정"""
+    state = {"in_flight": 0, "peak": 0, "calls": 0}
+
+    async def handler(request):
+        state["calls"] += 1
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        try:
+            await asyncio.sleep(args.latency)
+            return completion(programs[0]["program_id"])
+        finally:
+            state["in_flight"] -= 1
+
+    service = make_service(handler, args.concurrency, timeout=10 * args.latency + 1, retries=0)
+    requests = make_requests(args.pairs, programs)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(service.agenerate_recommendations(**r) for r in requests))
+    elapsed = time.perf_counter() - start
+
+    expected = math.ceil(args.pairs / args.concurrency) * args.latency
+    return {
+        "pairs": args.pairs,
+        "calls": state["calls"],
+        "peak_in_flight": state["peak"],
+        "seconds": elapsed,
+        "expected_seconds": expected,
+        "ok": (
+            state["peak"] <= args.concurrency
+            and state["calls"] == args.pairs
+            and all(len(result) == 1 for result in results)
+            # 세마포어가 막지 않으면 ⌈N/C⌉배가 아니라 지연 한 번 만에 끝남
+            and expected * 0.9 <= elapsed <= expected * 1.5 + 0.5
+        ),
+    }
+
+
+async def check_timeout(args, programs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """응답이 타임아웃보다 늦으면 `max_retries`번 다시 요청한 뒤 타임아웃 오류"""
+    state = {"calls": 0}
+
+    async def handler(request):
+        state["calls"] += 1
+        await asyncio.sleep(args.timeout * 4)
+        return completion(programs[0]["program_id"])
+
+    service = make_service(handler, args.concurrency, timeout=args.timeout, retries=args.retries)
+    service.retry_max_delay = 0.05
+    start = time.perf_counter()
+    try:
+        await service.agenerate_recommendations(**make_requests(1, programs)[0])
+        error = None
+    except Exception as e:
+        error = type(e).__name__
+    elapsed = time.perf_counter() - start
+
+    return {
+        "calls": state["calls"],
+        "error": error,
+        "seconds": elapsed,
+        "ok": (
+            error == "TimeoutError"
+            and state["calls"] == args.retries + 1
+            # 시도마다 타임아웃에서 끊기고 응답 지연(타임아웃 × 4)까지 기다리지 않음
+            and elapsed < (args.retries + 1) * (args.timeout + 0.05) + 0.5
+        ),
+    }
+
+
+async def check_retry_after(args, programs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """첫 응답 429 + Retry-After면 그만큼 기다린 뒤 재시도해 성공"""
+    state = {"calls": 0, "times": []}
+
+    async def handler(request):
+        state["calls"] += 1
+        state["times"].append(time.perf_counter())
+        if state["calls"] == 1:
+            return httpx.Response(
+                429,
+                headers={"retry-after": str(args.retry_after)},
+                json={"error": {"code": "429", "message": "Rate limit exceeded"}},
+            )
+        return completion(programs[0]["program_id"])
+
+    service = make_service(handler, args.concurrency, timeout=5, retries=args.retries)
+    result = await service.agenerate_recommendations(**make_requests(1, programs)[0])
+    waited = state["times"][1] - state["times"][0] if state["calls"] > 1 else None
+
+    return {
+        "calls": state["calls"],
+        "waited_seconds": waited,
+        "ok": (
+            state["calls"] == 2
+            and len(result) == 1
+            and waited is not None
+            and args.retry_after * 0.9 <= waited <= args.retry_after + 0.5
+        ),
+    }
+
+
+def print_check(name: str, result: Dict[str, Any]) -> None:
+    details = ", ".join(f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                        for key, value in result.items() if key != "ok")
+    print(f"{'✅' if result['ok'] else '❌'} {name:<12} {details}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="비동기 AI 추천 경로 점검 (모의 HTTP 전송)")
+    parser.add_argument("--pairs", type=int, default=200, help="동시에 요청할 멘토/멘티 쌍 수")
+    parser.add_argument("--latency", type=float, default=0.1, help="모의 응답 지연 (초)")
+    parser.add_argument("--concurrency", type=int, default=8, help="최대 동시 요청 수 (max_concurrency)")
+    parser.add_argument("--timeout", type=float, default=0.2, help="요청 타임아웃 (초, 타임아웃 점검용)")
+    parser.add_argument("--retries", type=int, default=2, help="최대 재시도 횟수")
+    parser.add_argument("--retry-after", type=float, default=0.3, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    # 재시도 / 실패 경고 로그는 점검 결과에 포함되므로 출력하지 않음
+    logging.basicConfig(level=logging.ERROR)
+    logging.getLogger("services").setLevel(logging.CRITICAL)
+
+    with open(ROOT / "data" / "sample_programs.json", "r", encoding="utf-8") as f:
+        programs = json.load(f)[:5]
+
+    async def run() -> Dict[str, Dict[str, Any]]:
+        return {
+            "concurrency": await check_concurrency(args, programs),
+            "timeout": await check_timeout(args, programs),
+            "retry_after": await check_retry_after(args, programs),
+        }
+
+    report = asyncio.run(run())
+    for name, result in report.items():
+        print_check(name, result)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+
+    if not all(result["ok"] for result in report.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
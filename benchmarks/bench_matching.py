@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+매칭 서비스 확장성 벤치마크
+
+합성 카탈로그 크기별로 로드 시간(JSON Lines / 스냅샷), `find_matches` 요청당 지연 시간
+(p50 / p90 / p99), 대량 매칭 처리량, 최대 메모리(RSS)를 측정해 JSON으로 저장합니다.
+크기마다 새 프로세스에서 측정하므로 최대 메모리가 이전 크기의 영향을 받지 않습니다.
+
+    python benchmarks/bench_matching.py --programs 10000 100000 1000000 --output bench.json
+    python benchmarks/bench_matching.py --programs 100000 --baseline bench.json
+"""
+
+import argparse
+import contextlib
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+
+from benchmarks.synthetic_data import make_mentees, make_mentors, make_programs, write_jsonl
+from models import Mentee, Mentor, MentoringProgram
+from services.data_loader import iter_models
+from services.matching_service import MatchingService
+from services.snapshot import write_snapshot
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS (MB, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """지연 시간 샘플(초) -> ms 단위 요약"""
+    values = np.asarray(samples) * 1000
+    return {
+        "p50": float(np.percentile(values, 50)),
+        "p90": float(np.percentile(values, 90)),
+        "p99": float(np.percentile(values, 99)),
+        "mean": float(values.mean()),
+        "max": float(values.max()),
+    }
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def run_size(config: Dict[str, Any]) -> Dict[str, Any]:
+    """카탈로그 크기 하나에 대한 측정 (새 프로세스에서 실행)"""
+    n_programs = config["programs"]
+    seed = config["seed"]
+    mentors = [Mentor(**record) for record in make_mentors(config["mentors"], seed)]
+    mentees = [Mentee(**record) for record in make_mentees(config["mentees"], seed)]
+    result: Dict[str, Any] = {"programs": n_programs}
+
+    with tempfile.TemporaryDirectory() as tmp, open(os.devnull, "w") as devnull:
+        catalog = str(Path(tmp) / "programs.jsonl")
+        result["generate_s"] = timed(lambda: write_jsonl(make_programs(n_programs, seed), catalog))
+        result["catalog_mb"] = Path(catalog).stat().st_size / 1e6
+
+        service = MatchingService(workers=config["workers"], local_only=config["local_only"])
+        with contextlib.redirect_stdout(devnull):
+            result["load_s"] = timed(lambda: service.load_programs_from_file(catalog))
+            result["load_trusted_s"] = timed(lambda: service.load_programs_from_file(catalog, trusted=True))
+
+            if config["snapshot"]:
+                snapshot = str(Path(tmp) / "programs.snap")
+                result["snapshot_write_s"] = timed(
+                    lambda: write_snapshot(iter_models(catalog, MentoringProgram, trusted=True), MentoringProgram, snapshot)
+                )
+                result["snapshot_load_s"] = timed(lambda: service.load_programs_from_file(snapshot))
+
+            # 요청당 지연 시간 (첫 요청의 지연 초기화 비용은 워밍업으로 제외)
+            rng = random.Random(seed)
+            pairs = [(rng.choice(mentors), rng.choice(mentees)) for _ in range(config["requests"])]
+            for mentor, mentee in pairs[:config["warmup"]]:
+                service.find_matches(mentor, mentee, top_k=config["top_k"])
+            samples = []
+            for mentor, mentee in pairs:
+                start = time.perf_counter()
+                service.find_matches(mentor, mentee, top_k=config["top_k"])
+                samples.append(time.perf_counter() - start)
+            result["find_matches_ms"] = percentiles(samples)
+
+            # 대량 매칭 처리량 (함께 가능한 요일이 없는 쌍은 결과에 없음)
+            start = time.perf_counter()
+            matched = sum(1 for _ in service.find_matches_bulk(mentors, mentees, top_k=config["top_k"]))
+            elapsed = time.perf_counter() - start
+            service.close()
+
+    result["bulk"] = {
+        "pairs": len(mentors) * len(mentees),
+        "matched_pairs": matched,
+        "seconds": elapsed,
+        "pairs_per_s": len(mentors) * len(mentees) / elapsed if elapsed else None,
+    }
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+
+def environment() -> Dict[str, Any]:
+    """결과 비교용 실행 환경 정보 (커밋, 파이썬/NumPy 버전, CPU 수)"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def print_result(result: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None):
+    latency = result["find_matches_ms"]
+    rows = [
+        ("로드 (검증)", result["load_s"] * 1000, "ms", ("load_s",)),
+        ("로드 (trusted)", result["load_trusted_s"] * 1000, "ms", ("load_trusted_s",)),
+    ]
+    if "snapshot_load_s" in result:
+        rows.append(("로드 (스냅샷)", result["snapshot_load_s"] * 1000, "ms", ("snapshot_load_s",)))
+    rows += [
+        ("find_matches p50", latency["p50"], "ms", ("find_matches_ms", "p50")),
+        ("find_matches p99", latency["p99"], "ms", ("find_matches_ms", "p99")),
+        ("대량 매칭", result["bulk"]["pairs_per_s"], "쌍/s", ("bulk", "pairs_per_s")),
+        ("최대 메모리", result["peak_rss_mb"], "MB", ("peak_rss_mb",)),
+    ]
+
+    print(f"\n📦 프로그램 {result['programs']:,}개 ({result['catalog_mb']:.1f} MB)")
+    for name, value, unit, key in rows:
+        if value is None:
+            continue
+        line = f"   {name:<18} {value:12.2f} {unit}"
+        before = _lookup(baseline, key)
+        if before:
+            scale = 1000 if key[0].endswith("_s") else 1
+            line += f"   (기준 대비 {value / (before * scale):5.2f}x)"
+        print(line)
+
+
+def _lookup(result: Optional[Dict[str, Any]], key) -> Optional[float]:
+    for part in key:
+        if not isinstance(result, dict):
+            return None
+        result = result.get(part)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="매칭 서비스 확장성 벤치마크")
+    parser.add_argument("--programs", type=int, nargs="+", default=[10_000, 100_000],
+                        help="측정할 카탈로그 크기 (여러 개, 최대 1,000,000 권장)")
+    parser.add_argument("--mentors", type=int, default=20, help="멘토 수")
+    parser.add_argument("--mentees", type=int, default=50, help="멘티 수")
+    parser.add_argument("--requests", type=int, default=200, help="지연 시간을 잴 find_matches 요청 수")
+    parser.add_argument("--warmup", type=int, default=5, help="측정 전 워밍업 요청 수")
+    parser.add_argument("--top-k", type=int, default=5, help="요청마다 추천할 프로그램 수")
+    parser.add_argument("--workers", type=int, default=0, help="점수 계산 프로세스 수 (2 이상이면 병렬)")
+    parser.add_argument("--local-only", action="store_true", help="같은 생활권 프로그램만 추천")
+    parser.add_argument("--no-snapshot", action="store_true", help="스냅샷 쓰기/로드 측정 생략")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON 파일 (같은 카탈로그 크기끼리 비교)")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = {result["programs"]: result for result in json.load(f)["results"]}
+
+    config = {
+        "mentors": args.mentors,
+        "mentees": args.mentees,
+        "requests": args.requests,
+        "warmup": args.warmup,
+        "top_k": args.top_k,
+        "workers": args.workers,
+        "local_only": args.local_only,
+        "snapshot": not args.no_snapshot,
+        "seed": args.seed,
+    }
+    report = {"environment": environment(), "config": config, "results": []}
+
+    # multiprocessing.Pool 워커는 데몬이라 --workers용 하위 프로세스를 만들 수 없으므로 Executor 사용
+    context = multiprocessing.get_context("spawn")
+    for n_programs in args.programs:
+        with concurrent.futures.ProcessPoolExecutor(1, mp_context=context) as executor:
+            result = executor.submit(run_size, {**config, "programs": n_programs}).result()
+        report["results"].append(result)
+        print_result(result, baseline.get(n_programs))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+모델 로드 경로 벤치마크
+
+프로그램 JSON 파일을 여러 방식으로 로드하는 시간과, AI 요청마다 프로그램을
+`model_dump()`하는 비용 vs 인덱스 직렬화 캐시를 비교합니다.
+
+    python benchmarks/bench_model_loading.py --programs 100000
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models import MentoringProgram
+from services.azure_openai_service import program_version
+from services.data_loader import iter_models, load_models_json
+from services.program_index import ProgramIndex
+
+
+def make_programs(count: int, seed: int = 0) -> List[dict]:
+    """샘플 프로그램을 바탕으로 합성 카탈로그 생성"""
+    rng = random.Random(seed)
+    base = json.loads(Path("data/sample_programs.json").read_text(encoding="utf-8"))
+    programs = []
+    for i in range(count):
+        program = dict(rng.choice(base))
+        program["program_id"] = f"SYN{i:07d}"
+        program["estimated_cost"] = rng.randint(0, 80_000)
+        programs.append(program)
+    return programs
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """`repeat`번 실행한 중 가장 짧은 시간 (초)"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="모델 로드 경로 벤치마크")
+    parser.add_argument("--programs", type=int, default=50_000, help="합성 프로그램 수")
+    parser.add_argument("--requests", type=int, default=200, help="직렬화 비교에 쓸 AI 요청 수")
+    parser.add_argument("--shortlist", type=int, default=30, help="요청마다 직렬화할 프로그램 수")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    args = parser.parse_args()
+
+    data = make_programs(args.programs)
+    with tempfile.TemporaryDirectory() as tmp:
+        array_path = str(Path(tmp) / "programs.json")
+        lines_path = str(Path(tmp) / "programs.jsonl")
+        Path(array_path).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        Path(lines_path).write_text(
+            "".join(json.dumps(program, ensure_ascii=False) + "\n" for program in data),
+            encoding="utf-8"
+        )
+
+        def baseline():
+            with open(array_path, "r", encoding="utf-8") as f:
+                return [MentoringProgram(**program) for program in json.load(f)]
+
+        loaders = [
+            ("json.load + MentoringProgram(**d)", baseline),
+            ("model_construct(**d) (참고)",
+             lambda: [MentoringProgram.model_construct(**p) for p in json.loads(Path(array_path).read_text("utf-8"))]),
+            ("스트리밍 배열 + TypeAdapter 묶음 검증", lambda: list(iter_models(array_path, MentoringProgram))),
+            ("스트리밍 JSONL + validate_json 묶음", lambda: list(iter_models(lines_path, MentoringProgram))),
+            ("validate_json (배열 파일 전체)", lambda: load_models_json(array_path, MentoringProgram)),
+            ("스트리밍 배열 + trusted (검증 생략)",
+             lambda: list(iter_models(array_path, MentoringProgram, trusted=True))),
+            ("스트리밍 JSONL + trusted (검증 생략)",
+             lambda: list(iter_models(lines_path, MentoringProgram, trusted=True))),
+        ]
+
+        size_mb = Path(array_path).stat().st_size / 1e6
+        print(f"📦 프로그램 {args.programs:,}개 ({size_mb:.1f} MB)\n")
+        base_time = None
+        for name, loader in loaders:
+            elapsed = best_of(args.repeat, loader)
+            base_time = base_time or elapsed
+            print(f"{name:<36} {elapsed * 1000:9.1f} ms  ({base_time / elapsed:4.1f}x)")
+
+    # AI 요청마다 프로그램 직렬화: 매번 model_dump + 해시 vs 인덱스 캐시
+    index = ProgramIndex(MentoringProgram(**program) for program in data)
+    rng = random.Random(1)
+    requests = [
+        rng.sample(range(len(index)), min(args.shortlist, len(index)))
+        for _ in range(args.requests)
+    ]
+
+    def dump_every_time():
+        for positions in requests:
+            dumped = [index.programs[pos].model_dump() for pos in positions]
+            [program_version(program) for program in dumped]
+
+    def cached_payloads():
+        for positions in requests:
+            payloads = [index.payload(pos) for pos in positions]
+            [payload.data for payload in payloads], [payload.version for payload in payloads]
+
+    print(f"\n🤖 AI 요청 {args.requests}건 × 프로그램 {args.shortlist}개 직렬화")
+    uncached = best_of(args.repeat, dump_every_time)
+    cached = best_of(args.repeat, cached_payloads)
+    print(f"{'model_dump + 내용 해시 (매 요청)':<36} {uncached * 1000:9.1f} ms")
+    print(f"{'ProgramIndex.payload 캐시':<36} {cached * 1000:9.1f} ms  ({uncached / cached:4.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+매칭 API 서버 부하 테스트
+
+keep-alive 연결 `--concurrency`개로 `POST /match`를 동시에 보내 처리량과
+지연 시간 분위수(p50 / p90 / p99), 상태 코드별 횟수를 측정합니다.
+`--programs`를 주면 합성 카탈로그로 서버(`main.py serve`)를 직접 띄워 측정합니다.
+
+    python benchmarks/load_test.py --programs 100000 --concurrency 64 --requests 5000
+    python benchmarks/load_test.py --url http://127.0.0.1:8080 --duration 30 --output load.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_matching import environment, percentiles
+from benchmarks.synthetic_data import make_mentees, make_mentors, make_programs, write_jsonl
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class Connection:
+    """keep-alive HTTP/1.1 연결 하나 (끊기면 다시 연결)"""
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self.reader: Optional[asyncio.StreamReader] = None
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    async def request(self, method: str, path: str, body: bytes = b"") -> Tuple[int, bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        head = (
+            f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+        )
+        self.writer.write(head.encode("latin-1") + body)
+        await self.writer.drain()
+
+        status_line, *header_lines = (await self.reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        headers = {
+            name.strip().lower(): value.strip()
+            for name, value in (line.split(":", 1) for line in header_lines if ":" in line)
+        }
+        payload = await self.reader.readexactly(int(headers.get("content-length", "0")))
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return int(status_line.split(" ", 2)[1]), payload
+
+    def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+async def run_load(
+    host: str,
+    port: int,
+    bodies: List[bytes],
+    concurrency: int,
+    total: Optional[int],
+    duration: Optional[float]
+) -> Dict[str, Any]:
+    """동시 연결 `concurrency`개로 요청을 보내고 결과 요약"""
+    latencies: List[float] = []
+    statuses: Counter = Counter()
+    sent = 0
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker(seed: int):
+        nonlocal sent
+        rng = random.Random(seed)
+        connection = Connection(host, port)
+        try:
+            while (total is None or sent < total) and (deadline is None or time.perf_counter() < deadline):
+                sent += 1
+                start = time.perf_counter()
+                try:
+                    status, _ = await connection.request("POST", "/match", rng.choice(bodies))
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    connection.close()
+                    status = "connection_error"
+                latencies.append(time.perf_counter() - start)
+                statuses[status] += 1
+        finally:
+            connection.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(seed) for seed in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    health_connection = Connection(host, port)
+    _, health = await health_connection.request("GET", "/health")
+    health_connection.close()
+
+    ok = statuses.get(200, 0)
+    return {
+        "requests": len(latencies),
+        "seconds": elapsed,
+        "throughput_rps": len(latencies) / elapsed if elapsed else None,
+        "ok_rps": ok / elapsed if elapsed else None,
+        "latency_ms": percentiles(latencies) if latencies else None,
+        "statuses": {str(status): count for status, count in sorted(statuses.items(), key=str)},
+        "server": json.loads(health),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_local_server(n_programs: int, seed: int, tmp: str, extra: List[str]) -> Tuple[subprocess.Popen, int]:
+    """합성 카탈로그로 `main.py serve`를 띄우고 응답할 때까지 대기"""
+    catalog = str(Path(tmp) / "programs.jsonl")
+    write_jsonl(make_programs(n_programs, seed), catalog)
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, str(ROOT / "main.py"), "--log-level", "WARNING", "serve",
+         "--programs", catalog, "--port", str(port), *extra],
+        cwd=ROOT
+    )
+    for _ in range(600):
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return process, port
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("서버가 시작하지 못했습니다.")
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("서버가 60초 안에 응답하지 않았습니다.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="매칭 API 서버 부하 테스트")
+    parser.add_argument("--url", default="http://127.0.0.1:8080", help="서버 주소 (--programs를 주면 무시)")
+    parser.add_argument("--programs", type=int, help="이 크기의 합성 카탈로그로 로컬 서버를 띄워 측정")
+    parser.add_argument("--server-args", default="", help="로컬 서버에 넘길 추가 인자 (예: \"--max-batch 64\")")
+    parser.add_argument("--concurrency", type=int, default=32, help="동시 연결 수")
+    parser.add_argument("--requests", type=int, default=2000, help="보낼 요청 수 (--duration을 주면 무시)")
+    parser.add_argument("--duration", type=float, help="측정 시간 (초)")
+    parser.add_argument("--mentors", type=int, default=50, help="요청에 쓸 합성 멘토 수")
+    parser.add_argument("--mentees", type=int, default=100, help="요청에 쓸 합성 멘티 수")
+    parser.add_argument("--top-k", type=int, default=5, help="요청마다 추천할 프로그램 수")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 시드")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    mentors = list(make_mentors(args.mentors, args.seed))
+    mentees = list(make_mentees(args.mentees, args.seed))
+    bodies = [
+        json.dumps(
+            {"mentor": rng.choice(mentors), "mentee": rng.choice(mentees), "top_k": args.top_k},
+            ensure_ascii=False
+        ).encode("utf-8")
+        for _ in range(1000)
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        process = None
+        if args.programs:
+            process, port = start_local_server(args.programs, args.seed, tmp, args.server_args.split())
+            host = "127.0.0.1"
+        else:
+            url = urlsplit(args.url)
+            host, port = url.hostname, url.port or 80
+        try:
+            result = asyncio.run(run_load(
+                host, port, bodies, args.concurrency,
+                None if args.duration else args.requests, args.duration
+            ))
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait()
+
+    latency = result["latency_ms"] or {}
+    print(f"🚀 요청 {result['requests']:,}건 / {result['seconds']:.2f}초 (동시 연결 {args.concurrency})")
+    print(f"   처리량      {result['throughput_rps']:10.1f} req/s (성공 {result['ok_rps']:.1f} req/s)")
+    for name in ("p50", "p90", "p99", "max"):
+        if name in latency:
+            print(f"   지연 {name:<6} {latency[name]:10.2f} ms")
+    print(f"   상태 코드   {result['statuses']}")
+
+    if args.output:
+        report = {
+            "environment": environment(),
+            "config": {key: value for key, value in vars(args).items() if key != "output"},
+            "result": result,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
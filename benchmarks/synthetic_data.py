@@ -0,0 +1,196 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+합성 멘토 / 멘티 / 프로그램 데이터 생성기
+
+`data/` 샘플 파일과 같은 지역 / 관심사 / 직군 어휘로 원하는 크기(프로그램 100만 개까지)의
+데이터를 만듭니다. 같은 시드면 항상 같은 데이터가 나오므로 커밋 간 벤치마크 비교에 씁니다.
+
+    python benchmarks/synthetic_data.py --programs 1000000 --mentors 200 --mentees 500 --out /tmp/synthetic
+"""
+
+import argparse
+import json
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.schedule import DAY_NAMES
+
+
+# 지역: (문자열, 가중치) - 서울 상권 위주, 일부 수도권/광역시, 지역 제약 없는 프로그램
+LOCATIONS = (
+    ("서울 강남", 8), ("서울 홍대", 6), ("서울 성수", 5), ("서울 이태원", 3), ("서울 삼청동", 3),
+    ("서울 여의도", 4), ("서울 잠실", 4), ("서울 종로", 3), ("서울 마포", 3), ("서울 한강", 3),
+    ("서울 북한산", 2), ("서울 전역", 6), ("경기 판교", 4), ("경기 분당", 2), ("경기 수원", 2),
+    ("경기 일산", 1), ("인천 송도", 2), ("부산 해운대", 2), ("부산 서면", 2), ("대구", 1),
+    ("대전 유성구", 1), ("광주", 1), ("제주", 1), ("전국", 2), ("온라인", 3),
+)
+
+# 멘토/멘티 거주 지역
+HOME_LOCATIONS = (
+    ("서울", 10), ("서울 강남", 4), ("서울 마포", 3), ("서울 송파", 2), ("경기", 4),
+    ("경기 성남", 2), ("인천", 2), ("부산", 2), ("대전", 1), ("대구", 1), ("광주", 1),
+)
+
+# 활동 유형 -> 어울리는 태그
+ACTIVITIES = {
+    "카페 미팅": ("실내", "캐주얼", "대화 중심", "조용한", "독서", "커피"),
+    "야외 산책": ("실외", "운동", "힐링", "자연", "산책"),
+    "식사": ("실내", "식사", "네트워킹", "캐주얼", "맛집"),
+    "스터디": ("실내", "실무 중심", "기술", "집중", "피드백", "독서"),
+    "등산": ("실외", "운동", "힐링", "적극적", "자연"),
+    "문화생활": ("실내", "문화", "창의성", "예술", "전시회", "영화"),
+    "브런치": ("실내", "식사", "캐주얼", "여유로운", "카페"),
+    "체험": ("실내", "체험", "창의성", "힐링", "공예"),
+    "운동": ("실내", "운동", "캐주얼", "활동적", "요가"),
+    "게임": ("실내", "게임", "소통", "재미", "보드게임"),
+    "사진 출사": ("실외", "사진", "예술", "산책"),
+    "온라인 세션": ("온라인", "대화 중심", "실무 중심", "피드백"),
+}
+
+INTERESTS = (
+    "카페", "독서", "영화감상", "영화", "게임", "등산", "전시회", "요가", "미술관", "사진",
+    "운동", "맛집", "보드게임", "산책", "공예", "커피", "자연", "음악", "러닝", "캠핑",
+)
+
+ROLES = ("개발자", "마케터", "기획자", "디자이너", "영업", "PM", "데이터 분석가", "인사")
+
+EXPERTISE = {
+    "개발자": ("Python", "웹 개발", "코드 리뷰", "아키텍처", "클라우드"),
+    "마케터": ("디지털 마케팅", "브랜딩", "콘텐츠 전략", "퍼포먼스 마케팅"),
+    "기획자": ("서비스 기획", "요구사항 정의", "데이터 분석"),
+    "디자이너": ("UI/UX", "브랜딩", "프로토타이핑"),
+    "영업": ("B2B 영업", "협상", "고객 관리"),
+    "PM": ("프로젝트 관리", "애자일", "로드맵"),
+    "데이터 분석가": ("SQL", "통계", "대시보드"),
+    "인사": ("채용", "조직 문화", "교육"),
+}
+
+LEARNING_GOALS = (
+    "커리어 방향성", "클린 코드 작성", "코드 리뷰 방법", "마케팅 전략", "데이터 분석",
+    "커뮤니케이션", "포트폴리오 구성", "업무 우선순위", "발표 스킬", "협업 방법",
+)
+
+# 프로그램 진행 요일: (요일 목록, 가중치) - 빈 목록은 요일 제한 없음
+PROGRAM_DAYS = (
+    ([], 12), (["월", "화", "수", "목", "금"], 4), (["토", "일"], 3), (["평일"], 1), (["주말"], 1),
+)
+
+
+def _weighted(rng: random.Random, choices) -> Any:
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+
+def _cost(rng: random.Random) -> int:
+    """1,000원 단위 비용 (대부분 1~4만원, 가끔 무료 또는 고가)"""
+    return int(min(150_000, rng.lognormvariate(9.8, 0.6)) // 1000 * 1000) if rng.random() > 0.05 else 0
+
+
+def _days(rng: random.Random, low: int, high: int):
+    return sorted(rng.sample(DAY_NAMES, rng.randint(low, high)), key=DAY_NAMES.index)
+
+
+def make_programs(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """합성 프로그램 레코드 `count`개 (dict, `MentoringProgram` 필드와 동일)"""
+    rng = random.Random(seed)
+    activities = list(ACTIVITIES)
+    for i in range(count):
+        activity = rng.choice(activities)
+        location = _weighted(rng, LOCATIONS)
+        days = _weighted(rng, PROGRAM_DAYS)
+        if not days and rng.random() < 0.15:
+            days = _days(rng, 1, 4)
+        yield {
+            "program_id": f"SYN{i:07d}",
+            "title": f"{location}에서 함께하는 {activity} #{i}",
+            "description": f"{location}에서 {activity}을(를) 하며 편하게 대화하는 멘토링",
+            "location": location,
+            "activity_type": activity,
+            "estimated_cost": _cost(rng),
+            "duration_minutes": rng.choice((30, 60, 90, 120, 180)),
+            "recommended_for": (
+                ["모든 직군"] if rng.random() < 0.3 else rng.sample(ROLES, rng.randint(1, 4))
+            ),
+            "tags": rng.sample(ACTIVITIES[activity], min(len(ACTIVITIES[activity]), rng.randint(2, 4))),
+            "available_days": list(days),
+        }
+
+
+def make_mentors(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """합성 멘토 레코드 `count`개 (dict, `Mentor` 필드와 동일)"""
+    rng = random.Random(seed + 1)
+    for i in range(count):
+        role = rng.choice(ROLES)
+        yield {
+            "name": f"멘토{i:05d}",
+            "age": rng.randint(28, 55),
+            "location": _weighted(rng, HOME_LOCATIONS),
+            "job_title": rng.choice(("시니어 ", "리드 ", "")) + role,
+            "experience_years": rng.randint(4, 25),
+            "expertise": rng.sample(EXPERTISE[role], 2),
+            "interests": rng.sample(INTERESTS, 3),
+            "available_days": _days(rng, 2, 4),
+            "preferred_budget": rng.randrange(10_000, 60_001, 5_000),
+            "introduction": "함께 성장하는 멘토링을 하고 싶습니다.",
+        }
+
+
+def make_mentees(count: int, seed: int = 0) -> Iterator[Dict[str, Any]]:
+    """합성 멘티 레코드 `count`개 (dict, `Mentee` 필드와 동일)"""
+    rng = random.Random(seed + 2)
+    for i in range(count):
+        role = rng.choice(ROLES)
+        yield {
+            "name": f"멘티{i:05d}",
+            "age": rng.randint(22, 32),
+            "location": _weighted(rng, HOME_LOCATIONS),
+            "job_title": rng.choice(("주니어 ", "신입 ", "인턴 ")) + role,
+            "experience_years": rng.randint(0, 3),
+            "learning_goals": rng.sample(LEARNING_GOALS, 3),
+            "interests": rng.sample(INTERESTS, 3),
+            "available_days": _days(rng, 2, 4),
+            "budget_limit": rng.randrange(10_000, 80_001, 5_000),
+            "preferred_mentor_style": rng.choice(("친근하고 실용적인", "체계적이고 꼼꼼한", "열정적이고 창의적인")),
+            "introduction": "많이 배우고 싶습니다!",
+        }
+
+
+def write_jsonl(records: Iterable[Dict[str, Any]], file_path: str) -> int:
+    """레코드를 JSON Lines 파일로 저장하고 개수 반환"""
+    count = 0
+    with open(file_path, "w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write("\n")
+            count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="합성 멘토 / 멘티 / 프로그램 데이터 생성")
+    parser.add_argument("--programs", type=int, default=100_000, help="프로그램 수")
+    parser.add_argument("--mentors", type=int, default=100, help="멘토 수")
+    parser.add_argument("--mentees", type=int, default=100, help="멘티 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--out", default="synthetic_data", help="출력 디렉터리")
+    args = parser.parse_args()
+
+    out = Path(args.out)
+    out.mkdir(parents=True, exist_ok=True)
+    for name, records in (
+        ("programs", make_programs(args.programs, args.seed)),
+        ("mentors", make_mentors(args.mentors, args.seed)),
+        ("mentees", make_mentees(args.mentees, args.seed)),
+    ):
+        count = write_jsonl(records, str(out / f"{name}.jsonl"))
+        print(f"✅ {out / f'{name}.jsonl'}: {count:,}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,32 +13,36 @@ if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-import json
+import argparse
+import logging
+import os
+import time
 from pathlib import Path
+from typing import Iterator, Optional
 from models import Mentor, Mentee, MentoringProgram
 from services import MatchingService
+from services.bulk_export import write_bulk_results, write_cohort_assignment
+from services.data_loader import iter_models
+from services.metrics import HistogramSink, Metrics
 
 
-def load_mentors_from_file(file_path: str) -> list[Mentor]:
-    """JSON 파일에서 멘토 목록 로드"""
-    path = Path(file_path)
-    if not path.exists():
+def iter_mentors_from_file(file_path: str, trusted: bool = False) -> Iterator[Mentor]:
+    """JSON 배열 / JSON Lines 파일에서 멘토를 하나씩 로드 (스트리밍)"""
+    if not Path(file_path).exists():
         raise FileNotFoundError(f"멘토 파일을 찾을 수 없습니다: {file_path}")
-    
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        return [Mentor(**mentor) for mentor in data]
+    return iter_models(file_path, Mentor, trusted=trusted)
 
 
-def load_mentees_from_file(file_path: str) -> list[Mentee]:
+def load_mentors_from_file(file_path: str, trusted: bool = False) -> list[Mentor]:
+    """JSON 파일에서 멘토 목록 로드"""
+    return list(iter_mentors_from_file(file_path, trusted))
+
+
+def load_mentees_from_file(file_path: str, trusted: bool = False) -> list[Mentee]:
     """JSON 파일에서 멘티 목록 로드"""
-    path = Path(file_path)
-    if not path.exists():
+    if not Path(file_path).exists():
         raise FileNotFoundError(f"멘티 파일을 찾을 수 없습니다: {file_path}")
-    
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-        return [Mentee(**mentee) for mentee in data]
+    return list(iter_models(file_path, Mentee, trusted=trusted))
 
 
 def print_separator():
@@ -244,6 +248,200 @@ def interactive_mode(use_ai: bool = False):
         traceback.print_exc()
 
 
+def bulk_mode(args: argparse.Namespace):
+    """대량 매칭 모드 - 모든 멘토 × 멘티 쌍의 추천 결과를 파일로 저장 (비대화형)"""
+    # 멘토는 파일에서 읽는 대로 바로 매칭 (전체 목록을 메모리에 올리지 않음)
+    mentors = iter_mentors_from_file(args.mentors, args.trusted)
+    mentees = load_mentees_from_file(args.mentees, args.trusted)
+    
+    metrics = Metrics()
+    timings = metrics.add_sink(HistogramSink()) if args.timings else None
+    matching_service = MatchingService(
+        use_ai=args.ai, workers=args.workers, local_only=args.local_only, metrics=metrics,
+        ai_batch_size=args.ai_batch
+    )
+    matching_service.load_programs_from_file(args.programs, trusted=args.trusted)
+    
+    print(f"📦 멘티 {len(mentees)}명 × 멘토 스트림({args.mentors}) 매칭 시작")
+    
+    start = time.perf_counter()
+    matches = matching_service.find_matches_bulk(mentors, mentees, top_k=args.top_k)
+    try:
+        rows = write_bulk_results(matches, args.output, fmt=args.format)
+    finally:
+        matching_service.close()
+    elapsed = time.perf_counter() - start
+    
+    print(f"✅ {rows}개의 추천 결과를 {args.output}에 저장했습니다. ({elapsed:.2f}초)")
+    
+    if timings is not None:
+        print_timings(timings, elapsed)
+
+
+def print_timings(timings: HistogramSink, elapsed: Optional[float] = None):
+    """단계별 소요 시간 / 카운터 요약 출력 (AI 모드면 분당 처리 쌍 수 / 쌍당 토큰 수도)"""
+    summary = timings.summary()
+    print("\n⏱️  단계별 소요 시간")
+    for stage, stats in summary["stages"].items():
+        print(f"   {stage:<14} {stats['count']:>8,}회  평균 {stats['mean_ms']:8.3f} ms  "
+              f"p50 {stats['p50_ms']:8.3f} ms  p99 {stats['p99_ms']:8.3f} ms")
+    for name, value in summary["counters"].items():
+        print(f"   {name:<24} {value:>12,.0f}")
+    
+    pairs = summary["counters"].get("llm.pairs")
+    if pairs:
+        if elapsed:
+            print(f"   {'AI 처리량':<20} {pairs / elapsed * 60:>12,.1f} 쌍/분")
+        tokens = summary["counters"].get("llm.total_tokens")
+        if tokens:
+            print(f"   {'쌍당 토큰':<20} {tokens / pairs:>12,.1f}")
+
+
+def assign_mode(args: argparse.Namespace):
+    """코호트 배정 모드 - 멘토 수용 인원을 지키며 멘토 ↔ 멘티를 최적으로 짝지음 (비대화형)"""
+    from services.cohort_assignment import assign_cohort
+    
+    mentors = load_mentors_from_file(args.mentors)
+    mentees = load_mentees_from_file(args.mentees)
+    
+    print(f"🧩 멘토 {len(mentors)}명(수용 {args.capacity}명씩) ↔ 멘티 {len(mentees)}명 배정 시작")
+    
+    start = time.perf_counter()
+    assignment = assign_cohort(
+        mentors,
+        mentees,
+        capacity=args.capacity,
+        candidates_per_mentee=args.candidates
+    )
+    elapsed = time.perf_counter() - start
+    
+    print(f"✅ {len(assignment.pairs)}쌍 배정, 미배정 멘티 {len(assignment.unassigned_mentees)}명 "
+          f"(총점 {assignment.total_score:,.1f}, {elapsed:.2f}초)")
+    
+    if args.output:
+        rows = write_cohort_assignment(assignment, mentors, mentees, args.output, fmt=args.format)
+        print(f"💾 {rows}개의 배정 결과를 {args.output}에 저장했습니다.")
+    else:
+        for mentor_idx, mentee_idx, score in assignment.pairs:
+            print(f"   {mentors[mentor_idx].name} ↔ {mentees[mentee_idx].name} ({score:.1f}점)")
+
+
+def serve_mode(args: argparse.Namespace):
+    """API 서버 모드 - 워밍된 MatchingService 하나를 HTTP로 제공 (Ctrl+C로 종료)"""
+    import asyncio
+    from services.catalog_watcher import CatalogWatcher
+    from services.http_server import MatchingServer, serve
+    from services.snapshot import is_snapshot
+    
+    matching_service = MatchingService(
+        use_ai=args.ai, workers=args.workers, local_only=args.local_only,
+        ai_latency_budget=args.ai_budget_ms / 1000 if args.ai_budget_ms else None
+    )
+    matching_service.load_programs_from_file(args.programs, trusted=args.trusted)
+    if is_snapshot(args.programs):
+        # 스냅샷은 변경분을 계산하지 않으므로 /programs/reload 비활성화
+        print("📌 스냅샷 파일은 감시하지 않습니다 (/programs/reload 비활성화)")
+        watcher = None
+    else:
+        watcher = CatalogWatcher(matching_service, args.programs)
+    server = MatchingServer(
+        matching_service,
+        watcher=watcher,
+        max_connections=args.max_connections,
+        max_pending=args.max_pending,
+        max_batch=args.max_batch,
+        batch_wait=args.batch_wait_ms / 1000
+    )
+    
+    try:
+        asyncio.run(serve(server, args.host, args.port))
+    except KeyboardInterrupt:
+        print("\n서버를 종료합니다. 👋")
+    finally:
+        matching_service.close()
+
+
+SNAPSHOT_KINDS = {"programs": MentoringProgram, "mentors": Mentor, "mentees": Mentee}
+
+
+def snapshot_mode(args: argparse.Namespace):
+    """스냅샷 모드 - JSON / JSON Lines 파일을 검증해 바이너리 컬럼 스냅샷으로 저장"""
+    from services.snapshot import SNAPSHOT_SUFFIX, write_snapshot
+    
+    if not Path(args.input).exists():
+        raise FileNotFoundError(f"입력 파일을 찾을 수 없습니다: {args.input}")
+    output = args.output or str(Path(args.input).with_suffix(SNAPSHOT_SUFFIX))
+    model = SNAPSHOT_KINDS[args.kind]
+    
+    start = time.perf_counter()
+    count = write_snapshot(iter_models(args.input, model), model, output)
+    elapsed = time.perf_counter() - start
+    
+    size_kb = Path(output).stat().st_size / 1024
+    print(f"✅ {count}개의 {args.kind} 레코드를 {output}에 저장했습니다. ({size_kb:,.1f} KB, {elapsed:.2f}초)")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """명령행 인자 파서 생성"""
+    parser = argparse.ArgumentParser(description="신입사원 멘토링 매칭 Agent")
+    parser.add_argument(
+        "--log-level",
+        default=os.getenv("MENTORING_LOG_LEVEL", "INFO"),
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        help="서비스 진행 메시지 레벨 (기본: INFO, WARNING이면 경고/오류만 출력)"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    bulk = subparsers.add_parser("bulk", help="모든 멘토 × 멘티 쌍의 추천 결과를 파일로 저장")
+    bulk.add_argument("--mentors", default="data/sample_mentors.json", help="멘토 JSON 파일")
+    bulk.add_argument("--mentees", default="data/sample_mentees.json", help="멘티 JSON 파일")
+    bulk.add_argument("--programs", default="data/sample_programs.json", help="프로그램 JSON 파일")
+    bulk.add_argument("--top-k", type=int, default=5, help="쌍마다 추천할 프로그램 개수")
+    bulk.add_argument("--output", "-o", default="bulk_matches.jsonl", help="출력 파일 (.jsonl 또는 .csv)")
+    bulk.add_argument("--format", choices=["jsonl", "csv"], help="출력 형식 (기본: 확장자로 판단)")
+    bulk.add_argument("--ai", action="store_true", help="Azure OpenAI 사용")
+    bulk.add_argument("--ai-batch", type=int, default=1,
+                      help="AI 모드에서 프롬프트 하나에 묶을 쌍 수 (카탈로그를 공통 접두부로 한 번만 보냄)")
+    bulk.add_argument("--workers", type=int, default=0, help="규칙 기반 채점 프로세스 수 (2 이상이면 병렬)")
+    bulk.add_argument("--trusted", action="store_true", help="입력 파일을 검증 없이 로드 (이미 검증된 파일만)")
+    bulk.add_argument("--local-only", action="store_true", help="멘토/멘티 생활권 또는 전국 프로그램만 추천")
+    bulk.add_argument("--timings", action="store_true", help="끝난 뒤 단계별 소요 시간 / 카운터 요약 출력")
+    bulk.set_defaults(handler=bulk_mode)
+    
+    assign = subparsers.add_parser("assign", help="멘토 ↔ 멘티 최적 배정 (멘토별 수용 인원 포함)")
+    assign.add_argument("--mentors", default="data/sample_mentors.json", help="멘토 JSON 파일")
+    assign.add_argument("--mentees", default="data/sample_mentees.json", help="멘티 JSON 파일")
+    assign.add_argument("--capacity", type=int, default=1, help="멘토별 최대 멘티 수")
+    assign.add_argument("--candidates", type=int, default=20, help="멘티마다 고려할 후보 멘토 수")
+    assign.add_argument("--output", "-o", help="출력 파일 (.jsonl 또는 .csv, 생략하면 화면 출력)")
+    assign.add_argument("--format", choices=["jsonl", "csv"], help="출력 형식 (기본: 확장자로 판단)")
+    assign.set_defaults(handler=assign_mode)
+    
+    snapshot = subparsers.add_parser("snapshot", help="JSON 파일을 빠르게 열 수 있는 바이너리 스냅샷으로 변환")
+    snapshot.add_argument("input", help="입력 JSON / JSON Lines 파일")
+    snapshot.add_argument("--kind", choices=list(SNAPSHOT_KINDS), default="programs", help="레코드 종류")
+    snapshot.add_argument("--output", "-o", help="출력 파일 (기본: 입력 파일 이름 + .snap)")
+    snapshot.set_defaults(handler=snapshot_mode)
+    
+    serve_parser = subparsers.add_parser("serve", help="매칭 HTTP API 서버 실행")
+    serve_parser.add_argument("--programs", default="data/sample_programs.json", help="프로그램 JSON / 스냅샷 파일")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    serve_parser.add_argument("--port", type=int, default=8080, help="포트")
+    serve_parser.add_argument("--ai", action="store_true", help="Azure OpenAI 사용")
+    serve_parser.add_argument("--ai-budget-ms", type=float,
+                              help="AI 응답 지연 예산 (ms, 넘으면 함께 계산해 둔 규칙 기반 추천 반환)")
+    serve_parser.add_argument("--workers", type=int, default=0, help="규칙 기반 채점 프로세스 수 (2 이상이면 병렬)")
+    serve_parser.add_argument("--trusted", action="store_true", help="프로그램 파일을 검증 없이 로드 (이미 검증된 파일만)")
+    serve_parser.add_argument("--local-only", action="store_true", help="멘토/멘티 생활권 또는 전국 프로그램만 추천")
+    serve_parser.add_argument("--max-connections", type=int, default=512, help="동시 연결 수 한도")
+    serve_parser.add_argument("--max-pending", type=int, default=256, help="대기 + 처리 중 요청 수 한도 (넘으면 503)")
+    serve_parser.add_argument("--max-batch", type=int, default=32, help="마이크로 배치 최대 요청 수")
+    serve_parser.add_argument("--batch-wait-ms", type=float, default=2.0, help="배치를 채우려고 기다리는 시간 (ms)")
+    serve_parser.set_defaults(handler=serve_mode)
+    
+    return parser
+
+
 def main():
     """메인 함수"""
     print("="*80)
@@ -303,5 +501,10 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    args = build_parser().parse_args()
+    logging.basicConfig(level=args.log_level, format="%(message)s", stream=sys.stdout)
+    if args.command:
+        args.handler(args)
+    else:
+        main()
 
@@ -4,7 +4,7 @@
 
 from .mentor import Mentor
 from .mentee import Mentee
-from .program import MentoringProgram
+from .program import MatchReason, MentoringProgram
 
-__all__ = ["Mentor", "Mentee", "MentoringProgram"]
+__all__ = ["Mentor", "Mentee", "MentoringProgram", "MatchReason"]
 
@@ -3,7 +3,7 @@
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class MentoringProgram(BaseModel):
@@ -27,6 +27,10 @@ class MentoringProgram(BaseModel):
         default=[],
         description="태그 (예: 실내, 실외, 캐주얼, 포멀)"
     )
+    available_days: List[str] = Field(
+        default=[],
+        description="진행 요일 (예: 토, 일 / 평일, 주말), 비어 있으면 요일 제한 없음"
+    )
     
     class Config:
         json_schema_extra = {
@@ -39,17 +43,30 @@ class MentoringProgram(BaseModel):
                 "estimated_cost": 15000,
                 "duration_minutes": 90,
                 "recommended_for": ["개발자", "마케터", "기획자"],
-                "tags": ["실내", "캐주얼", "대화 중심"]
+                "tags": ["실내", "캐주얼", "대화 중심"],
+                "available_days": ["월", "화", "수", "목", "금"]
             }
         }
 
 
+class MatchReason(BaseModel):
+    """규칙 기반 점수 항목 하나의 추천 이유 (구조화 데이터)"""
+    
+    code: str = Field(..., description="이유 코드 (예: location.match, budget.cheap)")
+    points: float = Field(..., description="이 항목에서 받은 점수")
+    params: Dict[str, Any] = Field(default={}, description="문장에 들어가는 값 (예: 지역, 비용, 관심사)")
+
+
 class RecommendedProgram(BaseModel):
     """추천된 프로그램 (추천 이유 포함)"""
     
     program: MentoringProgram
     match_score: float = Field(..., ge=0, le=100, description="매칭 점수 (0-100)")
     reason: str = Field(..., description="추천 이유")
+    reasons: List[MatchReason] = Field(
+        default=[],
+        description="항목별 추천 이유 (규칙 기반 추천만, AI 추천은 빈 목록)"
+    )
     
     class Config:
         json_schema_extra = {
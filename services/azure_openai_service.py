@@ -4,22 +4,71 @@ Azure OpenAI 연동 서비스
 
 import os
 import json
-from typing import List, Dict, Any
-from openai import AzureOpenAI
+import asyncio
+import logging
+import random
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Set, Tuple, Union
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+    AsyncAzureOpenAI,
+    AzureOpenAI,
+)
 from dotenv import load_dotenv
 
+from services.circuit_breaker import CLOSED, CircuitBreaker, CircuitOpenError
+from services.metrics import Metrics
+from services.response_cache import ResponseCache, make_cache_key
+from services.single_flight import SingleFlight
+from services.stream_parser import RecommendationStreamParser
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# 프롬프트/응답 형식이 바뀌면 올려서 기존 캐시를 무효화
+CACHE_SCHEMA_VERSION = 2
+
+# 프롬프트에 넣는 프로그램 필드 (짧은 키 -> 원래 필드)
+PROGRAM_PROMPT_FIELDS = {
+    "id": "program_id",
+    "t": "title",
+    "loc": "location",
+    "type": "activity_type",
+    "cost": "estimated_cost",
+    "min": "duration_minutes",
+    "for": "recommended_for",
+    "tags": "tags",
+}
+
+PROGRAM_FIELD_LEGEND = (
+    "id=프로그램 ID, t=제목, loc=지역, type=활동 유형, cost=예상 비용(원), "
+    "min=소요 시간(분), for=추천 대상, tags=태그"
+)
+
 
 class AzureOpenAIService:
     """Azure OpenAI를 사용한 LLM 서비스"""
     
-    def __init__(self):
+    def __init__(self, cache: Optional[ResponseCache] = None, metrics: Optional[Metrics] = None):
+        """
+        Args:
+            cache: 추천 응답 캐시 (None이면 환경 변수 설정으로 생성)
+            metrics: 프롬프트 생성 / API 호출 / 파싱 시간과 토큰 사용량을 받을 계측 객체
+        """
         load_dotenv()
         
         # Azure OpenAI 설정
         self.api_key = os.getenv("AZURE_OPENAI_API_KEY")
         self.endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
         self.deployment_name = os.getenv("AZURE_OPENAI_DEPLOYMENT_NAME", "gpt-4o-mini")
-        self.api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
+        self.api_version = os.getenv("AZURE_OPENAI_API_VERSION", "2024-10-21")
         
         if not self.api_key or not self.endpoint:
             raise ValueError(
@@ -27,19 +76,62 @@ class AzureOpenAIService:
                 ".env 파일에 AZURE_OPENAI_API_KEY와 AZURE_OPENAI_ENDPOINT를 추가해주세요."
             )
         
+        # 동시성 / 타임아웃 / 재시도 설정
+        self.max_concurrency = int(os.getenv("AZURE_OPENAI_MAX_CONCURRENCY", "8"))
+        self.request_timeout = float(os.getenv("AZURE_OPENAI_TIMEOUT", "30"))
+        self.max_retries = int(os.getenv("AZURE_OPENAI_MAX_RETRIES", "3"))
+        self.retry_base_delay = 0.5
+        self.retry_max_delay = 8.0
+        
         # Azure OpenAI 클라이언트 초기화
         self.client = AzureOpenAI(
             api_key=self.api_key,
             api_version=self.api_version,
-            azure_endpoint=self.endpoint
+            azure_endpoint=self.endpoint,
+            timeout=self.request_timeout
         )
+        
+        # 마지막으로 만든 프롬프트의 토큰 추정치 (후보 수 M 조정용)
+        self.last_prompt_tokens: Optional[int] = None
+        
+        # 비동기 클라이언트와 세마포어는 이벤트 루프마다 만들어 사용
+        # (루프가 바뀌면 이전 클라이언트는 닫고, 닫는 중인 작업은 끝날 때까지 참조를 유지)
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_client: Optional[AsyncAzureOpenAI] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._closing: Set[asyncio.Task] = set()
+        
+        self.metrics = metrics if metrics is not None else Metrics()
+        
+        # 응답 캐시 (메모리 LRU + SQLite, 빈 경로면 디스크 계층 비활성화)
+        self.cache = cache if cache is not None else ResponseCache(
+            max_entries=int(os.getenv("AZURE_OPENAI_CACHE_SIZE", "256")),
+            ttl_seconds=float(os.getenv("AZURE_OPENAI_CACHE_TTL", "3600")),
+            db_path=os.getenv("AZURE_OPENAI_CACHE_PATH", ".cache/ai_recommendations.sqlite") or None
+        )
+        
+        # 회로 차단기: 최근 호출의 오류/느린 호출 비율이 높으면 한동안 호출하지 않고 바로 실패
+        self.breaker = CircuitBreaker(
+            failure_rate=float(os.getenv("AZURE_OPENAI_BREAKER_FAILURE_RATE", "0.5")),
+            slow_call_seconds=float(os.getenv("AZURE_OPENAI_BREAKER_SLOW_SECONDS", "10")),
+            window=int(os.getenv("AZURE_OPENAI_BREAKER_WINDOW", "20")),
+            min_calls=int(os.getenv("AZURE_OPENAI_BREAKER_MIN_CALLS", "5")),
+            open_seconds=float(os.getenv("AZURE_OPENAI_BREAKER_OPEN_SECONDS", "30")),
+            half_open_probes=int(os.getenv("AZURE_OPENAI_BREAKER_PROBES", "2")),
+            is_failure=lambda error: _is_retryable(error) or _is_fatal(error),
+            on_state_change=self._on_breaker_change
+        )
+        
+        # 캐시에 아직 없는 같은 요청이 동시에 들어오면 API 호출 하나로 합침
+        self.flights = SingleFlight(on_coalesced=lambda: self.metrics.count("llm.coalesced"))
     
     def generate_recommendations(
         self,
         mentor_profile: Dict[str, Any],
         mentee_profile: Dict[str, Any],
         available_programs: List[Dict[str, Any]],
-        top_k: int = 5
+        top_k: int = 5,
+        program_versions: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         멘토와 멘티 프로필을 기반으로 적합한 프로그램을 추천합니다.
@@ -49,51 +141,491 @@ class AzureOpenAIService:
             mentee_profile: 멘티 프로필 정보
             available_programs: 사용 가능한 프로그램 목록
             top_k: 추천할 프로그램 개수
+            program_versions: 프로그램별 내용 해시 (미리 계산해 둔 경우, None이면 여기서 계산)
         
         Returns:
             추천된 프로그램 목록 (점수 및 이유 포함)
         """
         
-        # 프롬프트 생성
-        prompt = self._create_recommendation_prompt(
-            mentor_profile,
-            mentee_profile,
-            available_programs,
-            top_k
+        # 같은 요청이 캐시에 있으면 API 호출 없이 반환
+        cache_key = self._cache_key(
+            mentor_profile, mentee_profile, available_programs, top_k, program_versions
         )
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        # 같은 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 함께 받음
+        return self.flights.do(
+            cache_key,
+            lambda: self._generate(cache_key, mentor_profile, mentee_profile, available_programs, top_k)
+        )
+    
+    def _generate(
+        self,
+        cache_key: str,
+        mentor_profile: Dict[str, Any],
+        mentee_profile: Dict[str, Any],
+        available_programs: List[Dict[str, Any]],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """프롬프트 생성 + API 호출 + 파싱 + 캐시 저장"""
+        
+        # 프롬프트 생성
+        prompt = self._build_prompt(mentor_profile, mentee_profile, available_programs, top_k)
         
         try:
             # Azure OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=self.deployment_name,  # 배포 이름 사용
-                messages=[
-                    {
-                        "role": "system",
-                        "content": (
-                            "당신은 멘토링 매칭 전문가입니다. "
-                            "멘토와 멘티의 프로필을 깊이 분석하여 "
-                            "가장 적합한 멘토링 프로그램을 추천해주세요. "
-                            "지역, 예산, 관심사, 활동 취향, 직무 적합성을 모두 고려해야 합니다. "
-                            "추천 이유는 구체적이고 설득력 있게 작성해주세요."
-                        )
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                response_format={"type": "json_object"}
-            )
+            with self.breaker.call(), self.metrics.stage("llm.call"):
+                response = self.client.chat.completions.create(
+                    model=self.deployment_name,  # 배포 이름 사용
+                    messages=self._build_messages(prompt),
+                    temperature=0.7,
+                    response_format={"type": "json_object"}
+                )
             
             # 응답 파싱
-            result = json.loads(response.choices[0].message.content)
-            return result.get("recommendations", [])
+            recommendations = self._parse_response(response)
+            self.cache.set(cache_key, recommendations)
+            return recommendations
+            
+        except Exception as e:
+            self._log_error(e)
+            raise
+    
+    def stream_recommendations(
+        self,
+        mentor_profile: Dict[str, Any],
+        mentee_profile: Dict[str, Any],
+        available_programs: List[Dict[str, Any]],
+        top_k: int = 5,
+        program_versions: Optional[List[str]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        `generate_recommendations`의 스트리밍 버전
+        
+        응답을 스트리밍으로 받으면서 추천 객체(program_id, match_score, reason)가
+        하나 완성될 때마다 바로 반환합니다. 캐시에 있으면 캐시 결과를 그대로 반환합니다.
+        """
+        
+        cache_key = self._cache_key(
+            mentor_profile, mentee_profile, available_programs, top_k, program_versions
+        )
+        cached = self._cached(cache_key)
+        if cached is not None:
+            yield from cached
+            return
+        
+        prompt = self._build_prompt(mentor_profile, mentee_profile, available_programs, top_k)
+        
+        try:
+            # 스트리밍은 첫 응답(헤더)까지의 시간과 연결 오류만 회로 차단기에 기록
+            with self.breaker.call(), self.metrics.stage("llm.call"):
+                stream = self.client.chat.completions.create(
+                    model=self.deployment_name,
+                    messages=self._build_messages(prompt),
+                    temperature=0.7,
+                    response_format={"type": "json_object"},
+                    stream=True,
+                    # 마지막 청크에 토큰 사용량을 실어 달라고 요청 (API 버전 2024-07-01-preview 이상)
+                    stream_options={"include_usage": True}
+                )
+            
+            parser = RecommendationStreamParser()
+            recommendations = []
+            for chunk in stream:
+                # 사용량은 choices가 빈 마지막 청크에만 실림
+                self.metrics.record_usage(getattr(chunk, "usage", None))
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if not content:
+                    continue
+                for rec in parser.feed(content):
+                    recommendations.append(rec)
+                    yield rec
+            
+            self.metrics.count("llm.pairs")
+            self.cache.set(cache_key, recommendations)
+            
+        except Exception as e:
+            self._log_error(e)
+            raise
+    
+    async def agenerate_recommendations(
+        self,
+        mentor_profile: Dict[str, Any],
+        mentee_profile: Dict[str, Any],
+        available_programs: List[Dict[str, Any]],
+        top_k: int = 5,
+        program_versions: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        `generate_recommendations`의 비동기 버전
+        
+        동시에 진행되는 API 호출 수는 `max_concurrency`로 제한되며,
+        각 호출은 `request_timeout` 안에 끝나야 합니다. 429/5xx/타임아웃/연결 오류는
+        지터가 있는 지수 백오프로 최대 `max_retries`번 재시도합니다.
+        같은 이벤트 루프에서 진행 중인 같은 요청이 있으면 그 호출의 결과를 함께 받습니다.
+        """
+        
+        cache_key = self._cache_key(
+            mentor_profile, mentee_profile, available_programs, top_k, program_versions
+        )
+        cached = self._cached(cache_key)
+        if cached is not None:
+            return cached
+        
+        return await self.flights.ado(
+            cache_key,
+            lambda: self._agenerate(cache_key, mentor_profile, mentee_profile, available_programs, top_k)
+        )
+    
+    async def _agenerate(
+        self,
+        cache_key: str,
+        mentor_profile: Dict[str, Any],
+        mentee_profile: Dict[str, Any],
+        available_programs: List[Dict[str, Any]],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """`_generate`의 비동기 버전"""
+        
+        prompt = self._build_prompt(mentor_profile, mentee_profile, available_programs, top_k)
+        
+        try:
+            with self.breaker.call(), self.metrics.stage("llm.call"):
+                response = await self._acreate_with_retry(self._build_messages(prompt))
+            recommendations = self._parse_response(response)
+            self.cache.set(cache_key, recommendations)
+            return recommendations
             
         except Exception as e:
-            print(f"Azure OpenAI API 호출 중 오류 발생: {e}")
+            self._log_error(e)
             raise
     
+    def generate_batch_recommendations(
+        self,
+        requests: Sequence[Dict[str, Any]],
+        catalog: List[Dict[str, Any]],
+        pairs_per_prompt: int = 8
+    ) -> List[Union[List[Dict[str, Any]], Exception]]:
+        """
+        여러 멘토/멘티 쌍을 프롬프트 하나에 묶어 추천합니다 (대량 AI 매칭용).
+        
+        요구사항과 프로그램 카탈로그를 프롬프트 앞부분에 한 번만 넣고 그 뒤에 쌍을 붙이므로,
+        같은 카탈로그로 여러 번 호출하면 접두부가 매번 같아 제공자의 프롬프트 캐시가 적중합니다.
+        응답은 쌍 ID별 추천 목록으로 받으며, 응답에서 빠졌거나 응답을 해석하지 못한 쌍은 반으로
+        나눠 다시 요청하고 한 쌍만 남으면 단일 쌍 프롬프트(`generate_recommendations`)로 요청합니다.
+        호출 자체가 실패하면(429 / 타임아웃 / 인증 오류 / 열린 회로) 나누지 않고 묶음 전체를 실패 처리합니다.
+        
+        Args:
+            requests: 쌍마다 `generate_recommendations` 인자 딕셔너리
+                (mentor_profile, mentee_profile, available_programs, top_k, program_versions)
+            catalog: 접두부에 넣을 프로그램 목록 (모든 쌍의 available_programs를 포함해야 함)
+            pairs_per_prompt: 프롬프트 하나에 묶을 최대 쌍 수
+        
+        Returns:
+            요청 순서대로 추천 목록 (실패한 쌍은 추천 목록 대신 그 예외)
+        """
+        
+        results: List[Any] = [None] * len(requests)
+        pending = []
+        for i, request in enumerate(requests):
+            cache_key = self._cache_key(**request)
+            cached = self._cached(cache_key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.append((i, request, cache_key))
+        
+        if pending:
+            prefix = self._build_batch_prefix(catalog)
+            for start in range(0, len(pending), max(pairs_per_prompt, 1)):
+                self._generate_batch(pending[start:start + pairs_per_prompt], prefix, results)
+        return results
+    
+    def _generate_batch(
+        self,
+        chunk: List[Tuple[int, Dict[str, Any], str]],
+        prefix: str,
+        results: List[Any]
+    ) -> None:
+        """쌍 묶음 하나를 요청해 `results`에 채움 (응답에서 빠진 쌍만 나눠서 다시 요청)"""
+        
+        if not chunk:
+            return
+        if len(chunk) == 1:
+            i, request, cache_key = chunk[0]
+            try:
+                results[i] = self.flights.do(
+                    cache_key,
+                    lambda: self._generate(
+                        cache_key, request["mentor_profile"], request["mentee_profile"],
+                        request["available_programs"], request["top_k"]
+                    )
+                )
+            except Exception as e:
+                results[i] = e
+            return
+        
+        requests = [request for _, request, _ in chunk]
+        try:
+            prompt = self._build_batch_prompt(prefix, requests)
+            with self.breaker.call(), self.metrics.stage("llm.batch_call"):
+                response = self.client.chat.completions.create(
+                    model=self.deployment_name,
+                    messages=self._build_messages(prompt),
+                    temperature=0.7,
+                    response_format={"type": "json_object"}
+                )
+        except Exception as e:
+            # 호출 자체의 실패(429 / 타임아웃은 클라이언트 재시도와 회로 차단기가 이미 처리,
+            # 인증 오류 / 열린 회로는 다시 요청해도 같음)는 나눠서 다시 요청하지 않고 실패 처리
+            self._log_error(e)
+            for i, _, _ in chunk:
+                results[i] = e
+            return
+        
+        try:
+            answered = self._parse_batch_response(response, requests)
+        except Exception as e:
+            # 응답을 해석하지 못하면 모든 쌍이 빠진 것으로 보고 나눠서 다시 요청
+            logger.warning("⚠️  배치 응답 파싱 실패: %s", e)
+            answered = {}
+        
+        missing = []
+        for n, (i, request, cache_key) in enumerate(chunk):
+            recommendations = answered.get(_pair_id(n))
+            if recommendations is None:
+                missing.append((i, request, cache_key))
+                continue
+            results[i] = recommendations
+            self.cache.set(cache_key, recommendations)
+        
+        if missing:
+            logger.warning("⚠️  배치 응답에서 %d/%d쌍이 빠져 나눠서 다시 요청합니다.", len(missing), len(chunk))
+            self.metrics.count("llm.batch_retried_pairs", len(missing))
+            half = (len(missing) + 1) // 2
+            self._generate_batch(missing[:half], prefix, results)
+            self._generate_batch(missing[half:], prefix, results)
+    
+    def _build_batch_prefix(self, catalog: List[Dict[str, Any]]) -> str:
+        """배치 프롬프트의 고정 접두부 (요구사항 + 출력 형식 + 카탈로그) + 토큰 수 추정"""
+        with self.metrics.stage("llm.prompt"):
+            prefix = self._create_batch_prefix(catalog)
+            tokens = estimate_tokens(prefix)
+        logger.info("📏 배치 접두부 토큰(추정): %s (프로그램 %d개)", f"{tokens:,}", len(catalog))
+        return prefix
+    
+    def _build_batch_prompt(self, prefix: str, requests: List[Dict[str, Any]]) -> str:
+        """접두부 + 쌍 목록 + 토큰 수 추정"""
+        with self.metrics.stage("llm.prompt"):
+            prompt = prefix + self._create_batch_pairs_section(requests)
+            self.last_prompt_tokens = estimate_tokens(prompt)
+        logger.info(
+            "📏 배치 프롬프트 토큰(추정): %s (%d쌍)", f"{self.last_prompt_tokens:,}", len(requests)
+        )
+        return prompt
+    
+    def _parse_batch_response(
+        self,
+        response,
+        requests: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """배치 응답을 쌍 ID별 추천 목록으로 변환 (쌍의 후보가 아닌 프로그램은 제외, top_k개까지)"""
+        self.metrics.record_usage(getattr(response, "usage", None))
+        with self.metrics.stage("llm.parse"):
+            results = json.loads(response.choices[0].message.content).get("results", {})
+            # {"P1": [...]} 대신 [{"pair_id": "P1", "recommendations": [...]}]로 답하는 경우도 허용
+            if isinstance(results, list):
+                results = {
+                    item.get("pair_id"): item.get("recommendations")
+                    for item in results if isinstance(item, dict)
+                }
+            
+            answered = {}
+            for n, request in enumerate(requests):
+                recommendations = results.get(_pair_id(n)) if isinstance(results, dict) else None
+                if not isinstance(recommendations, list):
+                    continue
+                allowed = {program.get("program_id") for program in request["available_programs"]}
+                answered[_pair_id(n)] = [
+                    rec for rec in recommendations
+                    if isinstance(rec, dict) and rec.get("program_id") in allowed
+                ][:request["top_k"]]
+        
+        self.metrics.count("llm.batch_calls")
+        self.metrics.count("llm.pairs", len(answered))
+        return answered
+    
+    async def _acreate_with_retry(self, messages: List[Dict[str, str]]):
+        """동시성 제한 + 타임아웃 + 재시도로 비동기 Chat Completion 호출"""
+        client, semaphore = self._async_resources()
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with semaphore:
+                    return await asyncio.wait_for(
+                        client.chat.completions.create(
+                            model=self.deployment_name,
+                            messages=messages,
+                            temperature=0.7,
+                            response_format={"type": "json_object"}
+                        ),
+                        timeout=self.request_timeout
+                    )
+            except Exception as e:
+                if attempt >= self.max_retries or not _is_retryable(e):
+                    raise
+                await asyncio.sleep(self._retry_delay(attempt, e))
+    
+    def _async_resources(self):
+        """현재 이벤트 루프용 비동기 클라이언트와 세마포어 (루프가 바뀌면 이전 클라이언트를 닫음)"""
+        loop = asyncio.get_running_loop()
+        if self._async_loop is not loop:
+            previous = self._async_client
+            self._async_loop = loop
+            self._async_client = self._create_async_client()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            if previous is not None:
+                task = loop.create_task(self._close_async_client(previous))
+                self._closing.add(task)
+                task.add_done_callback(self._closing.discard)
+        return self._async_client, self._semaphore
+    
+    def _create_async_client(self) -> AsyncAzureOpenAI:
+        """비동기 클라이언트 생성 (재시도는 _acreate_with_retry에서 처리)"""
+        return AsyncAzureOpenAI(
+            api_key=self.api_key,
+            api_version=self.api_version,
+            azure_endpoint=self.endpoint,
+            timeout=self.request_timeout,
+            max_retries=0
+        )
+    
+    @staticmethod
+    async def _close_async_client(client: AsyncAzureOpenAI) -> None:
+        """이전 이벤트 루프의 클라이언트 연결 풀 정리 (이미 닫힌 루프의 연결이면 실패할 수 있어 무시)"""
+        try:
+            await client.close()
+        except Exception as e:
+            logger.debug("이전 비동기 클라이언트 종료 중 오류 (무시): %s", e)
+    
+    async def aclose(self) -> None:
+        """현재 이벤트 루프의 비동기 클라이언트 닫기 (루프를 끝내기 전에 호출)"""
+        client, self._async_client, self._async_loop = self._async_client, None, None
+        loop = asyncio.get_running_loop()
+        closing = [task for task in self._closing if task.get_loop() is loop]
+        if closing:
+            await asyncio.gather(*closing, return_exceptions=True)
+        if client is not None:
+            await self._close_async_client(client)
+    
+    def _retry_delay(self, attempt: int, error: Exception) -> float:
+        """재시도 대기 시간 (Retry-After 헤더 우선, 없으면 full jitter 지수 백오프)"""
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.retry_max_delay)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** attempt))
+    
+    def _build_messages(self, prompt: str) -> List[Dict[str, str]]:
+        """Chat Completion 메시지 구성"""
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "당신은 멘토링 매칭 전문가입니다. "
+                    "멘토와 멘티의 프로필을 깊이 분석하여 "
+                    "가장 적합한 멘토링 프로그램을 추천해주세요. "
+                    "지역, 예산, 관심사, 활동 취향, 직무 적합성을 모두 고려해야 합니다. "
+                    "추천 이유는 구체적이고 설득력 있게 작성해주세요."
+                )
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
+    def _parse_response(self, response) -> List[Dict[str, Any]]:
+        """Chat Completion 응답에서 추천 목록 추출 (토큰 사용량도 기록)"""
+        self.metrics.record_usage(getattr(response, "usage", None))
+        with self.metrics.stage("llm.parse"):
+            result = json.loads(response.choices[0].message.content)
+        self.metrics.count("llm.pairs")
+        return result.get("recommendations", [])
+    
+    def _cached(self, cache_key: str) -> Optional[List[Dict[str, Any]]]:
+        """캐시 조회 (적중 / 실패 횟수 기록)"""
+        cached = self.cache.get(cache_key)
+        self.metrics.count("llm.cache_hits" if cached is not None else "llm.cache_misses")
+        return cached
+    
+    def _build_prompt(
+        self,
+        mentor_profile: Dict[str, Any],
+        mentee_profile: Dict[str, Any],
+        available_programs: List[Dict[str, Any]],
+        top_k: int
+    ) -> str:
+        """프롬프트 생성 + 토큰 수 추정"""
+        with self.metrics.stage("llm.prompt"):
+            prompt = self._create_recommendation_prompt(
+                mentor_profile,
+                mentee_profile,
+                available_programs,
+                top_k
+            )
+            self.last_prompt_tokens = estimate_tokens(prompt)
+        logger.info(
+            "📏 프롬프트 토큰(추정): %s (프로그램 %d개)",
+            f"{self.last_prompt_tokens:,}", len(available_programs)
+        )
+        return prompt
+    
+    def _on_breaker_change(self, previous: str, state: str) -> None:
+        self.metrics.count(f"llm.breaker_{state}")
+        if state == CLOSED:
+            logger.info("🔌 Azure OpenAI 회로가 닫혔습니다 (%s → %s).", previous, state)
+        else:
+            logger.warning("🔌 Azure OpenAI 회로 상태: %s → %s", previous, state)
+    
+    def _log_error(self, error: Exception) -> None:
+        if isinstance(error, CircuitOpenError):
+            self.metrics.count("llm.short_circuits")
+            logger.debug("Azure OpenAI 호출 차단: %s", error)
+            return
+        self.metrics.count("llm.errors")
+        logger.error("Azure OpenAI API 호출 중 오류 발생: %s", error)
+    
+    def _cache_key(
+        self,
+        mentor_profile: Dict[str, Any],
+        mentee_profile: Dict[str, Any],
+        available_programs: List[Dict[str, Any]],
+        top_k: int,
+        program_versions: Optional[List[str]] = None
+    ) -> str:
+        """멘토/멘티 프로필, 프로그램 ID/버전, top_k, 배포 이름으로 캐시 키 생성"""
+        if program_versions is None:
+            program_versions = [program_version(p) for p in available_programs]
+        return make_cache_key(
+            schema=CACHE_SCHEMA_VERSION,
+            deployment=self.deployment_name,
+            mentor=mentor_profile,
+            mentee=mentee_profile,
+            programs=[
+                [p.get("program_id"), version]
+                for p, version in zip(available_programs, program_versions)
+            ],
+            top_k=top_k
+        )
+    
     def _create_recommendation_prompt(
         self,
         mentor_profile: Dict[str, Any],
@@ -107,13 +639,14 @@ class AzureOpenAIService:
 다음 멘토와 멘티를 위한 최적의 멘토링 프로그램을 추천해주세요.
 
 ## 멘토 프로필
-{json.dumps(mentor_profile, ensure_ascii=False, indent=2)}
+{_compact_json(_drop_empty(mentor_profile))}
 
 ## 멘티 프로필
-{json.dumps(mentee_profile, ensure_ascii=False, indent=2)}
+{_compact_json(_drop_empty(mentee_profile))}
 
 ## 사용 가능한 프로그램 목록
-{json.dumps(available_programs, ensure_ascii=False, indent=2)}
+({PROGRAM_FIELD_LEGEND})
+{_compact_json([compact_program(p) for p in available_programs])}
 
 ## 요구사항
 1. 상위 {top_k}개의 프로그램을 추천해주세요
@@ -149,4 +682,151 @@ class AzureOpenAIService:
 매칭 점수는 높은 순으로 정렬해주세요.
 """
         return prompt
+    
+    def _create_batch_prefix(self, catalog: List[Dict[str, Any]]) -> str:
+        """배치 프롬프트 접두부 생성 (쌍과 무관한 부분만 넣어 호출마다 같은 문자열이 되도록)"""
+        
+        return f"""
+여러 멘토-멘티 쌍에 대해 각각 최적의 멘토링 프로그램을 추천해주세요.
+
+## 요구사항
+1. 맨 아래 쌍 목록의 쌍마다, 그 쌍의 후보(candidates) 프로그램 중에서 상위 k개를 추천해주세요
+2. 각 추천에 대해 다음을 고려하세요:
+   - 멘티의 예산 한도 (budget_limit) 이내인가?
+   - 지역이 적합한가? (멘토/멘티 거주 지역과의 접근성)
+   - 멘토와 멘티의 관심사(interests)가 일치하는가?
+   - 활동 유형이 두 사람 모두에게 적합한가?
+   - 멘티의 학습 목표(learning_goals)와 프로그램이 연관되는가?
+   - 멘토의 전문성(expertise)을 활용할 수 있는가?
+3. 각 프로그램에 대해:
+   - 매칭 점수(0-100): 높을수록 적합
+   - 추천 이유: 구체적이고 설득력 있게 (2-3문장)
+4. 쌍 목록의 모든 쌍 ID에 대해 빠짐없이 답해주세요
+
+## 출력 형식 (JSON)
+반드시 다음 형식으로, 쌍 ID를 키로 응답해주세요 (쌍마다 매칭 점수가 높은 순):
+
+{{
+  "results": {{
+    "P1": [
+      {{"program_id": "프로그램 ID", "match_score": 95, "reason": "추천 이유..."}},
+      {{"program_id": "프로그램 ID", "match_score": 88, "reason": "추천 이유..."}}
+    ],
+    "P2": [
+      {{"program_id": "프로그램 ID", "match_score": 91, "reason": "추천 이유..."}}
+    ]
+  }}
+}}
+
+## 프로그램 카탈로그
+({PROGRAM_FIELD_LEGEND})
+{_compact_json([compact_program(p) for p in catalog])}
+"""
+    
+    def _create_batch_pairs_section(self, requests: List[Dict[str, Any]]) -> str:
+        """배치 프롬프트의 쌍 목록 (같은 멘토/멘티 프로필은 한 번만 넣고 ID로 참조)"""
+        
+        mentors: Dict[str, str] = {}
+        mentees: Dict[str, str] = {}
+        profiles: Dict[str, Dict[str, Any]] = {}
+        pairs = []
+        for n, request in enumerate(requests):
+            refs = []
+            for profile, seen, prefix in (
+                (request["mentor_profile"], mentors, "M"),
+                (request["mentee_profile"], mentees, "E"),
+            ):
+                key = _compact_json(profile)
+                if key not in seen:
+                    seen[key] = f"{prefix}{len(seen) + 1}"
+                    profiles[seen[key]] = _drop_empty(profile)
+                refs.append(seen[key])
+            pairs.append({
+                "id": _pair_id(n),
+                "mentor": refs[0],
+                "mentee": refs[1],
+                "k": request["top_k"],
+                "candidates": [program.get("program_id") for program in request["available_programs"]],
+            })
+        
+        return f"""
+## 멘토 프로필
+{_compact_json({ref: profiles[ref] for ref in mentors.values()})}
+
+## 멘티 프로필
+{_compact_json({ref: profiles[ref] for ref in mentees.values()})}
+
+## 쌍 목록
+{_compact_json(pairs)}
+"""
+
+
+def program_version(program: Dict[str, Any]) -> str:
+    """프로그램 내용 해시 (내용이 바뀌면 캐시 키도 바뀜, `ProgramIndex.payload().version`과 같음)"""
+    return make_cache_key(**program)[:16]
+
+
+def _is_retryable(error: Exception) -> bool:
+    """재시도할 오류인지 (429, 5xx, 타임아웃, 연결 오류)"""
+    if isinstance(error, (asyncio.TimeoutError, APITimeoutError, APIConnectionError)):
+        return True
+    if isinstance(error, APIStatusError):
+        return error.status_code == 429 or error.status_code >= 500
+    return False
+
+
+def _is_fatal(error: Exception) -> bool:
+    """다시 요청해도 같은 결과가 나올 오류인지 (인증 / 권한 / 배포 없음)"""
+    return isinstance(error, APIStatusError) and error.status_code in (401, 403, 404)
+
+
+def _pair_id(n: int) -> str:
+    """배치 프롬프트 안에서 n번째 쌍의 ID"""
+    return f"P{n + 1}"
+
+
+def compact_program(program: Dict[str, Any]) -> Dict[str, Any]:
+    """프롬프트용 프로그램 표현 (짧은 키, 프롬프트가 사용하는 필드만)"""
+    return {
+        short: program[field]
+        for short, field in PROGRAM_PROMPT_FIELDS.items()
+        if program.get(field) not in (None, [], "")
+    }
+
+
+def _drop_empty(profile: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in profile.items() if value not in (None, [], "")}
+
+
+def _compact_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+# 인코딩을 불러오지 못했음을 나타내는 값 (프롬프트마다 다시 시도하지 않음)
+_ENCODING_UNAVAILABLE = object()
+
+_encoding = None
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    프롬프트 토큰 수 추정
 
+    tiktoken이 설치되어 있으면 o200k_base 인코딩으로 세고, 없거나 인코딩을 불러오지
+    못하면 ASCII 4글자당 1토큰, 한글 등 그 외 문자는 글자당 1토큰으로 근사합니다.
+    """
+    global _encoding
+    if _encoding is None:
+        if tiktoken is None:
+            _encoding = _ENCODING_UNAVAILABLE
+        else:
+            try:
+                _encoding = tiktoken.get_encoding("o200k_base")
+            except Exception as e:
+                # 인코딩 파일을 내려받지 못하는 환경 등: 한 번만 알리고 근사치 사용
+                logger.warning("⚠️  tiktoken 인코딩을 불러오지 못해 글자 수로 토큰을 추정합니다: %s", e)
+                _encoding = _ENCODING_UNAVAILABLE
+    if _encoding is not _ENCODING_UNAVAILABLE:
+        return len(_encoding.encode(text))
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
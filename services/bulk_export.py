@@ -0,0 +1,131 @@
+"""
+대량 매칭 결과 내보내기 (JSONL / CSV 스트리밍)
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from models import Mentor, Mentee
+from services.matching_service import BulkMatch
+
+if TYPE_CHECKING:
+    from services.cohort_assignment import CohortAssignment
+
+
+BULK_FIELDS = [
+    "mentor_index",
+    "mentor_name",
+    "mentee_index",
+    "mentee_name",
+    "rank",
+    "program_id",
+    "title",
+    "match_score",
+    "reason",
+    "reason_codes",
+]
+
+ASSIGNMENT_FIELDS = ["mentor_index", "mentor_name", "mentee_index", "mentee_name", "score"]
+
+
+def iter_bulk_rows(matches: Iterable[BulkMatch]) -> Iterator[Dict[str, Any]]:
+    """대량 매칭 결과를 (멘토, 멘티, 순위) 단위의 행으로 펼침"""
+    for match in matches:
+        for rank, rec in enumerate(match.recommendations, 1):
+            yield {
+                "mentor_index": match.mentor_index,
+                "mentor_name": match.mentor.name,
+                "mentee_index": match.mentee_index,
+                "mentee_name": match.mentee.name,
+                "rank": rank,
+                "program_id": rec.program.program_id,
+                "title": rec.program.title,
+                "match_score": rec.match_score,
+                "reason": rec.reason,
+                "reason_codes": ",".join(reason.code for reason in rec.reasons),
+            }
+
+
+def _resolve_format(path: Path, fmt: Optional[str]) -> str:
+    fmt = (fmt or path.suffix.lstrip(".") or "jsonl").lower()
+    if fmt not in ("jsonl", "csv"):
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {fmt} (jsonl, csv 중 선택)")
+    return fmt
+
+
+def write_rows(
+    rows: Iterable[Dict[str, Any]],
+    file_path: str,
+    fields: List[str],
+    fmt: Optional[str] = None
+) -> int:
+    """
+    행 스트림을 JSONL 또는 CSV 파일로 한 줄씩 저장
+
+    Args:
+        rows: 저장할 행 (dict)
+        file_path: 출력 파일 경로
+        fields: CSV 헤더 순서
+        fmt: "jsonl" 또는 "csv" (None이면 확장자로 판단)
+
+    Returns:
+        저장한 행 개수
+    """
+    path = Path(file_path)
+    fmt = _resolve_format(path, fmt)
+
+    count = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+        else:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+                count += 1
+    return count
+
+
+def write_bulk_results(
+    matches: Iterable[BulkMatch],
+    file_path: str,
+    fmt: Optional[str] = None
+) -> int:
+    """
+    대량 매칭 결과를 파일로 스트리밍 저장
+
+    Args:
+        matches: `MatchingService.find_matches_bulk()` 결과
+        file_path: 출력 파일 경로
+        fmt: "jsonl" 또는 "csv" (None이면 확장자로 판단)
+
+    Returns:
+        저장한 행 개수
+    """
+    return write_rows(iter_bulk_rows(matches), file_path, BULK_FIELDS, fmt)
+
+
+def write_cohort_assignment(
+    assignment: "CohortAssignment",
+    mentors: Sequence[Mentor],
+    mentees: Sequence[Mentee],
+    file_path: str,
+    fmt: Optional[str] = None
+) -> int:
+    """코호트 배정 결과를 (멘토, 멘티, 점수) 행으로 저장"""
+    rows = (
+        {
+            "mentor_index": mentor,
+            "mentor_name": mentors[mentor].name,
+            "mentee_index": mentee,
+            "mentee_name": mentees[mentee].name,
+            "score": round(score, 2),
+        }
+        for mentor, mentee, score in assignment.pairs
+    )
+    return write_rows(rows, file_path, ASSIGNMENT_FIELDS, fmt)
@@ -0,0 +1,143 @@
+"""
+프로그램 카탈로그 파일 감시 (핫 리로드)
+
+프로그램 JSON 파일의 (mtime, 크기)가 바뀌면 내용 해시를 비교하고, 실제로
+바뀐 경우에만 program_id 기준으로 추가/변경/삭제분을 계산해
+`MatchingService.apply_catalog_diff()`로 제자리 반영합니다.
+
+AI 추천 캐시 키에는 프로그램별 내용 해시가 들어가므로, 내용이 바뀐
+프로그램이 포함된 응답만 자연스럽게 무효화됩니다.
+
+바이너리 스냅샷(`.snap`)은 변경분을 계산하려면 프로그램을 모두 만들어야 하므로
+감시하지 않습니다 (스냅샷을 바꾸면 서비스를 다시 로드).
+"""
+
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from models import MentoringProgram
+from services.data_loader import iter_models
+from services.matching_service import MatchingService
+from services.program_index import CatalogDiff, diff_programs
+from services.snapshot import SNAPSHOT_MAGIC, is_snapshot
+
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogWatcher:
+    """프로그램 파일 변경을 감지해 MatchingService에 증분 반영"""
+
+    def __init__(self, service: MatchingService, file_path: str, interval: float = 2.0):
+        """
+        Args:
+            service: 변경분을 반영할 서비스 (생성 직후 같은 파일을 로드해야 하며,
+                생성 시점의 파일 상태를 기준으로 이후 변경을 감지)
+            file_path: 감시할 프로그램 JSON / JSON Lines 파일
+            interval: `start()`로 백그라운드 감시할 때의 확인 주기 (초)
+
+        Raises:
+            ValueError: 바이너리 스냅샷 파일인 경우
+        """
+        if is_snapshot(file_path):
+            raise ValueError(
+                f"스냅샷 파일은 감시할 수 없습니다 (JSON / JSON Lines 파일만 지원): {file_path}"
+            )
+        self.service = service
+        self.path = Path(file_path)
+        self.interval = interval
+        # 파일이 사라졌음을 이미 알렸는지 (다시 생길 때까지 한 번만 로그)
+        self._missing = False
+
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # 마지막으로 반영한 파일 상태: (mtime_ns, 파일 크기), 내용 해시
+        self._signature, self._digest = self._read_state()
+
+    def check(self) -> Optional[CatalogDiff]:
+        """
+        파일이 바뀌었으면 변경분을 반영
+
+        파일이 없으면(삭제, 다른 이름으로 저장하는 도중) 바뀐 것이 없다고 보고 이전 카탈로그를 유지합니다.
+
+        Returns:
+            반영한 변경분 (바뀐 것이 없거나 파일을 읽지 못했으면 None)
+        """
+        with self._lock:
+            try:
+                signature = self._stat()
+                if signature == self._signature:
+                    return None
+                raw = self.path.read_bytes()
+            except FileNotFoundError:
+                if not self._missing:
+                    logger.warning("⚠️  프로그램 파일이 없어 이전 카탈로그를 유지합니다: %s", self.path)
+                    self._missing = True
+                return None
+            if self._missing:
+                logger.info("📂 프로그램 파일을 다시 찾았습니다: %s", self.path)
+                self._missing = False
+
+            digest = hashlib.sha256(raw).hexdigest()
+            if digest == self._digest:
+                # 내용은 그대로이고 mtime만 바뀜 (touch, 같은 내용으로 저장)
+                self._signature = signature
+                return None
+
+            if raw.startswith(SNAPSHOT_MAGIC):
+                # 감시 중인 파일이 스냅샷으로 바뀜: 같은 상태를 다시 알리지 않도록 기록만 갱신
+                logger.warning("⚠️  프로그램 파일이 스냅샷으로 바뀌어 반영하지 않습니다: %s", self.path)
+                self._signature, self._digest = signature, digest
+                return None
+
+            try:
+                programs = list(iter_models(str(self.path), MentoringProgram))
+            except (ValueError, FileNotFoundError) as e:
+                # 저장 도중이거나 잘못된 파일이면 이전 카탈로그를 유지하고 다음에 다시 확인
+                logger.warning("⚠️  프로그램 파일을 다시 읽지 못했습니다: %s", e)
+                return None
+
+            diff = diff_programs(self.service.index, programs)
+            self._signature, self._digest = signature, digest
+            if not diff:
+                return None
+
+            version = self.service.apply_catalog_diff(diff)
+            logger.info("🔄 프로그램 카탈로그 갱신 (v%d): %s", version, diff.summary())
+            return diff
+
+    def start(self) -> None:
+        """백그라운드 스레드에서 주기적으로 `check()` 실행"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """백그라운드 감시 중지"""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.check()
+            except OSError as e:
+                logger.warning("⚠️  프로그램 파일을 확인하지 못했습니다: %s", e)
+
+    def _stat(self) -> Tuple[int, int]:
+        stat = self.path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def _read_state(self) -> Tuple[Tuple[int, int], str]:
+        signature = self._stat()
+        return signature, hashlib.sha256(self.path.read_bytes()).hexdigest()
@@ -0,0 +1,159 @@
+"""
+외부 호출용 회로 차단기 (circuit breaker)
+
+최근 호출의 실패율(느린 호출 포함)이 한도를 넘으면 회로를 열어 일정 시간 동안
+호출하지 않고 `CircuitOpenError`를 바로 발생시킵니다. 호출자는 타임아웃을 기다리지 않고
+곧바로 대체 경로(규칙 기반 추천)로 넘어갈 수 있습니다.
+
+- closed: 정상. 최근 `window`개 호출 중 실패 + 느린 호출 비율이 `failure_rate` 이상이면 open
+- open: `open_seconds` 동안 호출 차단, 지나면 half_open
+- half_open: 시험 호출을 `half_open_probes`개까지만 허용. 모두 성공하면 closed, 하나라도
+  실패하거나 느리면 다시 open
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Optional
+
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출하지 않음"""
+
+
+class CircuitBreaker:
+    """오류율 / 지연 시간 기반 회로 차단기 (스레드 안전)"""
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        slow_call_seconds: Optional[float] = 10.0,
+        window: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+        half_open_probes: int = 2,
+        is_failure: Callable[[BaseException], bool] = lambda error: True,
+        on_state_change: Optional[Callable[[str, str], None]] = None,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Args:
+            failure_rate: 회로를 여는 최근 호출 실패 비율 (0~1)
+            slow_call_seconds: 이보다 오래 걸린 호출은 성공해도 실패로 셈 (None이면 지연 시간 무시)
+            window: 실패 비율을 계산할 최근 호출 수
+            min_calls: 실패 비율을 판단하기 전 필요한 최소 호출 수
+            open_seconds: 회로를 연 뒤 시험 호출을 허용하기까지의 시간 (초)
+            half_open_probes: half_open 상태에서 허용하는 시험 호출 수 (모두 성공해야 closed)
+            is_failure: 예외가 상대 서비스 상태 때문인지 판단 (False면 결과를 기록하지 않음)
+            on_state_change: 상태가 바뀔 때 `(이전 상태, 새 상태)`로 불리는 콜백
+            clock: 단조 시계 (테스트용)
+        """
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self.is_failure = is_failure
+        self.on_state_change = on_state_change
+        self.clock = clock
+
+        self._state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True = 실패 또는 느린 호출
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """현재 상태 (open이 `open_seconds` 지났으면 half_open으로 봄)"""
+        with self._lock:
+            if self._state == OPEN and self.clock() - self._opened_at >= self.open_seconds:
+                return HALF_OPEN
+            return self._state
+
+    def call(self) -> "_BreakerCall":
+        """`with breaker.call():` 블록을 호출 하나로 기록 (회로가 열려 있으면 `CircuitOpenError`)"""
+        return _BreakerCall(self, self._admit())
+
+    def _admit(self) -> bool:
+        """호출 허용 여부 확인 (half_open 시험 호출이면 True 반환)"""
+        changed = None
+        with self._lock:
+            if self._state == OPEN:
+                remaining = self.open_seconds - (self.clock() - self._opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(f"회로가 열려 있습니다 ({remaining:.1f}초 후 다시 시도).")
+                changed = self._transition(HALF_OPEN)
+                self._probes = self._probe_successes = 0
+            probe = self._state == HALF_OPEN
+            if probe:
+                if self._probes >= self.half_open_probes:
+                    raise CircuitOpenError("회로 시험 호출이 진행 중입니다.")
+                self._probes += 1
+        self._notify(changed)
+        return probe
+
+    def _record(self, probe: bool, seconds: float, error: Optional[BaseException]) -> None:
+        if error is not None and not (isinstance(error, Exception) and self.is_failure(error)):
+            # 취소되었거나 상대 서비스와 무관한 오류: 시험 호출 자리만 반납
+            if probe:
+                with self._lock:
+                    self._probes -= 1
+            return
+
+        failed = error is not None or (
+            self.slow_call_seconds is not None and seconds > self.slow_call_seconds
+        )
+        changed = None
+        with self._lock:
+            # 다른 시험 호출이 이미 회로를 다시 열었으면 늦게 끝난 시험 호출 결과는 무시
+            if probe and self._state == HALF_OPEN:
+                if failed:
+                    changed = self._open()
+                else:
+                    self._probe_successes += 1
+                    if self._probe_successes >= self.half_open_probes:
+                        self._outcomes.clear()
+                        changed = self._transition(CLOSED)
+            elif not probe and self._state == CLOSED:
+                self._outcomes.append(failed)
+                if (
+                    len(self._outcomes) >= self.min_calls
+                    and sum(self._outcomes) / len(self._outcomes) >= self.failure_rate
+                ):
+                    changed = self._open()
+        self._notify(changed)
+
+    def _open(self):
+        self._opened_at = self.clock()
+        return self._transition(OPEN)
+
+    def _transition(self, state: str):
+        previous, self._state = self._state, state
+        return (previous, state) if previous != state else None
+
+    def _notify(self, changed) -> None:
+        if changed is not None and self.on_state_change is not None:
+            self.on_state_change(*changed)
+
+
+class _BreakerCall:
+    __slots__ = ("breaker", "probe", "start")
+
+    def __init__(self, breaker: CircuitBreaker, probe: bool):
+        self.breaker = breaker
+        self.probe = probe
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.breaker._record(self.probe, time.perf_counter() - self.start, exc)
+        return False
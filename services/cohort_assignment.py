@@ -0,0 +1,252 @@
+"""
+코호트 배정 엔진 (멘토 ↔ 멘티 최적 짝짓기, 멘토별 수용 인원 포함)
+
+멘토 × 멘티 호환성 점수를 행렬 연산으로 계산하고, 멘티마다 상위 후보 멘토만 남긴
+희소 이분 그래프에서 최대 가중치 배정을 구합니다. 멘토 수용 인원은 멘토 노드를
+슬롯 단위로 복제해 반영하고, 멘티마다 "미배정" 더미 슬롯을 두어 항상 해가 존재하도록
+만든 뒤 scipy의 희소 헝가리안(LAPJVsp) 알고리즘으로 풉니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import min_weight_full_bipartite_matching
+
+from models import Mentor, Mentee
+from services.regions import REGIONS
+from services.schedule import encode_days
+
+
+# 호환성 점수 가중치 (총 100점)
+INTEREST_WEIGHT = 30     # 공통 관심사 1개당 10점, 최대 30점
+LOCATION_WEIGHT = 20     # 같은 지역 20점, 다른 지역 5점
+LOCATION_OTHER = 5
+DAYS_WEIGHT = 20         # 멘티 가능 요일 중 멘토와 겹치는 비율
+EXPERTISE_WEIGHT = 20    # 멘티 학습 목표 중 멘토 전문 분야로 다룰 수 있는 비율
+BUDGET_WEIGHT = 10       # 멘토 선호 예산이 멘티 예산 한도 이내인지
+
+_POPCOUNT7 = np.array([bin(i).count("1") for i in range(128)], dtype=np.float32)
+
+
+def _related(expertise: str, goal: str) -> bool:
+    """전문 분야가 학습 목표를 다룰 수 있는지 (부분 문자열 또는 2글자 이상 공통 단어)"""
+    expertise, goal = expertise.lower(), goal.lower()
+    if expertise in goal or goal in expertise:
+        return True
+    return bool(
+        {w for w in expertise.split() if len(w) >= 2} & {w for w in goal.split() if len(w) >= 2}
+    )
+
+
+def _vocab_matrix(rows: Sequence[Sequence[str]], vocab: Dict[str, int]) -> np.ndarray:
+    """문자열 목록들을 0/1 행렬(행 × 어휘)로 변환"""
+    matrix = np.zeros((len(rows), len(vocab)), dtype=np.float32)
+    for i, values in enumerate(rows):
+        for value in set(values):
+            matrix[i, vocab[value]] = 1.0
+    return matrix
+
+
+def _build_vocab(*groups: Sequence[Sequence[str]]) -> Dict[str, int]:
+    vocab: Dict[str, int] = {}
+    for rows in groups:
+        for values in rows:
+            for value in values:
+                vocab.setdefault(value, len(vocab))
+    return vocab
+
+
+class CompatibilityModel:
+    """멘토/멘티 특징 행렬 (한 번 만들어 블록 단위로 호환성 점수 계산)"""
+
+    def __init__(self, mentors: Sequence[Mentor], mentees: Sequence[Mentee]):
+        self.n_mentors = len(mentors)
+        self.n_mentees = len(mentees)
+
+        # 관심사: 공통 관심사 개수 = M @ E.T
+        interests = _build_vocab([m.interests for m in mentors], [m.interests for m in mentees])
+        self.mentor_interests = _vocab_matrix([m.interests for m in mentors], interests)
+        self.mentee_interests = _vocab_matrix([m.interests for m in mentees], interests)
+
+        # 지역: 고유 지역 문자열을 지역 노드로 정규화한 뒤 쌍마다 한 번만 포함 관계 판정
+        locations = _build_vocab([[m.location] for m in mentors], [[m.location] for m in mentees])
+        regions = np.asarray([REGIONS.resolve(name) for name in locations], dtype=np.int32)
+        self.location_points = np.array(
+            [
+                np.where(
+                    REGIONS.compatible_mask(regions, region) | (regions == region),
+                    LOCATION_WEIGHT,
+                    LOCATION_OTHER,
+                )
+                for region in regions.tolist()
+            ],
+            dtype=np.float32,
+        ).reshape(len(regions), len(regions))
+        self.mentor_location = np.array([locations[m.location] for m in mentors], dtype=np.int64)
+        self.mentee_location = np.array([locations[m.location] for m in mentees], dtype=np.int64)
+
+        # 요일: 7비트 마스크
+        self.mentor_days = np.array([encode_days(m.available_days) for m in mentors], dtype=np.int64)
+        self.mentee_days = np.array([encode_days(m.available_days) for m in mentees], dtype=np.int64)
+        self.mentee_day_count = np.maximum(_POPCOUNT7[self.mentee_days], 1)
+
+        # 전문 분야 ↔ 학습 목표: 멘토가 다룰 수 있는 목표 행렬(C) @ 멘티 목표 행렬.T
+        expertise = _build_vocab([m.expertise for m in mentors])
+        goals = _build_vocab([m.learning_goals for m in mentees])
+        relation = np.array(
+            [[_related(e, g) for g in goals] for e in expertise], dtype=np.float32
+        ).reshape(len(expertise), len(goals))
+        mentor_expertise = _vocab_matrix([m.expertise for m in mentors], expertise)
+        self.mentor_goal_coverage = (mentor_expertise @ relation > 0).astype(np.float32)
+        self.mentee_goals = _vocab_matrix([m.learning_goals for m in mentees], goals)
+        self.mentee_goal_count = np.maximum(self.mentee_goals.sum(axis=1), 1)
+
+        # 예산: 멘토 선호 예산(없으면 0) vs 멘티 예산 한도
+        self.mentor_budget = np.array(
+            [m.preferred_budget or 0 for m in mentors], dtype=np.float32
+        )
+        self.mentee_budget = np.array([m.budget_limit for m in mentees], dtype=np.float32)
+
+    def block(self, mentee_slice: slice) -> np.ndarray:
+        """
+        멘티 일부 × 멘토 전체의 호환성 점수 (0-100, 멘티 행 우선)
+
+        요일이 하루도 겹치지 않는 쌍은 배정할 수 없으므로 -inf로 표시합니다.
+        """
+        s = mentee_slice
+
+        common = self.mentee_interests[s] @ self.mentor_interests.T
+        score = np.minimum(common * 10, INTEREST_WEIGHT)
+
+        score += self.location_points[self.mentee_location[s, None], self.mentor_location[None, :]]
+
+        overlap = _POPCOUNT7[self.mentee_days[s, None] & self.mentor_days[None, :]]
+        score += DAYS_WEIGHT * overlap / self.mentee_day_count[s, None]
+
+        covered = self.mentee_goals[s] @ self.mentor_goal_coverage.T
+        score += EXPERTISE_WEIGHT * covered / self.mentee_goal_count[s, None]
+
+        mentee_budget = self.mentee_budget[s, None]
+        mentor_budget = self.mentor_budget[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            budget_ratio = np.where(
+                mentor_budget <= mentee_budget, 1.0, mentee_budget / mentor_budget
+            )
+        score += BUDGET_WEIGHT * budget_ratio
+
+        score[overlap == 0] = -np.inf
+        return score
+
+    def matrix(self) -> np.ndarray:
+        """전체 호환성 행렬 (멘티 × 멘토) - 소규모 코호트 확인용"""
+        return self.block(slice(None))
+
+
+@dataclass
+class CohortAssignment:
+    """코호트 배정 결과"""
+
+    pairs: List[Tuple[int, int, float]] = field(default_factory=list)   # (멘토, 멘티, 점수)
+    unassigned_mentees: List[int] = field(default_factory=list)
+    total_score: float = 0.0
+
+    def mentees_of(self, mentor_index: int) -> List[int]:
+        """멘토에게 배정된 멘티 인덱스 목록"""
+        return [mentee for mentor, mentee, _ in self.pairs if mentor == mentor_index]
+
+
+def assign_cohort(
+    mentors: Sequence[Mentor],
+    mentees: Sequence[Mentee],
+    capacity: Union[int, Sequence[int]] = 1,
+    candidates_per_mentee: int = 20,
+    block_size: int = 512
+) -> CohortAssignment:
+    """
+    멘토 수용 인원을 지키면서 호환성 점수 합이 최대가 되도록 멘티를 배정
+
+    Args:
+        mentors: 멘토 목록
+        mentees: 멘티 목록
+        capacity: 멘토별 최대 멘티 수 (정수 또는 멘토별 목록)
+        candidates_per_mentee: 멘티마다 남길 후보 멘토 수
+            (멘토 수 이상이면 전체 그래프에서 정확한 최적해)
+        block_size: 호환성 행렬을 계산할 멘티 블록 크기
+
+    Returns:
+        CohortAssignment (배정 쌍, 미배정 멘티, 총점)
+    """
+    n_mentors, n_mentees = len(mentors), len(mentees)
+    if isinstance(capacity, int):
+        capacities = np.full(n_mentors, capacity, dtype=np.int64)
+    else:
+        capacities = np.asarray(capacity, dtype=np.int64)
+        if len(capacities) != n_mentors:
+            raise ValueError("capacity 길이가 멘토 수와 다릅니다.")
+    if n_mentors == 0 or n_mentees == 0 or capacities.sum() <= 0:
+        return CohortAssignment(unassigned_mentees=list(range(n_mentees)))
+
+    model = CompatibilityModel(mentors, mentees)
+    available = capacities > 0
+    k = max(1, min(candidates_per_mentee, int(available.sum())))
+
+    # 1. 멘티 블록마다 상위 k명의 후보 멘토만 남김 (희소 후보 그래프)
+    edge_mentee: List[np.ndarray] = []
+    edge_mentor: List[np.ndarray] = []
+    edge_score: List[np.ndarray] = []
+    for start in range(0, n_mentees, block_size):
+        block = model.block(slice(start, start + block_size))
+        block[:, ~available] = -np.inf
+        top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+        scores = np.take_along_axis(block, top, axis=1)
+        mentee_ids = np.broadcast_to(np.arange(start, start + len(block))[:, None], top.shape)
+        feasible = np.isfinite(scores)
+        edge_mentee.append(mentee_ids[feasible])
+        edge_mentor.append(top[feasible])
+        edge_score.append(scores[feasible])
+    mentee_idx = np.concatenate(edge_mentee)
+    mentor_idx = np.concatenate(edge_mentor)
+    weight = np.concatenate(edge_score).astype(np.float64)
+
+    # 2. 멘토를 수용 인원만큼 슬롯으로 복제하고, 멘티마다 미배정 더미 슬롯 추가
+    slot_offset = np.concatenate([[0], np.cumsum(capacities)])
+    n_slots = int(slot_offset[-1])
+    slot_owner = np.repeat(np.arange(n_mentors), capacities)
+    copies = capacities[mentor_idx]
+    rows = np.repeat(mentee_idx, copies)
+    cols = np.repeat(slot_offset[mentor_idx], copies) + (
+        np.arange(int(copies.sum())) - np.repeat(np.cumsum(copies) - copies, copies)
+    )
+    weights = np.repeat(weight, copies)
+
+    # 최대 가중치 → 양수 비용 최소화 (미배정 = 가중치 0)
+    base = (weights.max() if len(weights) else 0.0) + 1.0
+    rows = np.concatenate([rows, np.arange(n_mentees)])
+    cols = np.concatenate([cols, n_slots + np.arange(n_mentees)])
+    costs = np.concatenate([base - weights, np.full(n_mentees, base)])
+    graph = csr_matrix((costs, (rows, cols)), shape=(n_mentees, n_slots + n_mentees))
+
+    # 3. 희소 헝가리안 알고리즘으로 최적 배정
+    _, assigned_slot = min_weight_full_bipartite_matching(graph)
+
+    # 4. 배정된 슬롯을 멘토로 되돌리고 점수 조회
+    assigned = assigned_slot < n_slots
+    mentees_assigned = np.flatnonzero(assigned)
+    mentors_assigned = slot_owner[assigned_slot[assigned]]
+    edge_order = np.lexsort((mentor_idx, mentee_idx))
+    keys = mentee_idx[edge_order] * n_mentors + mentor_idx[edge_order]
+    found = np.searchsorted(keys, mentees_assigned * n_mentors + mentors_assigned)
+    scores = weight[edge_order][found]
+
+    order = np.lexsort((mentees_assigned, mentors_assigned))
+    return CohortAssignment(
+        pairs=list(zip(
+            mentors_assigned[order].tolist(),
+            mentees_assigned[order].tolist(),
+            scores[order].tolist(),
+        )),
+        unassigned_mentees=np.flatnonzero(~assigned).tolist(),
+        total_score=float(scores.sum()),
+    )
@@ -0,0 +1,276 @@
+"""
+대용량 JSON / JSON Lines 스트리밍 로더
+
+`json.load()`는 파일 전체를 dict 목록으로 만든 뒤에야 모델을 만들 수 있어
+최대 메모리가 파일 크기의 수 배가 되고, 첫 레코드도 파일을 다 읽은 뒤에야
+쓸 수 있습니다. 이 모듈은 파일을 블록 단위로 읽으며 레코드를 하나씩 꺼내고,
+검증된 모델을 `chunk_size`개씩 묶어 돌려줍니다.
+
+이미 검증된 파일(직접 만든 스냅샷, 캐시된 카탈로그)은 `trusted=True`로
+검증을 건너뛰고 레코드 dict를 인스턴스 `__dict__`로 바로 넣어 모델을 만들 수 있습니다
+(`trusted_constructor()`, `model_construct()`보다 빠름).
+
+지원 형식:
+- JSON 배열: `[{...}, {...}]`
+- JSON Lines: 한 줄에 객체 하나 (`.jsonl`, `.ndjson`, 또는 첫 글자가 `[`가 아닌 파일)
+- 바이너리 스냅샷: `python main.py snapshot`으로 만든 파일 (`services/snapshot.py`)
+"""
+
+import copy
+import itertools
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# 한 번에 읽을 텍스트 크기 (문자 수)
+READ_BLOCK_SIZE = 1 << 16
+
+JSON_LINES_SUFFIXES = (".jsonl", ".ndjson")
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+
+
+def iter_records(file_path: str, block_size: int = READ_BLOCK_SIZE) -> Iterator[Dict[str, Any]]:
+    """
+    JSON 배열 또는 JSON Lines 파일의 레코드를 하나씩 반환
+
+    Args:
+        file_path: 입력 파일 경로
+        block_size: 한 번에 읽을 문자 수
+
+    Yields:
+        레코드 (dict)
+    """
+    path = Path(file_path)
+    with open(path, "r", encoding="utf-8-sig") as f:
+        if path.suffix.lower() in JSON_LINES_SUFFIXES:
+            yield from _iter_json_lines(f)
+            return
+
+        # 확장자가 .json이어도 첫 글자로 형식을 판단
+        head = f.read(block_size)
+        stripped = head.lstrip(_WHITESPACE)
+        if stripped.startswith("["):
+            yield from _iter_json_array(f, stripped, block_size)
+        else:
+            yield from _iter_json_lines(itertools.chain([head], f), join=True)
+
+
+def _iter_json_lines(lines: Iterable[str], join: bool = False) -> Iterator[Dict[str, Any]]:
+    """JSON Lines 파싱 (빈 줄은 무시)"""
+    if join:
+        # 첫 블록이 줄 중간에서 끊겼을 수 있으므로 이어 붙인 뒤 줄 단위로 다시 나눔
+        lines = _split_lines(lines)
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{line_no}번째 줄의 JSON 형식이 올바르지 않습니다: {e}") from e
+
+
+def _split_lines(blocks: Iterable[str]) -> Iterator[str]:
+    rest = ""
+    for block in blocks:
+        rest += block
+        *lines, rest = rest.split("\n")
+        yield from lines
+    if rest:
+        yield rest
+
+
+def _iter_json_array(f, buffer: str, block_size: int) -> Iterator[Dict[str, Any]]:
+    """JSON 배열의 원소를 블록 단위로 읽으며 하나씩 디코딩"""
+    pos = 1   # 여는 `[` 다음
+    eof = False
+    expect_value = True
+    count = 0
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+
+        # 다음 토큰을 판단할 만큼 읽지 못했으면 더 읽음
+        if pos >= len(buffer):
+            if eof:
+                raise ValueError("JSON 배열이 닫히지 않았습니다 (파일이 잘렸을 수 있습니다)")
+            more = f.read(block_size)
+            buffer, pos, eof = more, 0, not more
+            continue
+
+        ch = buffer[pos]
+        if ch == "]" and (not expect_value or count == 0):
+            return
+        if not expect_value:
+            if ch != ",":
+                raise ValueError(f"{count}번째 레코드 뒤에 ',' 또는 ']'가 필요합니다")
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            value, end = _decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            value, end = None, -1
+
+        # 디코딩에 실패했거나 값이 블록 끝에서 끝나면(숫자 등이 잘렸을 수 있음) 더 읽고 다시 시도
+        if end < 0 or (end == len(buffer) and not eof):
+            if eof:
+                raise ValueError(f"{count + 1}번째 레코드의 JSON 형식이 올바르지 않습니다")
+            more = f.read(block_size)
+            # 이미 읽은 부분은 여기서 버려 버퍼 크기를 블록 + 레코드 하나 수준으로 유지
+            buffer, pos, eof = buffer[pos:] + more, 0, not more
+            continue
+
+        yield value
+        count += 1
+        expect_value = False
+        # 레코드마다 남은 블록을 복사하지 않도록 위치만 옮김 (읽은 부분은 더 읽을 때 버림)
+        pos = end
+
+
+def iter_model_chunks(
+    file_path: str,
+    model: Type[ModelT],
+    chunk_size: int = 1000,
+    trusted: bool = False
+) -> Iterator[List[ModelT]]:
+    """
+    파일의 레코드를 모델로 만들어 `chunk_size`개씩 반환
+
+    Args:
+        file_path: JSON 배열 또는 JSON Lines 파일
+        model: 레코드를 만들 Pydantic 모델 (Mentor, Mentee, MentoringProgram)
+        chunk_size: 한 번에 반환할 모델 수
+        trusted: True면 JSON 배열 레코드를 검증 없이 모델로 생성
+            (직접 만든 스냅샷처럼 이미 검증된 파일에만 사용, JSON Lines는 항상 묶음 검증)
+
+    Yields:
+        모델 목록 (마지막 묶음은 더 짧을 수 있음)
+    """
+    from services.snapshot import is_snapshot, open_snapshot
+
+    if is_snapshot(file_path):
+        # 바이너리 스냅샷은 저장 시점에 검증되었으므로 그대로 모델로 복원
+        models = open_snapshot(file_path, model).models()
+        for start in range(0, len(models), chunk_size):
+            yield models[start:start + chunk_size]
+        return
+
+    adapter = _list_adapter(model)
+
+    if Path(file_path).suffix.lower() in JSON_LINES_SUFFIXES:
+        # JSON Lines는 줄 묶음을 배열 하나로 이어 pydantic-core가 파싱 + 검증을 한 번에 처리
+        # (파싱까지 Rust에서 하므로 검증을 생략하는 것보다도 빠름)
+        index = 0
+        with open(file_path, "r", encoding="utf-8-sig") as f:
+            lines = (line for line in f if line.strip())
+            while True:
+                batch = list(itertools.islice(lines, chunk_size))
+                if not batch:
+                    return
+                try:
+                    chunk = adapter.validate_json("[" + ",".join(batch) + "]")
+                except ValidationError as e:
+                    raise _record_error(e, file_path, model, index) from e
+                index += len(chunk)
+                yield chunk
+
+    records = iter_records(file_path)
+    construct = trusted_constructor(model)
+    index = 0
+    while True:
+        batch = list(itertools.islice(records, chunk_size))
+        if not batch:
+            return
+        if trusted:
+            chunk = [construct(record) for record in batch]
+        else:
+            try:
+                # 묶음 전체를 한 번에 검증
+                chunk = adapter.validate_python(batch)
+            except ValidationError as e:
+                raise _record_error(e, file_path, model, index) from e
+        index += len(chunk)
+        yield chunk
+
+
+def iter_models(
+    file_path: str,
+    model: Type[ModelT],
+    chunk_size: int = 1000,
+    trusted: bool = False
+) -> Iterator[ModelT]:
+    """`iter_model_chunks()`를 모델 하나씩 펼쳐 반환"""
+    for chunk in iter_model_chunks(file_path, model, chunk_size, trusted):
+        yield from chunk
+
+
+def load_models_json(file_path: str, model: Type[ModelT]) -> List[ModelT]:
+    """
+    JSON 배열 파일 전체를 파싱 + 검증을 한 번에 처리해 로드
+
+    pydantic-core가 JSON을 직접 읽어 검증하므로 `json.load()` 후 모델을 만드는 것보다
+    빠르지만, 파일 전체를 메모리에 올리므로 작은~중간 크기 파일에 사용합니다.
+    """
+    with open(file_path, "rb") as f:
+        try:
+            return _list_adapter(model).validate_json(f.read())
+        except ValidationError as e:
+            raise _record_error(e, file_path, model, 0) from e
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[ModelT]) -> TypeAdapter:
+    return TypeAdapter(List[model])
+
+
+@lru_cache(maxsize=None)
+def trusted_constructor(model: Type[ModelT]) -> Callable[[Dict[str, Any]], ModelT]:
+    """
+    검증 없이 모델을 만드는 함수 반환
+
+    `model_construct()`는 필드마다 파이썬 코드로 기본값을 처리해 오히려 검증보다
+    느리므로(pydantic 2.x), 레코드 dict를 그대로 인스턴스 속성으로 사용합니다.
+    빠진 필드는 기본값으로 채우고 모델에 없는 키는 버립니다.
+    """
+    fields = model.model_fields
+    names = frozenset(fields)
+    new = model.__new__
+    set_attr = object.__setattr__
+
+    def construct(record: Dict[str, Any]) -> ModelT:
+        if record.keys() != names:
+            values = {name: record[name] for name in fields if name in record}
+            fields_set = set(values)
+            for name, field in fields.items():
+                if name not in values:
+                    default = field.get_default(call_default_factory=True, validated_data=values)
+                    values[name] = copy.deepcopy(default)
+            record = values
+        else:
+            fields_set = set(names)
+        instance = new(model)
+        set_attr(instance, "__dict__", record)
+        set_attr(instance, "__pydantic_fields_set__", fields_set)
+        set_attr(instance, "__pydantic_extra__", None)
+        set_attr(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+def _record_error(error: ValidationError, file_path: str, model: Type[BaseModel], offset: int) -> ValueError:
+    """묶음 검증 오류를 파일 안의 레코드 번호가 담긴 오류로 변환"""
+    loc = error.errors()[0].get("loc") or ()
+    where = f"{offset + loc[0] + 1}번째 " if loc and isinstance(loc[0], int) else ""
+    return ValueError(f"{file_path}의 {where}{model.__name__} 레코드가 올바르지 않습니다: {error}")
@@ -0,0 +1,411 @@
+"""
+매칭 HTTP API 서버 (표준 라이브러리 asyncio)
+
+프로세스에 하나뿐인 워밍된 `MatchingService`를 HTTP/1.1(keep-alive)로 노출합니다.
+
+- `POST /match`: `{"mentor": {...}, "mentee": {...}, "top_k": 5}` → 추천 목록
+- `POST /match/bulk`: `{"mentors": [...], "mentees": [...], "top_k": 5}` → 쌍별 추천 목록
+- `GET /programs?offset=0&limit=50`, `GET /programs/{program_id}`: 카탈로그 조회
+- `POST /programs/reload`: 프로그램 파일 변경분 반영 (`CatalogWatcher`)
+- `GET /health`, `GET /metrics` (Prometheus 텍스트 형식)
+
+규칙 기반 `/match` 요청은 `MicroBatcher`로 짧은 시간 동안 모아
+`MatchingService.find_matches_batch()` 한 번으로 처리하며, 서비스는 전용 스레드
+하나에서만 호출됩니다. AI 모드에서는 비동기 클라이언트로 바로 호출하고, 규칙 기반
+채점 / 대체 추천은 서비스가 스레드 풀에서 실행합니다. 워밍업 / 카탈로그 재적재처럼
+오래 걸리는 서비스 호출은 모드와 관계없이 전용 스레드에서 실행합니다.
+
+과부하 보호:
+- 동시 연결 수가 `max_connections`를 넘으면 새 연결에 503으로 응답하고 닫음
+- 대기 + 처리 중 요청이 `max_pending`을 넘으면 503 + `Retry-After`로 즉시 거절
+- 본문 크기(`max_body_bytes`)와 대량 매칭 쌍 수(`max_bulk_pairs`) 제한
+"""
+
+import asyncio
+import json
+import logging
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from pydantic import BaseModel, Field, ValidationError
+
+from models import Mentor, Mentee
+from services.matching_service import MatchingService
+from services.metrics import PrometheusSink
+from services.micro_batch import MicroBatcher, Overloaded
+from services.schedule import pair_days
+
+if TYPE_CHECKING:
+    from services.catalog_watcher import CatalogWatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+# 대량 매칭을 전용 스레드에 나눠 넣을 멘토 수 (사이사이에 /match 배치가 실행됨)
+BULK_MENTORS_PER_CHUNK = 4
+
+
+class MatchRequest(BaseModel):
+    """`POST /match` 본문"""
+
+    mentor: Mentor
+    mentee: Mentee
+    top_k: int = Field(default=5, ge=1, le=50)
+
+
+class BulkMatchRequest(BaseModel):
+    """`POST /match/bulk` 본문"""
+
+    mentors: List[Mentor]
+    mentees: List[Mentee]
+    top_k: int = Field(default=5, ge=1, le=50)
+
+
+class HTTPError(Exception):
+    """상태 코드와 함께 응답할 오류"""
+
+    def __init__(self, status: int, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.headers = headers or {}
+
+
+class Request(NamedTuple):
+    method: str
+    path: str
+    version: str
+    query: Dict[str, List[str]]
+    headers: Dict[str, str]
+    body: bytes
+
+
+class Response(NamedTuple):
+    status: int
+    body: bytes
+    content_type: str = "application/json; charset=utf-8"
+    headers: Dict[str, str] = {}
+
+
+def json_response(data: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(status, json.dumps(data, ensure_ascii=False).encode("utf-8"), headers=headers or {})
+
+
+class MatchingServer:
+    """워밍된 MatchingService 하나를 공유하는 asyncio HTTP 서버"""
+
+    def __init__(
+        self,
+        service: MatchingService,
+        watcher: Optional["CatalogWatcher"] = None,
+        max_connections: int = 512,
+        max_pending: int = 256,
+        max_batch: int = 32,
+        batch_wait: float = 0.002,
+        max_body_bytes: int = 1 << 20,
+        max_bulk_pairs: int = 10_000,
+        idle_timeout: float = 30.0
+    ):
+        """
+        Args:
+            service: 프로그램이 로드된 매칭 서비스
+            watcher: `/programs/reload`에 쓸 카탈로그 감시기 (None이면 엔드포인트 비활성화)
+            max_connections: 동시 연결 수 한도
+            max_pending: 대기 + 처리 중인 매칭 요청 수 한도 (넘으면 503)
+            max_batch: 마이크로 배치 하나에 담을 최대 요청 수
+            batch_wait: 배치를 채우려고 기다리는 최대 시간 (초)
+            max_body_bytes: 요청 본문 최대 크기
+            max_bulk_pairs: `/match/bulk` 요청 하나의 최대 (멘토 × 멘티) 쌍 수
+            idle_timeout: keep-alive 연결이 다음 요청을 기다리는 최대 시간 (초)
+        """
+        self.service = service
+        self.watcher = watcher
+        self.max_connections = max_connections
+        self.max_pending = max_pending
+        self.max_body_bytes = max_body_bytes
+        self.max_bulk_pairs = max_bulk_pairs
+        self.idle_timeout = idle_timeout
+
+        self.prometheus = service.metrics.add_sink(PrometheusSink())
+        self.batcher = MicroBatcher(
+            self._match_batch, max_batch=max_batch, max_wait=batch_wait, max_pending=max_pending
+        )
+        self.connections = 0
+        self._inflight = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+        self._routes: Dict[Tuple[str, str], Callable[[Request], Awaitable[Response]]] = {
+            ("GET", "/health"): self._health,
+            ("GET", "/metrics"): self._metrics,
+            ("POST", "/match"): self._match,
+            ("POST", "/match/bulk"): self._match_bulk,
+            ("GET", "/programs"): self._list_programs,
+            ("POST", "/programs/reload"): self._reload_programs,
+        }
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8080) -> asyncio.AbstractServer:
+        """서버 시작 (포트 0이면 빈 포트 사용, `sockets`로 확인)"""
+        # 첫 요청이 지연 초기화 비용을 내지 않도록 컬럼 엔진 / 인덱스를 미리 구성
+        if self.service.programs and self.service.vectorized:
+            await self._backend(self.service._get_columns)
+        self._server = await asyncio.start_server(self._handle_connection, host, port)
+        return self._server
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.close()
+        if self.service.ai_service is not None:
+            await self.service.ai_service.aclose()
+
+    # ---- 연결 / HTTP 처리 ----
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self.connections >= self.max_connections:
+            await self._write(writer, self._error(HTTPError(503, "동시 연결 수 한도를 넘었습니다.")), False)
+            writer.close()
+            return
+
+        self.connections += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request = await asyncio.wait_for(self._read_request(reader), self.idle_timeout)
+                except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError):
+                    break
+                except HTTPError as e:
+                    await self._write(writer, self._error(e), False)
+                    break
+
+                keep_alive = _wants_keep_alive(request)
+                response = await self._dispatch(request)
+                await self._write(writer, response, keep_alive)
+        finally:
+            self.connections -= 1
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader) -> Request:
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except asyncio.LimitOverrunError:
+            raise HTTPError(431, "요청 헤더가 너무 깁니다.")
+
+        lines = head.decode("latin-1").split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "잘못된 요청 줄입니다.")
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+
+        if "transfer-encoding" in headers:
+            raise HTTPError(411, "Content-Length가 필요합니다 (chunked 본문은 지원하지 않음).")
+        try:
+            length = int(headers.get("content-length", "0"))
+        except ValueError:
+            raise HTTPError(400, "잘못된 Content-Length입니다.")
+        if length > self.max_body_bytes:
+            raise HTTPError(413, f"요청 본문이 {self.max_body_bytes:,}바이트를 넘습니다.")
+        body = await reader.readexactly(length) if length else b""
+
+        url = urlsplit(target)
+        return Request(method.upper(), unquote(url.path), version, parse_qs(url.query), headers, body)
+
+    async def _dispatch(self, request: Request) -> Response:
+        handler = self._routes.get((request.method, request.path))
+        if handler is None and request.method == "GET" and request.path.startswith("/programs/"):
+            handler = self._get_program
+        try:
+            if handler is None:
+                if any(path == request.path for _, path in self._routes):
+                    raise HTTPError(405, f"{request.method} 메서드는 지원하지 않습니다.")
+                raise HTTPError(404, f"{request.path} 경로가 없습니다.")
+            return await handler(request)
+        except HTTPError as e:
+            return self._error(e)
+        except ValidationError as e:
+            return json_response(
+                {"error": "요청 본문 검증에 실패했습니다.", "details": e.errors(include_url=False, include_context=False, include_input=False)},
+                status=422
+            )
+        except Overloaded as e:
+            return self._error(HTTPError(503, f"서버가 바쁩니다: {e}", {"Retry-After": "1"}))
+        except ValueError as e:
+            return self._error(HTTPError(400, str(e)))
+        except Exception:
+            logger.exception("❌ %s %s 처리 중 오류 발생", request.method, request.path)
+            return self._error(HTTPError(500, "서버 내부 오류가 발생했습니다."))
+
+    async def _write(self, writer: asyncio.StreamWriter, response: Response, keep_alive: bool) -> None:
+        status = HTTPStatus(response.status)
+        head = [
+            f"HTTP/1.1 {status.value} {status.phrase}",
+            f"Content-Type: {response.content_type}",
+            f"Content-Length: {len(response.body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        ]
+        head.extend(f"{name}: {value}" for name, value in response.headers.items())
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + response.body)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+
+    def _error(self, error: HTTPError) -> Response:
+        return json_response({"error": error.message}, status=error.status, headers=error.headers)
+
+    # ---- 백엔드 호출 ----
+
+    async def _backend(self, func: Callable[..., Any], *args: Any) -> Any:
+        """서비스 호출을 전용 스레드에서 실행 (이벤트 루프를 막지 않도록 AI 모드에서도 같은 스레드 사용)"""
+        return await self.batcher.run_exclusive(func, *args)
+
+    def _match_batch(self, requests: List[MatchRequest]) -> List[List[Any]]:
+        """마이크로 배치 하나 처리 (전용 스레드)"""
+        return self.service.find_matches_batch(
+            [(request.mentor, request.mentee) for request in requests],
+            [request.top_k for request in requests]
+        )
+
+    def _admit(self) -> None:
+        if self._inflight >= self.max_pending:
+            raise Overloaded(f"처리 중인 요청이 {self._inflight}개입니다.")
+        self._inflight += 1
+
+    # ---- 엔드포인트 ----
+
+    async def _health(self, request: Request) -> Response:
+        health = {
+            "status": "ok",
+            "mode": "ai" if self.service.use_ai else "rule_based",
+            "programs": len(self.service.programs),
+            "catalog_version": self.service.catalog_version,
+            "connections": self.connections,
+            "pending": self.batcher.pending + self._inflight,
+        }
+        if self.service.use_ai:
+            health["ai_circuit"] = self.service.ai_service.breaker.state
+        return json_response(health)
+
+    async def _metrics(self, request: Request) -> Response:
+        return Response(200, self.prometheus.render().encode("utf-8"), "text/plain; version=0.0.4; charset=utf-8")
+
+    async def _match(self, request: Request) -> Response:
+        body = MatchRequest.model_validate_json(request.body or b"{}")
+        if self.service.use_ai:
+            self._admit()
+            try:
+                recommendations = await self.service.find_matches_async(body.mentor, body.mentee, body.top_k)
+            finally:
+                self._inflight -= 1
+        else:
+            recommendations = await self.batcher.submit(body)
+        return json_response({"recommendations": [rec.model_dump(mode="json") for rec in recommendations]})
+
+    async def _match_bulk(self, request: Request) -> Response:
+        body = BulkMatchRequest.model_validate_json(request.body or b"{}")
+        pairs = len(body.mentors) * len(body.mentees)
+        if pairs > self.max_bulk_pairs:
+            raise HTTPError(413, f"쌍 수({pairs:,})가 한도({self.max_bulk_pairs:,})를 넘습니다.")
+
+        self._admit()
+        try:
+            if self.service.use_ai:
+                matches = await self._bulk_ai(body)
+            else:
+                matches = []
+                for start in range(0, len(body.mentors), BULK_MENTORS_PER_CHUNK):
+                    chunk = body.mentors[start:start + BULK_MENTORS_PER_CHUNK]
+                    results = await self.batcher.run_exclusive(
+                        lambda: list(self.service.find_matches_bulk(chunk, body.mentees, body.top_k))
+                    )
+                    matches.extend(
+                        (start + match.mentor_index, match.mentee_index, match.recommendations)
+                        for match in results
+                    )
+        finally:
+            self._inflight -= 1
+
+        return json_response({
+            "pairs": pairs,
+            "matches": [
+                {
+                    "mentor_index": mentor_index,
+                    "mentee_index": mentee_index,
+                    "recommendations": [rec.model_dump(mode="json") for rec in recommendations],
+                }
+                for mentor_index, mentee_index, recommendations in matches
+            ],
+        })
+
+    async def _bulk_ai(self, body: BulkMatchRequest) -> List[Tuple[int, int, list]]:
+        """AI 모드 대량 매칭: 함께 가능한 요일이 있는 쌍만 동시에 요청"""
+        pairs = [
+            (i, j, mentor, mentee)
+            for i, mentor in enumerate(body.mentors)
+            for j, mentee in enumerate(body.mentees)
+            if pair_days(mentor, mentee)
+        ]
+        results = await self.service.find_matches_many_async(
+            [(mentor, mentee) for _, _, mentor, mentee in pairs], body.top_k
+        )
+        return [(i, j, recommendations) for (i, j, _, _), recommendations in zip(pairs, results)]
+
+    async def _list_programs(self, request: Request) -> Response:
+        try:
+            offset = max(0, int(request.query.get("offset", ["0"])[0]))
+            limit = min(500, max(1, int(request.query.get("limit", ["50"])[0])))
+        except ValueError:
+            raise HTTPError(400, "offset / limit은 정수여야 합니다.")
+        programs = self.service.programs
+        page = [programs[pos] for pos in range(offset, min(offset + limit, len(programs)))]
+        return json_response({
+            "total": len(programs),
+            "offset": offset,
+            "programs": [program.model_dump(mode="json") for program in page],
+        })
+
+    async def _get_program(self, request: Request) -> Response:
+        program_id = request.path[len("/programs/"):]
+        program = self.service.index.get(program_id)
+        if program is None:
+            raise HTTPError(404, f"프로그램을 찾을 수 없습니다: {program_id}")
+        return json_response(program.model_dump(mode="json"))
+
+    async def _reload_programs(self, request: Request) -> Response:
+        if self.watcher is None:
+            raise HTTPError(404, "카탈로그 파일 감시가 설정되지 않았습니다.")
+        diff = await self._backend(self.watcher.check)
+        return json_response({
+            "changed": diff is not None,
+            "summary": diff.summary() if diff is not None else None,
+            "catalog_version": self.service.catalog_version,
+            "programs": len(self.service.programs),
+        })
+
+
+def _wants_keep_alive(request: Request) -> bool:
+    connection = request.headers.get("connection", "").lower()
+    if request.version == "HTTP/1.0":
+        return connection == "keep-alive"
+    return connection != "close"
+
+
+async def serve(server: MatchingServer, host: str, port: int) -> None:
+    """서버를 시작하고 취소될 때까지 실행"""
+    listener = await server.start(host, port)
+    addresses = ", ".join(str(sock.getsockname()) for sock in listener.sockets)
+    logger.info("🌐 매칭 API 서버 시작: %s", addresses)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.close()
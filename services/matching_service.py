@@ -2,98 +2,405 @@
 멘토링 매칭 서비스 (규칙 기반 + AI 기반)
 """
 
-import json
+import asyncio
+import concurrent.futures
+import heapq
+import logging
 import os
-from typing import List, Set, Optional
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, Set, Optional, Sequence, Tuple, Union
 from pathlib import Path
 
+import numpy as np
+
 from models import Mentor, Mentee, MentoringProgram
 from models.program import RecommendedProgram
+from services.circuit_breaker import CircuitOpenError
+from services.data_loader import iter_models
+from services.metrics import Metrics
+from services.program_index import CatalogDiff, ProgramIndex
+from services.reasons import ReasonCode, render_reasons, to_match_reasons
+from services.snapshot import is_snapshot, open_snapshot
+from services.regions import REGIONS, region_of
+from services.schedule import (
+    decode_days, encode_days, pair_days, program_days, schedule_points, snapshot_program_days
+)
+from services.scoring_engine import ProfileFeatures, ProgramColumns, select_top_k
+
+if TYPE_CHECKING:
+    from services.parallel_scoring import ShardedScorer
+
+
+logger = logging.getLogger(__name__)
+
+
+# 멀티 프로세스로 나눌 최소 후보 수 (이보다 적으면 프로세스 간 통신 비용이 더 큼)
+PARALLEL_MIN_CANDIDATES = 20_000
+
+# AI 배치 모드: 한 번에 준비하는 프롬프트 수 (이 범위의 쌍들이 같은 카탈로그 접두부를 공유)
+AI_BATCH_WINDOW_PROMPTS = 4
+
+# AI 배치 모드: 카탈로그가 이 크기 이하면 전체를 접두부에 넣어 작업 내내 같은 접두부 사용
+AI_BATCH_FULL_CATALOG = 200
+
+
+class BulkMatch(NamedTuple):
+    """대량 매칭 결과 한 건 (멘토 × 멘티 쌍)"""
+    
+    mentor_index: int
+    mentor: Mentor
+    mentee_index: int
+    mentee: Mentee
+    recommendations: List[RecommendedProgram]
+
+
+class _Catalog:
+    """
+    한 시점의 카탈로그 (인덱스 + 컬럼 엔진 + 멀티 프로세스 채점기)
+    
+    만든 뒤에는 바뀌지 않습니다. 요청은 시작할 때 현재 카탈로그를 한 번 잡아 끝까지 사용하고,
+    카탈로그 변경은 사본을 고쳐 `MatchingService._catalog`를 한 번에 교체합니다 (copy-on-write).
+    교체된 카탈로그의 워커 프로세스는 그 카탈로그를 쓰던 마지막 요청이 끝날 때 종료합니다.
+    """
+    
+    def __init__(self, index: ProgramIndex, columns: Optional[ProgramColumns] = None):
+        self.index = index
+        self.columns = columns
+        self._scorer: Optional["ShardedScorer"] = None
+        self._readers = 0
+        self._retired = False
+        self._lock = threading.Lock()
+    
+    @property
+    def programs(self) -> Sequence[MentoringProgram]:
+        return self.index.programs
+    
+    def get_columns(self) -> ProgramColumns:
+        """컬럼 엔진 반환 (처음 필요할 때 한 번만 구성)"""
+        if self.columns is None:
+            with self._lock:
+                if self.columns is None:
+                    self.columns = ProgramColumns(self.index.programs)
+        return self.columns
+    
+    def get_scorer(self, workers: int, vectorized: bool, local_only: bool) -> "ShardedScorer":
+        """멀티 프로세스 채점기 반환 (처음 필요할 때 워커 시작)"""
+        with self._lock:
+            if self._scorer is None:
+                from services.parallel_scoring import ShardedScorer
+                self._scorer = ShardedScorer(self.programs, workers, vectorized, local_only)
+            return self._scorer
+    
+    def acquire(self) -> "_Catalog":
+        with self._lock:
+            self._readers += 1
+        return self
+    
+    def release(self) -> None:
+        with self._lock:
+            self._readers -= 1
+            scorer = self._take_scorer(idle_only=True)
+        if scorer is not None:
+            scorer.close()
+    
+    def retire(self) -> None:
+        """교체된 카탈로그로 표시 (사용 중인 요청이 없으면 워커를 바로 종료)"""
+        with self._lock:
+            self._retired = True
+            scorer = self._take_scorer(idle_only=True)
+        if scorer is not None:
+            scorer.close()
+    
+    def close_scorer(self) -> None:
+        with self._lock:
+            scorer = self._take_scorer(idle_only=False)
+        if scorer is not None:
+            scorer.close()
+    
+    def _take_scorer(self, idle_only: bool) -> Optional["ShardedScorer"]:
+        if idle_only and (not self._retired or self._readers):
+            return None
+        scorer, self._scorer = self._scorer, None
+        return scorer
 
 
 class MatchingService:
     """멘토링 매칭 서비스 (규칙 기반 + AI 기반)"""
     
-    def __init__(self, use_ai: bool = False):
+    def __init__(
+        self,
+        use_ai: bool = False,
+        vectorized: bool = True,
+        workers: int = 0,
+        ai_shortlist_size: int = 30,
+        local_only: bool = False,
+        metrics: Optional[Metrics] = None,
+        ai_batch_size: int = 1,
+        ai_latency_budget: Optional[float] = None
+    ):
         """
         Args:
             use_ai: True면 Azure OpenAI 사용, False면 규칙 기반 사용
+            vectorized: True면 규칙 기반 점수를 컬럼 엔진(NumPy)으로 일괄 계산
+            workers: 2 이상이면 규칙 기반 점수 계산을 여러 프로세스로 나눠 실행
+            ai_shortlist_size: AI 모드에서 규칙 기반 점수로 미리 골라 모델에 보낼 프로그램 수
+                (0이면 예산 내 프로그램을 모두 전달)
+            local_only: True면 멘토 또는 멘티와 같은 생활권(시/도 ⊃ 시/군/구)이거나
+                지역 제약이 없는 프로그램만 추천 (지역 인덱스로 후보를 미리 거름)
+            metrics: 단계별 시간 / 카운터를 받을 계측 객체 (None이면 싱크 없는 빈 계측)
+            ai_batch_size: AI 모드 대량 매칭에서 프롬프트 하나에 묶을 쌍 수 (1이면 쌍마다 호출)
+            ai_latency_budget: AI 모드 요청당 지연 예산 (초). 주면 AI 호출 중에 규칙 기반 추천을
+                함께 계산해 두고, 예산 안에 AI 응답이 없으면 규칙 기반 결과를 반환 (None이면 끝까지 기다림)
         """
-        self.programs: List[MentoringProgram] = []
+        self._catalog = _Catalog(ProgramIndex())
+        # 카탈로그 교체(로드, 증분 반영)를 한 번에 하나씩 처리
+        self._write_lock = threading.Lock()
+        # 아직 반영하지 않은 추가 프로그램 (다음 조회 / 변경 때 사본 하나로 한꺼번에 반영)
+        self._pending_adds: List[MentoringProgram] = []
         self.use_ai = use_ai
+        self.vectorized = vectorized
         self.ai_service = None
+        self.workers = workers
+        self.ai_shortlist_size = ai_shortlist_size
+        self.local_only = local_only
+        self.ai_batch_size = ai_batch_size
+        self.ai_latency_budget = ai_latency_budget
+        self._hedge_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._hedge_workers = 0
+        self._hedge_calls = 0  # 지연 예산용 스레드 풀에서 진행 중인 AI 호출 수
+        self._hedge_lock = threading.Lock()
+        self.metrics = metrics if metrics is not None else Metrics()
+        # 카탈로그가 바뀔 때마다 1씩 증가 (로드, 추가, 증분 반영)
+        self.catalog_version = 0
         
         # AI 모드면 Azure OpenAI 서비스 초기화
         if use_ai:
             try:
                 from services.azure_openai_service import AzureOpenAIService
-                self.ai_service = AzureOpenAIService()
-                print("✅ Azure OpenAI 모드 활성화")
+                self.ai_service = AzureOpenAIService(metrics=self.metrics)
+                logger.info("✅ Azure OpenAI 모드 활성화")
             except Exception as e:
-                print(f"⚠️  Azure OpenAI 초기화 실패: {e}")
-                print("📌 규칙 기반 모드로 전환합니다.")
+                logger.warning("⚠️  Azure OpenAI 초기화 실패: %s", e)
+                logger.warning("📌 규칙 기반 모드로 전환합니다.")
                 self.use_ai = False
     
-    def load_programs_from_file(self, file_path: str):
-        """JSON 파일에서 프로그램 목록 로드"""
+    def load_programs_from_file(self, file_path: str, trusted: bool = False):
+        """
+        JSON 배열 / JSON Lines / 바이너리 스냅샷 파일에서 프로그램 목록 로드
+        
+        Args:
+            file_path: 프로그램 파일 경로
+            trusted: True면 이미 검증된 파일로 보고 Pydantic 검증을 건너뜀
+        """
         path = Path(file_path)
         if not path.exists():
             raise FileNotFoundError(f"프로그램 파일을 찾을 수 없습니다: {file_path}")
         
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.programs = [MentoringProgram(**program) for program in data]
+        if is_snapshot(str(path)):
+            catalog = self._load_snapshot(str(path))
+        else:
+            # dict 목록 전체를 만들지 않고 레코드를 읽는 대로 모델로 변환
+            index = ProgramIndex(iter_models(str(path), MentoringProgram, trusted=trusted))
+            # 컬럼 엔진은 로드 시점에 한 번만 구성
+            catalog = _Catalog(index, ProgramColumns(index.programs) if self.vectorized else None)
+        
+        with self._write_lock:
+            self._pending_adds.clear()
+            self._swap_catalog(catalog)
         
-        print(f"✅ {len(self.programs)}개의 프로그램을 로드했습니다.")
+        logger.info("✅ %d개의 프로그램을 로드했습니다.", len(catalog.programs))
+    
+    def _load_snapshot(self, file_path: str) -> _Catalog:
+        """
+        바이너리 스냅샷에서 인덱스와 컬럼 엔진을 바로 구성
+        
+        JSON 파싱과 검증 없이 비용/지역/키워드/직군 컬럼만 읽으며,
+        MentoringProgram 객체는 추천 결과로 반환될 때 처음 만들어집니다.
+        """
+        snapshot = open_snapshot(file_path, MentoringProgram)
+        index = ProgramIndex.from_columns(
+            snapshot.models(),
+            snapshot.column("estimated_cost"),
+            lambda: snapshot.string_values("program_id"),
+            lambda: snapshot.string_values("location"),
+            lambda: snapshot_program_days(snapshot),
+        )
+        return _Catalog(index, ProgramColumns.from_snapshot(snapshot) if self.vectorized else None)
+    
+    @property
+    def index(self) -> ProgramIndex:
+        """현재 카탈로그 인덱스 (교체된 뒤에도 이전 인덱스는 바뀌지 않음)"""
+        return self._current().index
+    
+    @property
+    def programs(self) -> Sequence[MentoringProgram]:
+        """카탈로그 순서의 프로그램 목록 (스냅샷이면 접근할 때 만들어지는 지연 목록)"""
+        return self._current().programs
+    
+    @programs.setter
+    def programs(self, programs: List[MentoringProgram]):
+        with self._write_lock:
+            self._pending_adds.clear()
+            self._swap_catalog(_Catalog(ProgramIndex(programs)))
     
     def add_program(self, program: MentoringProgram):
-        """프로그램 추가"""
-        self.programs.append(program)
+        """프로그램 추가 (`add_programs` 참고)"""
+        self.add_programs([program])
+    
+    def add_programs(self, programs: Iterable[MentoringProgram]):
+        """
+        프로그램 여러 개 추가
+        
+        추가분은 모아 두었다가 다음 조회(추천 요청, `programs` / `index` 접근)나 다음 변경 때
+        카탈로그 사본 하나에 한꺼번에 반영합니다. 연속으로 추가해도 추가마다 카탈로그 전체를
+        복사하지 않습니다.
+        """
+        with self._write_lock:
+            self._pending_adds.extend(programs)
+    
+    def apply_catalog_diff(self, diff: CatalogDiff) -> int:
+        """
+        카탈로그 변경분을 인덱스와 컬럼 엔진의 사본에 반영하고 한 번에 교체
+        
+        바뀐 프로그램의 행만 다시 계산하므로 전체 카탈로그를 다시 읽거나
+        다시 구성하지 않습니다. 변경된 프로그램은 같은 위치에 남고, 삭제된
+        프로그램 뒤의 위치는 앞으로 당겨지며, 새 프로그램은 끝에 추가됩니다.
+        진행 중인 요청은 교체 전 카탈로그로 끝까지 처리됩니다.
+        
+        Args:
+            diff: `diff_programs()`로 만든 변경분
+        
+        Returns:
+            반영 후 카탈로그 버전
+        """
+        with self._write_lock:
+            return self._apply_diff(diff)
+    
+    def _apply_diff(self, diff: CatalogDiff) -> int:
+        """모아 둔 추가분과 `diff`를 사본에 반영하고 교체 (`_write_lock`을 잡고 호출)"""
+        if not (diff or self._pending_adds):
+            return self.catalog_version
+        
+        current = self._catalog
+        index = current.index.copy()
+        columns = current.columns.copy() if current.columns is not None else None
+        
+        # 먼저 추가된 프로그램이 앞 위치를 갖도록 모아 둔 추가분부터 반영
+        pending, self._pending_adds = self._pending_adds, []
+        index.extend(pending)
+        if columns is not None and pending:
+            columns.append(pending)
+        
+        added = list(diff.added)
+        for program in diff.updated:
+            pos = index.position_of(program.program_id)
+            if pos is None:
+                added.append(program)
+                continue
+            index.replace(pos, program)
+            if columns is not None:
+                columns.replace(pos, program)
+        
+        removed = [index.position_of(program_id) for program_id in diff.removed]
+        removed = [pos for pos in removed if pos is not None]
+        if removed:
+            index.remove(removed)
+            if columns is not None:
+                columns.remove(removed)
+        
+        index.extend(added)
+        if columns is not None and added:
+            columns.append(added)
+        
+        self._swap_catalog(_Catalog(index, columns))
+        return self.catalog_version
+    
+    def _swap_catalog(self, catalog: _Catalog) -> None:
+        """현재 카탈로그를 한 번에 교체 (`_write_lock`을 잡고 호출)"""
+        previous, self._catalog = self._catalog, catalog
+        self.catalog_version += 1
+        # 이전 카탈로그의 워커 프로세스는 그 카탈로그를 쓰던 요청이 모두 끝나면 종료
+        previous.retire()
+    
+    def _current(self) -> _Catalog:
+        """현재 카탈로그 (모아 둔 추가분이 있으면 먼저 반영)"""
+        if self._pending_adds:
+            with self._write_lock:
+                self._apply_diff(CatalogDiff())
+        return self._catalog
+    
+    @contextmanager
+    def _reading(self) -> Iterator[_Catalog]:
+        """요청 하나가 끝날 때까지 사용할 카탈로그 (도중에 교체되어도 그대로 유지)"""
+        catalog = self._current().acquire()
+        try:
+            yield catalog
+        finally:
+            catalog.release()
+    
+    def _get_columns(self) -> ProgramColumns:
+        """현재 카탈로그의 컬럼 엔진 반환 (처음 필요할 때 구성)"""
+        return self._current().get_columns()
     
     def _calculate_match_score(
         self,
         program: MentoringProgram,
         mentor: Mentor,
-        mentee: Mentee
-    ) -> tuple[float, str]:
+        mentee: Mentee,
+        with_reason: bool = True
+    ) -> tuple[float, Optional[List[ReasonCode]]]:
         """
         프로그램의 매칭 점수 계산 (규칙 기반)
         
+        추천 이유는 문장 대신 이유 코드(`ReasonCode`)로만 기록하고, 문장은
+        반환할 추천 결과를 만들 때 `render_reasons()`로 렌더링합니다.
+        
+        Args:
+            with_reason: False면 점수만 계산 (추천 이유 코드를 기록하지 않음)
+        
         Returns:
-            (점수, 추천 이유)
+            (점수, 추천 이유 코드 목록 또는 None)
         """
         score = 0.0
-        reasons = []
-        
-        # 1. 지역 매칭 (30점)
-        if program.location in mentor.location or program.location in mentee.location:
-            score += 30
-            reasons.append(f"✓ 지역이 적합합니다 ({program.location})")
-        elif "전역" in program.location:
-            score += 25
-            reasons.append(f"✓ 지역 제약이 없습니다")
+        reasons: List[ReasonCode] = []
+        
+        def add(code: str, points: float, **params) -> None:
+            nonlocal score
+            score += points
+            if with_reason:
+                reasons.append(ReasonCode(code, points, params))
+        
+        # 1. 지역 매칭 (25점) - 시/도 ⊃ 시/군/구 계층 기준
+        program_region = region_of(program.location)
+        if (
+            REGIONS.compatible(program_region, region_of(mentor.location))
+            or REGIONS.compatible(program_region, region_of(mentee.location))
+        ):
+            add("location.match", 25, location=program.location)
+        elif REGIONS.is_nationwide(program_region):
+            add("location.nationwide", 20)
         else:
-            score += 10
-            reasons.append(f"△ 지역이 다소 다릅니다")
+            add("location.other", 5)
         
         # 2. 예산 적합성 (25점)
         if program.estimated_cost <= mentee.budget_limit:
             # 예산 대비 비용이 적절할수록 높은 점수
-            budget_ratio = program.estimated_cost / mentee.budget_limit
+            budget_ratio = (
+                program.estimated_cost / mentee.budget_limit if mentee.budget_limit else 0.0
+            )
             if budget_ratio <= 0.5:
-                score += 25
-                reasons.append(f"✓ 예산 대비 매우 저렴합니다 ({program.estimated_cost:,}원)")
+                add("budget.cheap", 25, cost=program.estimated_cost)
             elif budget_ratio <= 0.8:
-                score += 20
-                reasons.append(f"✓ 예산 범위 내 적정 가격입니다 ({program.estimated_cost:,}원)")
+                add("budget.fair", 20, cost=program.estimated_cost)
             else:
-                score += 15
-                reasons.append(f"✓ 예산 내에서 가능합니다 ({program.estimated_cost:,}원)")
+                add("budget.within", 15, cost=program.estimated_cost)
         
         # 3. 관심사 일치도 (30점)
-        mentor_interests = set(mentor.interests)
+        # 추천 이유에 나열되는 관심사가 실행마다 같도록 입력 순서(멘토 → 멘티)를 유지
         mentee_interests = set(mentee.interests)
-        common_interests = mentor_interests & mentee_interests
+        common_interests = [i for i in dict.fromkeys(mentor.interests) if i in mentee_interests]
         
         # 프로그램의 활동 유형과 관심사 매칭
         activity_keywords = program.activity_type.lower() + " " + " ".join(program.tags).lower()
@@ -106,21 +413,17 @@ class MatchingService:
                 matching_interests.append(interest)
         
         if matching_interests:
-            score += 30
-            reasons.append(f"✓ 공통 관심사와 일치합니다: {', '.join(matching_interests)}")
+            add("interest.match", 30, interests=matching_interests)
         elif common_interests:
-            score += 20
-            reasons.append(f"✓ 멘토와 멘티의 공통 관심사가 있습니다: {', '.join(list(common_interests)[:2])}")
+            add("interest.common", 20, interests=common_interests[:2])
         else:
             # 개별 관심사라도 매칭되는지 확인
-            all_interests = mentor_interests | mentee_interests
+            all_interests = dict.fromkeys(mentor.interests + mentee.interests)
             matched = [i for i in all_interests if i.lower() in activity_keywords]
             if matched:
-                score += 15
-                reasons.append(f"△ 일부 관심사와 연관됩니다: {', '.join(matched[:2])}")
+                add("interest.partial", 15, interests=matched[:2])
             else:
-                score += 5
-                reasons.append(f"△ 새로운 경험이 될 수 있습니다")
+                add("interest.new", 5)
         
         # 4. 직무 적합성 (15점)
         job_match = False
@@ -130,17 +433,26 @@ class MatchingService:
                 break
         
         if job_match or "모든 직군" in program.recommended_for:
-            score += 15
-            reasons.append(f"✓ 직무에 적합한 활동입니다")
+            add("job.match", 15)
         else:
-            score += 8
-            reasons.append(f"△ 모든 직군에 열려있습니다")
+            add("job.open", 8)
+        
+        # 5. 일정 적합성 (5점) - 함께 가능한 요일 중 프로그램이 진행되는 비율
+        days = pair_days(mentor, mentee)
+        points = schedule_points(days, program_days(program))
+        if program.available_days and days:
+            common = decode_days(days & program_days(program))
+            if common:
+                add("schedule.match", points, days=common)
+            else:
+                add("schedule.miss", points)
+        else:
+            score += points
         
         # 점수 정규화 (0-100)
         final_score = min(100, score)
-        reason_text = " | ".join(reasons)
         
-        return final_score, reason_text
+        return final_score, reasons if with_reason else None
     
     def find_matches(
         self,
@@ -160,116 +472,718 @@ class MatchingService:
             추천된 프로그램 목록 (점수 순으로 정렬)
         """
         
-        if not self.programs:
-            raise ValueError("추천할 프로그램이 없습니다. 먼저 프로그램을 로드해주세요.")
+        with self._reading() as catalog:
+            if not catalog.programs:
+                raise ValueError("추천할 프로그램이 없습니다. 먼저 프로그램을 로드해주세요.")
+            
+            self.metrics.count("requests")
+            
+            # AI 모드 vs 규칙 기반 모드
+            if self.use_ai and self.ai_service:
+                return self._find_matches_ai(catalog, mentor, mentee, top_k)
+            else:
+                return self._find_matches_rule_based(catalog, mentor, mentee, top_k)
+    
+    def find_matches_bulk(
+        self,
+        mentors: Iterable[Mentor],
+        mentees: Iterable[Mentee],
+        top_k: int = 5
+    ) -> Iterator[BulkMatch]:
+        """
+        모든 멘토 × 멘티 쌍에 대한 추천을 차례로 생성 (스트리밍)
         
-        # AI 모드 vs 규칙 기반 모드
-        if self.use_ai and self.ai_service:
-            return self._find_matches_ai(mentor, mentee, top_k)
-        else:
-            return self._find_matches_rule_based(mentor, mentee, top_k)
+        멘토/멘티별 특징과 멘티별 예산 내 프로그램은 한 번만 계산하며,
+        결과는 쌍마다 바로 반환되므로 전체 표를 메모리에 들고 있지 않습니다.
+        함께 가능한 요일이 없는 쌍은 프로그램을 채점하기 전에 건너뜁니다 (결과에 포함되지 않음).
+        
+        Args:
+            mentors: 멘토 목록 (한 번만 순회)
+            mentees: 멘티 목록
+            top_k: 쌍마다 추천할 프로그램 개수
+        
+        Yields:
+            BulkMatch (멘토, 멘티, 추천 프로그램 목록)
+        """
+        
+        with self._reading() as catalog:
+            if not catalog.programs:
+                raise ValueError("추천할 프로그램이 없습니다. 먼저 프로그램을 로드해주세요.")
+            
+            mentees = list(mentees)
+            
+            if self.use_ai and self.ai_service:
+                pairs = (
+                    (i, mentor, j, mentee)
+                    for i, mentor in enumerate(mentors)
+                    for j, mentee in enumerate(mentees)
+                    if pair_days(mentor, mentee)
+                )
+                if self.ai_batch_size > 1:
+                    yield from self._find_matches_ai_batched(catalog, pairs, top_k)
+                else:
+                    for i, mentor, j, mentee in pairs:
+                        yield BulkMatch(
+                            i, mentor, j, mentee, self._find_matches_ai(catalog, mentor, mentee, top_k)
+                        )
+                return
+            
+            if self.workers > 1:
+                pairs = self._get_scorer(catalog).select_bulk(mentors, mentees, top_k)
+            else:
+                pairs = self._bulk_winners(catalog, mentors, mentees, top_k)
+            
+            for i, mentor, j, mentee, winners in pairs:
+                yield BulkMatch(i, mentor, j, mentee, self._render(catalog, winners, mentor, mentee))
+    
+    def iter_bulk_winners(
+        self,
+        mentors: Iterable[Mentor],
+        mentees: Sequence[Mentee],
+        top_k: int,
+        start: int = 0
+    ) -> Iterator[Tuple[int, Mentor, int, Mentee, List[Tuple[int, float]]]]:
+        """
+        대량 매칭의 1단계 (점수 계산 + 상위 top_k개 선택)
+        
+        멘토/멘티별 특징과 멘티별 예산 내 프로그램은 한 번만 계산합니다.
+        
+        Yields:
+            (멘토 인덱스, 멘토, 멘티 인덱스, 멘티, [(카탈로그 위치, 점수), ...])
+        """
+        with self._reading() as catalog:
+            yield from self._bulk_winners(catalog, mentors, mentees, top_k, start)
+    
+    def _bulk_winners(
+        self,
+        catalog: _Catalog,
+        mentors: Iterable[Mentor],
+        mentees: Sequence[Mentee],
+        top_k: int,
+        start: int = 0
+    ) -> Iterator[Tuple[int, Mentor, int, Mentee, List[Tuple[int, float]]]]:
+        columns = catalog.get_columns() if self.vectorized else None
+        mentee_cache = [
+            (
+                catalog.index.affordable_positions(mentee.budget_limit),
+                columns.profile_features(mentee) if columns is not None else None,
+                encode_days(mentee.available_days)
+            )
+            for mentee in mentees
+        ]
+        
+        for i, mentor in enumerate(mentors, start):
+            mentor_days = encode_days(mentor.available_days)
+            mentor_features = None
+            for j, mentee in enumerate(mentees):
+                positions, mentee_features, mentee_days = mentee_cache[j]
+                days = mentor_days & mentee_days
+                if not days:
+                    # 함께 가능한 요일이 없는 쌍은 프로그램 채점 전에 제외
+                    continue
+                with self.metrics.stage("filter"):
+                    positions = self._filter_positions(catalog, positions, mentor, mentee, days)
+                if columns is not None and mentor_features is None:
+                    mentor_features = columns.profile_features(mentor)
+                features = (mentor_features, mentee_features) if columns is not None else None
+                winners = self._select_local(catalog, positions, mentor, mentee, top_k, features)
+                yield i, mentor, j, mentee, winners
     
     def _find_matches_ai(
         self,
+        catalog: _Catalog,
         mentor: Mentor,
         mentee: Mentee,
         top_k: int
     ) -> List[RecommendedProgram]:
         """AI 기반 추천 (Azure OpenAI)"""
         
-        print(f"\n🤖 Azure OpenAI로 {mentor.name}(멘토)와 {mentee.name}(멘티)를 분석 중...")
-        
-        # 멘티 예산 내의 프로그램만 필터링
-        affordable_programs = [
-            p for p in self.programs
-            if p.estimated_cost <= mentee.budget_limit
-        ]
-        
-        if not affordable_programs:
-            print(f"⚠️  예산({mentee.budget_limit:,}원) 내의 프로그램이 없습니다.")
+        start = time.perf_counter()
+        request = self._prepare_ai_request(catalog, mentor, mentee, top_k)
+        if request is None:
             return []
         
-        print(f"💰 예산 내 프로그램: {len(affordable_programs)}개")
+        if self.ai_latency_budget is not None:
+            return self._find_matches_ai_hedged(catalog, request, mentor, mentee, top_k, start)
         
         # Azure OpenAI API 호출
         try:
-            recommendations = self.ai_service.generate_recommendations(
-                mentor_profile=mentor.model_dump(),
-                mentee_profile=mentee.model_dump(),
-                available_programs=[p.model_dump() for p in affordable_programs],
-                top_k=min(top_k, len(affordable_programs))
-            )
+            recommendations = self.ai_service.generate_recommendations(**request)
+            return self._assemble_ai_results(catalog, recommendations)
             
-            # 결과 조합
-            results = []
-            for rec in recommendations:
-                program_id = rec.get("program_id")
-                program = next((p for p in self.programs if p.program_id == program_id), None)
+        except Exception as e:
+            return self._fallback(catalog, e, mentor, mentee, top_k)
+    
+    def _find_matches_ai_hedged(
+        self,
+        catalog: _Catalog,
+        request: dict,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int,
+        start: float
+    ) -> List[RecommendedProgram]:
+        """AI 호출을 다른 스레드로 보내고 그동안 규칙 기반 추천을 계산 (예산을 넘기면 규칙 기반 결과)"""
+        
+        future = self._submit_ai_call(request)
+        rule_based = self._find_matches_rule_based(catalog, mentor, mentee, top_k)
+        if future is None:
+            # 모든 스레드가 AI 호출 중이면 대기열에서 예산을 다 쓸 것이므로 보내지 않음
+            logger.info("⏱️  진행 중인 AI 호출이 많아 규칙 기반 추천을 반환합니다.")
+            self.metrics.count("ai_hedge_skipped")
+            return rule_based
+        remaining = self.ai_latency_budget - (time.perf_counter() - start)
+        
+        try:
+            recommendations = future.result(timeout=max(remaining, 0))
+        except concurrent.futures.TimeoutError:
+            # 아직 대기 중인 호출은 취소하고, 이미 진행 중인 호출은 끝나면 응답 캐시를 채움
+            future.cancel()
+            return self._over_budget(rule_based)
+        except Exception as e:
+            return self._fallback(catalog, e, mentor, mentee, top_k, rule_based)
+        return self._assemble_ai_results(catalog, recommendations)
+    
+    def _over_budget(self, rule_based: List[RecommendedProgram]) -> List[RecommendedProgram]:
+        logger.info(
+            "⏱️  AI 응답이 지연 예산(%.0fms)을 넘어 규칙 기반 추천을 반환합니다.", self.ai_latency_budget * 1000
+        )
+        self.metrics.count("ai_over_budget")
+        return rule_based
+    
+    def _get_hedge_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """지연 예산용 스레드 풀 (여러 스레드가 동시에 처음 요청해도 하나만 생성)"""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_workers = self.ai_service.max_concurrency
+                self._hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                    self._hedge_workers, thread_name_prefix="ai-hedge"
+                )
+            return self._hedge_executor
+    
+    def _submit_ai_call(self, request: dict) -> Optional[concurrent.futures.Future]:
+        """AI 호출을 지연 예산용 스레드 풀에 제출 (남는 스레드가 없으면 대기열에 쌓지 않고 None)"""
+        executor = self._get_hedge_executor()
+        with self._hedge_lock:
+            if self._hedge_calls >= self._hedge_workers:
+                return None
+            self._hedge_calls += 1
+        try:
+            future = executor.submit(self.ai_service.generate_recommendations, **request)
+        except RuntimeError:
+            # close()로 풀이 종료된 뒤의 호출
+            self._ai_call_done(None)
+            return None
+        future.add_done_callback(self._ai_call_done)
+        return future
+    
+    def _ai_call_done(self, future: Optional[concurrent.futures.Future]) -> None:
+        with self._hedge_lock:
+            self._hedge_calls -= 1
+    
+    def _find_matches_ai_batched(
+        self,
+        catalog: _Catalog,
+        pairs: Iterable[Tuple[int, Mentor, int, Mentee]],
+        top_k: int
+    ) -> Iterator[BulkMatch]:
+        """AI 대량 매칭 (쌍 `ai_batch_size`개를 프롬프트 하나로 요청, 입력 순서대로 반환)"""
+        
+        window_size = self.ai_batch_size * AI_BATCH_WINDOW_PROMPTS
+        window: List[Tuple[int, Mentor, int, Mentee]] = []
+        for pair in pairs:
+            window.append(pair)
+            if len(window) >= window_size:
+                yield from self._match_ai_window(catalog, window, top_k)
+                window = []
+        if window:
+            yield from self._match_ai_window(catalog, window, top_k)
+    
+    def _match_ai_window(
+        self,
+        catalog: _Catalog,
+        window: List[Tuple[int, Mentor, int, Mentee]],
+        top_k: int
+    ) -> Iterator[BulkMatch]:
+        """쌍 묶음 하나를 배치 프롬프트로 추천 (실패한 쌍은 규칙 기반으로 전환)"""
+        requests = [
+            self._prepare_ai_request(catalog, mentor, mentee, top_k) for _, mentor, _, mentee in window
+        ]
+        live = [request for request in requests if request is not None]
+        
+        results = iter(self.ai_service.generate_batch_recommendations(
+            live, self._batch_catalog(catalog, live), pairs_per_prompt=self.ai_batch_size
+        ) if live else ())
+        
+        for (i, mentor, j, mentee), request in zip(window, requests):
+            if request is None:
+                recommendations = []
+            else:
+                result = next(results)
+                if isinstance(result, Exception):
+                    recommendations = self._fallback(catalog, result, mentor, mentee, top_k)
+                else:
+                    recommendations = self._assemble_ai_results(catalog, result)
+            yield BulkMatch(i, mentor, j, mentee, recommendations)
+    
+    def _batch_catalog(self, catalog: _Catalog, requests: List[dict]) -> List[dict]:
+        """
+        배치 프롬프트 접두부에 넣을 카탈로그
+        
+        카탈로그가 작으면 전체(작업 내내 같은 접두부), 크면 요청들의 후보 합집합 (카탈로그 순서)
+        """
+        index = catalog.index
+        if len(index) <= AI_BATCH_FULL_CATALOG:
+            return [index.payload(pos).data for pos in range(len(index))]
+        positions = sorted({
+            index.position_of(program["program_id"])
+            for request in requests
+            for program in request["available_programs"]
+        })
+        return [index.payload(pos).data for pos in positions]
+    
+    def find_matches_stream(
+        self,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int = 5
+    ) -> Iterator[RecommendedProgram]:
+        """
+        추천 결과를 하나씩 생성 (점수 순)
+        
+        AI 모드에서는 스트리밍 응답에서 추천이 완성될 때마다 바로 반환하므로
+        첫 추천까지의 지연이 전체 생성 시간보다 짧습니다. 도중에 오류가 나면
+        아직 채우지 못한 개수만큼 규칙 기반 추천으로 이어서 반환합니다.
+        """
+        
+        with self._reading() as catalog:
+            if not catalog.programs:
+                raise ValueError("추천할 프로그램이 없습니다. 먼저 프로그램을 로드해주세요.")
+            
+            self.metrics.count("requests")
+            
+            if not (self.use_ai and self.ai_service):
+                yield from self._find_matches_rule_based(catalog, mentor, mentee, top_k)
+                return
+            
+            request = self._prepare_ai_request(catalog, mentor, mentee, top_k)
+            if request is None:
+                return
+            
+            seen = set()
+            try:
+                for rec in self.ai_service.stream_recommendations(**request):
+                    result = self._to_recommended_program(catalog, rec)
+                    if result is not None and result.program.program_id not in seen:
+                        seen.add(result.program.program_id)
+                        yield result
+                logger.info("✨ Azure OpenAI가 %d개 프로그램을 추천했습니다!", len(seen))
                 
-                if program:
-                    results.append(RecommendedProgram(
-                        program=program,
-                        match_score=rec.get("match_score", 0),
-                        reason=rec.get("reason", "")
-                    ))
+            except Exception as e:
+                fallback = self._fallback(catalog, e, mentor, mentee, top_k + len(seen))
+                remaining = [r for r in fallback if r.program.program_id not in seen]
+                yield from remaining[:top_k - len(seen)]
+    
+    async def find_matches_async(
+        self,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int = 5
+    ) -> List[RecommendedProgram]:
+        """
+        `find_matches`의 비동기 버전
+        
+        AI 모드에서는 비동기 클라이언트로 호출하므로 여러 쌍을 `asyncio.gather`로
+        동시에 요청할 수 있습니다 (동시 호출 수는 AzureOpenAIService가 제한).
+        """
+        
+        with self._reading() as catalog:
+            if not catalog.programs:
+                raise ValueError("추천할 프로그램이 없습니다. 먼저 프로그램을 로드해주세요.")
             
-            print(f"✨ Azure OpenAI가 {len(results)}개 프로그램을 추천했습니다!")
-            return results
+            self.metrics.count("requests")
+            
+            if not (self.use_ai and self.ai_service):
+                return await self._run_blocking(self._find_matches_rule_based, catalog, mentor, mentee, top_k)
+            
+            start = time.perf_counter()
+            request = await self._run_blocking(self._prepare_ai_request, catalog, mentor, mentee, top_k)
+            if request is None:
+                return []
+            
+            if self.ai_latency_budget is not None:
+                return await self._find_matches_ai_hedged_async(
+                    catalog, request, mentor, mentee, top_k, start
+                )
             
+            try:
+                recommendations = await self.ai_service.agenerate_recommendations(**request)
+                return self._assemble_ai_results(catalog, recommendations)
+                
+            except Exception as e:
+                return await self._run_blocking(self._fallback, catalog, e, mentor, mentee, top_k)
+    
+    async def _find_matches_ai_hedged_async(
+        self,
+        catalog: _Catalog,
+        request: dict,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int,
+        start: float
+    ) -> List[RecommendedProgram]:
+        """`_find_matches_ai_hedged`의 비동기 버전"""
+        
+        task = asyncio.ensure_future(self.ai_service.agenerate_recommendations(**request))
+        # 규칙 기반 추천은 스레드 풀에서 계산하고 그동안 이벤트 루프는 AI 요청을 전송
+        rule_based = await self._run_blocking(self._find_matches_rule_based, catalog, mentor, mentee, top_k)
+        remaining = self.ai_latency_budget - (time.perf_counter() - start)
+        
+        try:
+            recommendations = await asyncio.wait_for(asyncio.shield(task), max(remaining, 0))
+        except asyncio.TimeoutError:
+            # AI 호출은 계속 진행되어 끝나면 응답 캐시를 채움 (예외는 확인만 하고 버림)
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            return self._over_budget(rule_based)
         except Exception as e:
-            print(f"❌ AI 추천 중 오류 발생: {e}")
-            print("📌 규칙 기반으로 전환합니다...")
-            return self._find_matches_rule_based(mentor, mentee, top_k)
+            return self._fallback(catalog, e, mentor, mentee, top_k, rule_based)
+        return self._assemble_ai_results(catalog, recommendations)
+    
+    @staticmethod
+    async def _run_blocking(func, *args):
+        """CPU 작업(채점 / 후보 선별)을 기본 스레드 풀에서 실행해 이벤트 루프를 막지 않음"""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+    
+    async def find_matches_many_async(
+        self,
+        pairs: Iterable[Tuple[Mentor, Mentee]],
+        top_k: int = 5
+    ) -> List[List[RecommendedProgram]]:
+        """여러 (멘토, 멘티) 쌍을 동시에 추천 (입력 순서대로 반환)"""
+        return list(await asyncio.gather(
+            *(self.find_matches_async(mentor, mentee, top_k) for mentor, mentee in pairs)
+        ))
+    
+    def find_matches_batch(
+        self,
+        pairs: Sequence[Tuple[Mentor, Mentee]],
+        top_k: Union[int, Sequence[int]] = 5
+    ) -> List[List[RecommendedProgram]]:
+        """
+        여러 (멘토, 멘티) 쌍을 한 번에 규칙 기반으로 추천 (입력 순서대로 반환)
+        
+        동시에 들어온 요청을 모아 처리하는 용도입니다 (HTTP 서버 마이크로 배치).
+        같은 프로필은 특징과 예산 내 후보를 한 번만 계산하고, 완전히 같은 요청
+        (멘토, 멘티, top_k)은 한 번만 채점해 결과를 공유합니다.
+        
+        Args:
+            pairs: (멘토, 멘티) 목록
+            top_k: 쌍마다 추천할 프로그램 개수 (정수 하나 또는 쌍별 목록)
+        """
+        
+        with self._reading() as catalog:
+            if not catalog.programs:
+                raise ValueError("추천할 프로그램이 없습니다. 먼저 프로그램을 로드해주세요.")
+            
+            top_ks = [top_k] * len(pairs) if isinstance(top_k, int) else list(top_k)
+            self.metrics.count("requests", len(pairs))
+            
+            columns = catalog.get_columns() if self.vectorized else None
+            features = {}
+            affordable = {}
+            done = {}
+            results = []
+            
+            def profile(model):
+                key = model.model_dump_json()
+                if key not in features:
+                    features[key] = columns.profile_features(model) if columns is not None else None
+                return key, features[key]
+            
+            for (mentor, mentee), k in zip(pairs, top_ks):
+                mentor_key, mentor_features = profile(mentor)
+                mentee_key, mentee_features = profile(mentee)
+                key = (mentor_key, mentee_key, k)
+                if key not in done:
+                    done[key] = self._match_pair(
+                        catalog, mentor, mentee, k, (mentor_features, mentee_features), affordable
+                    )
+                results.append(done[key])
+            return results
+    
+    def _match_pair(
+        self,
+        catalog: _Catalog,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int,
+        features: Tuple[Optional[ProfileFeatures], Optional[ProfileFeatures]],
+        affordable: dict
+    ) -> List[RecommendedProgram]:
+        """`find_matches_batch`의 쌍 하나 (예산별 후보 위치는 `affordable`에 메모)"""
+        days = pair_days(mentor, mentee)
+        if not days:
+            return []
+        
+        with self.metrics.stage("filter"):
+            positions = affordable.get(mentee.budget_limit)
+            if positions is None:
+                positions = affordable[mentee.budget_limit] = catalog.index.affordable_positions(
+                    mentee.budget_limit
+                )
+            positions = self._filter_positions(catalog, positions, mentor, mentee, days)
+        if not len(positions):
+            return []
+        
+        if self.workers > 1 and len(positions) >= PARALLEL_MIN_CANDIDATES:
+            winners = self._select(catalog, positions, mentor, mentee, top_k)
+        else:
+            winners = self._select_local(
+                catalog, positions, mentor, mentee, top_k, features if self.vectorized else None
+            )
+        return self._render(catalog, winners, mentor, mentee)
+    
+    def _prepare_ai_request(
+        self,
+        catalog: _Catalog,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int
+    ) -> Optional[dict]:
+        """AI 추천 요청 인자 구성 (예산 내 프로그램이 없으면 None)"""
+        
+        logger.info("🤖 Azure OpenAI로 %s(멘토)와 %s(멘티)를 분석 중...", mentor.name, mentee.name)
+        
+        if not pair_days(mentor, mentee):
+            logger.info("⚠️  멘토와 멘티가 함께 가능한 요일이 없습니다.")
+            return None
+        
+        # 멘티 예산 내이고 함께 가능한 요일에 진행되는 프로그램만 조회 (비용 정렬 인덱스 + 요일 마스크)
+        with self.metrics.stage("filter"):
+            positions = self._candidate_positions(catalog, mentor, mentee)
+        affordable_count = len(positions)
+        
+        if not affordable_count:
+            logger.info("⚠️  예산(%s원) 내에서 진행 가능한 프로그램이 없습니다.", f"{mentee.budget_limit:,}")
+            return None
+        
+        logger.info("💰 예산 내 진행 가능한 프로그램: %d개", affordable_count)
+        
+        # 규칙 기반 점수로 상위 M개만 미리 골라 프롬프트 크기를 제한
+        shortlist_size = self.ai_shortlist_size
+        if shortlist_size and affordable_count > shortlist_size:
+            winners = self._select(catalog, positions, mentor, mentee, shortlist_size)
+            selected = [pos for pos, _ in winners]
+            logger.info("🎯 규칙 기반 사전 선별: %d개 → %d개", affordable_count, len(selected))
+        else:
+            selected = positions.tolist()
+        
+        # 프로그램 직렬화 결과는 인덱스에 캐시되어 요청마다 다시 만들지 않음
+        payloads = [catalog.index.payload(pos) for pos in selected]
+        
+        return {
+            "mentor_profile": mentor.model_dump(),
+            "mentee_profile": mentee.model_dump(),
+            "available_programs": [payload.data for payload in payloads],
+            "program_versions": [payload.version for payload in payloads],
+            "top_k": min(top_k, len(payloads))
+        }
+    
+    def _assemble_ai_results(self, catalog: _Catalog, recommendations: List[dict]) -> List[RecommendedProgram]:
+        """AI 응답을 RecommendedProgram 목록으로 변환 (모르는 program_id는 제외)"""
+        
+        results = [
+            result for result in (self._to_recommended_program(catalog, rec) for rec in recommendations)
+            if result is not None
+        ]
+        
+        logger.info("✨ Azure OpenAI가 %d개 프로그램을 추천했습니다!", len(results))
+        return results
+    
+    def _to_recommended_program(self, catalog: _Catalog, rec: dict) -> Optional[RecommendedProgram]:
+        """AI 추천 항목 하나를 RecommendedProgram으로 변환 (모르는 program_id면 None)"""
+        program = catalog.index.get(rec.get("program_id"))
+        if program is None:
+            return None
+        return RecommendedProgram(
+            program=program,
+            match_score=rec.get("match_score", 0),
+            reason=rec.get("reason", "")
+        )
     
     def _find_matches_rule_based(
         self,
+        catalog: _Catalog,
         mentor: Mentor,
         mentee: Mentee,
         top_k: int
     ) -> List[RecommendedProgram]:
         """규칙 기반 추천"""
         
-        print(f"\n🔍 규칙 기반으로 {mentor.name}(멘토)와 {mentee.name}(멘티)를 분석 중...")
-        
-        # 멘티 예산 내의 프로그램만 필터링
-        affordable_programs = [
-            p for p in self.programs
-            if p.estimated_cost <= mentee.budget_limit
-        ]
+        logger.info("🔍 규칙 기반으로 %s(멘토)와 %s(멘티)를 분석 중...", mentor.name, mentee.name)
         
-        if not affordable_programs:
-            print(f"⚠️  예산({mentee.budget_limit:,}원) 내의 프로그램이 없습니다.")
+        if not pair_days(mentor, mentee):
+            logger.info("⚠️  멘토와 멘티가 함께 가능한 요일이 없습니다.")
             return []
         
-        print(f"💰 예산 내 프로그램: {len(affordable_programs)}개")
+        # 멘티 예산 내이고 함께 가능한 요일에 진행되는 프로그램 위치만 조회 (비용 정렬 인덱스 + 요일 마스크)
+        with self.metrics.stage("filter"):
+            positions = self._candidate_positions(catalog, mentor, mentee)
         
-        # 각 프로그램의 점수 계산
-        scored_programs = []
-        for program in affordable_programs:
-            score, reason = self._calculate_match_score(program, mentor, mentee)
-            scored_programs.append({
-                "program": program,
-                "score": score,
-                "reason": reason
-            })
+        if not len(positions):
+            logger.info("⚠️  예산(%s원) 내에서 진행 가능한 프로그램이 없습니다.", f"{mentee.budget_limit:,}")
+            return []
         
-        # 점수 순으로 정렬
-        scored_programs.sort(key=lambda x: x["score"], reverse=True)
+        logger.info("💰 예산 내 진행 가능한 프로그램: %d개", len(positions))
         
-        # 상위 top_k개 선택
-        top_programs = scored_programs[:top_k]
+        winners = self._select(catalog, positions, mentor, mentee, top_k)
+        results = self._render(catalog, winners, mentor, mentee)
         
-        # RecommendedProgram 객체로 변환
-        results = [
-            RecommendedProgram(
-                program=item["program"],
-                match_score=item["score"],
-                reason=item["reason"]
-            )
-            for item in top_programs
-        ]
+        logger.info("✨ 상위 %d개 프로그램을 추천합니다!", len(results))
         
-        print(f"✨ 상위 {len(results)}개 프로그램을 추천합니다!")
+        return results
+    
+    def _fallback(
+        self,
+        catalog: _Catalog,
+        error: Exception,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int,
+        rule_based: Optional[List[RecommendedProgram]] = None
+    ) -> List[RecommendedProgram]:
+        """AI 추천 실패 시 규칙 기반 추천으로 전환 (`rule_based`가 있으면 그대로 반환)"""
+        if isinstance(error, CircuitOpenError):
+            # 회로가 열려 있는 동안은 요청마다 경고하지 않음 (상태 변화는 AzureOpenAIService가 기록)
+            logger.info("⚡ AI 호출이 차단되어 규칙 기반으로 추천합니다: %s", error)
+        else:
+            logger.warning("❌ AI 추천 중 오류 발생: %s", error)
+            logger.warning("📌 규칙 기반으로 전환합니다...")
+        self.metrics.count("ai_fallbacks")
+        if rule_based is not None:
+            return rule_based
+        with self.metrics.stage("fallback"):
+            return self._find_matches_rule_based(catalog, mentor, mentee, top_k)
+    
+    def _candidate_positions(self, catalog: _Catalog, mentor: Mentor, mentee: Mentee) -> np.ndarray:
+        """후보 프로그램 위치: 예산 내이고 함께 가능한 요일에 진행 (`local_only`면 생활권 프로그램만)"""
+        days = pair_days(mentor, mentee)
+        if not days:
+            return np.empty(0, dtype=np.int64)
+        return self._filter_positions(
+            catalog, catalog.index.affordable_positions(mentee.budget_limit), mentor, mentee, days
+        )
+    
+    def _filter_positions(
+        self,
+        catalog: _Catalog,
+        positions: np.ndarray,
+        mentor: Mentor,
+        mentee: Mentee,
+        days: int
+    ) -> np.ndarray:
+        """요일 마스크 컬럼으로 진행 요일이 맞지 않는 프로그램을 채점 전에 제외"""
+        positions = catalog.index.schedule_positions(positions, days)
+        if self.local_only:
+            positions = self._local_positions(catalog, positions, mentor, mentee)
+        return positions
+    
+    def _local_positions(
+        self,
+        catalog: _Catalog,
+        positions: np.ndarray,
+        mentor: Mentor,
+        mentee: Mentee
+    ) -> np.ndarray:
+        """멘토 또는 멘티 생활권이거나 전국 프로그램인 위치만 남김 (지역 인덱스 마스크)"""
+        local = catalog.index.local_mask(mentor.location)[positions]
+        local |= catalog.index.local_mask(mentee.location)[positions]
+        return positions[local]
+    
+    def _select(
+        self,
+        catalog: _Catalog,
+        positions: np.ndarray,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int
+    ) -> List[Tuple[int, float]]:
+        """1단계: 점수만 계산해 상위 top_k개의 (카탈로그 위치, 점수) 선택"""
+        if self.workers > 1 and len(positions) >= PARALLEL_MIN_CANDIDATES:
+            self.metrics.count("candidates_scored", len(positions))
+            with self.metrics.stage("score"):
+                return self._get_scorer(catalog).select(positions, mentor, mentee, top_k)
+        return self._select_local(catalog, positions, mentor, mentee, top_k)
+    
+    def _select_local(
+        self,
+        catalog: _Catalog,
+        positions: np.ndarray,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int,
+        features: Optional[Tuple[ProfileFeatures, ProfileFeatures]] = None
+    ) -> List[Tuple[int, float]]:
+        """
+        현재 프로세스에서 점수 계산 후 상위 top_k개 선택
+        
+        동점이면 카탈로그 위치가 앞선 프로그램이 먼저 옵니다.
+        """
+        metrics = self.metrics
+        metrics.count("candidates_scored", len(positions))
+        if not self.vectorized:
+            # 프로그램별 `_calculate_match_score` 호출 + 힙 선택 (채점과 선택이 섞여 있어 score로 기록)
+            programs = catalog.programs
+            with metrics.stage("score"):
+                winners = heapq.nsmallest(
+                    top_k,
+                    (
+                        (-self._calculate_match_score(programs[pos], mentor, mentee, with_reason=False)[0], pos)
+                        for pos in positions.tolist()
+                    )
+                )
+            return [(pos, -neg_score) for neg_score, pos in winners]
         
+        # 컬럼 엔진으로 전체 점수를 한 번에 계산 + argpartition 선택
+        columns = catalog.get_columns()
+        with metrics.stage("score"):
+            if features is None:
+                scores = columns.score(mentor, mentee, positions)
+            else:
+                scores = columns.score_features(*features, mentee.budget_limit, positions)
+        with metrics.stage("select"):
+            winners = select_top_k(scores, positions, top_k)
+        return list(zip(positions[winners].tolist(), scores[winners].tolist()))
+    
+    def _render(
+        self,
+        catalog: _Catalog,
+        winners: List[Tuple[int, float]],
+        mentor: Mentor,
+        mentee: Mentee
+    ) -> List[RecommendedProgram]:
+        """2단계: 선택된 프로그램만 추천 이유 코드를 기록해 문장으로 렌더링하고 RecommendedProgram으로 변환"""
+        results = []
+        with self.metrics.stage("render"):
+            for pos, score in winners:
+                program = catalog.programs[pos]
+                _, reasons = self._calculate_match_score(program, mentor, mentee)
+                results.append(RecommendedProgram(
+                    program=program,
+                    match_score=score,
+                    reason=render_reasons(reasons),
+                    reasons=to_match_reasons(reasons)
+                ))
         return results
-
+    
+    def _get_scorer(self, catalog: _Catalog) -> "ShardedScorer":
+        """카탈로그의 멀티 프로세스 채점기 반환 (워커는 카탈로그마다 따로 시작)"""
+        return catalog.get_scorer(self.workers, self.vectorized, self.local_only)
+    
+    def close(self):
+        """멀티 프로세스 워커 / 지연 예산용 스레드 종료"""
+        self._catalog.close_scorer()
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
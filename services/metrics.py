@@ -0,0 +1,255 @@
+"""
+매칭 서비스 계측 (단계별 시간 / 카운터 / LLM 토큰 사용량)
+
+`Metrics`는 측정값을 등록된 싱크(sink)로 전달만 합니다. 싱크가 하나도 없으면
+`stage()`는 아무 일도 하지 않는 타이머를 돌려주므로 핫 패스 비용이 거의 없습니다.
+
+- 단계 (초): filter, score, select, render, llm.prompt, llm.call, llm.batch_call, llm.parse, fallback
+- 카운터: requests, candidates_scored, ai_fallbacks, ai_over_budget, llm.cache_hits, llm.cache_misses,
+  llm.coalesced, llm.errors, llm.short_circuits, llm.breaker_{open,half_open,closed},
+  llm.pairs, llm.batch_calls, llm.batch_retried_pairs,
+  llm.prompt_tokens, llm.cached_prompt_tokens, llm.completion_tokens, llm.total_tokens
+
+싱크:
+- `HistogramSink`: 메모리 내 히스토그램 (단계별 횟수 / 평균 / 분위수 요약)
+- `PrometheusSink`: `HistogramSink` + Prometheus 텍스트 노출 형식 출력
+- `JsonLogSink`: 측정값마다 JSON 한 줄을 로거(또는 스트림)로 기록
+"""
+
+import bisect
+import json
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, TextIO
+
+
+# 단계 시간 히스토그램 버킷 상한 (초, Prometheus 기본값보다 짧은 구간을 촘촘하게)
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+
+class MetricsSink:
+    """측정값을 받는 싱크 (필요한 메서드만 재정의)"""
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """단계 하나의 소요 시간"""
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """카운터 증가"""
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self, n_buckets: int):
+        self.counts = [0] * (n_buckets + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+
+class HistogramSink(MetricsSink):
+    """단계별 시간을 고정 버킷 히스토그램으로, 카운터를 합계로 모아 두는 싱크 (스레드 안전)"""
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._histograms: Dict[str, _Histogram] = {}
+        self._counters: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = _Histogram(len(self.buckets))
+            histogram.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            histogram.count += 1
+            histogram.total += seconds
+            histogram.min = min(histogram.min, seconds)
+            histogram.max = max(histogram.max, seconds)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def counter(self, name: str) -> float:
+        return self._counters.get(name, 0)
+
+    def quantile(self, stage: str, q: float) -> Optional[float]:
+        """버킷 경계 사이를 선형 보간한 분위수 추정치 (초, 관측값이 없으면 None)"""
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None or not histogram.count:
+                return None
+            return self._quantile(histogram, q)
+
+    def _quantile(self, histogram: _Histogram, q: float) -> float:
+        rank = q * histogram.count
+        seen = 0
+        for i, count in enumerate(histogram.counts):
+            if count and seen + count >= rank:
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                upper = self.buckets[i] if i < len(self.buckets) else histogram.max
+                estimate = lower + (upper - lower) * (rank - seen) / count
+                return min(max(estimate, histogram.min), histogram.max)
+            seen += count
+        return histogram.max
+
+    def summary(self) -> Dict[str, Any]:
+        """단계별 {count, mean_ms, p50_ms, p99_ms, max_ms}와 카운터 합계"""
+        with self._lock:
+            stages = {
+                stage: {
+                    "count": histogram.count,
+                    "mean_ms": histogram.total / histogram.count * 1000,
+                    "p50_ms": self._quantile(histogram, 0.5) * 1000,
+                    "p99_ms": self._quantile(histogram, 0.99) * 1000,
+                    "max_ms": histogram.max * 1000,
+                }
+                for stage, histogram in self._histograms.items()
+                if histogram.count
+            }
+            return {"stages": stages, "counters": dict(self._counters)}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+class PrometheusSink(HistogramSink):
+    """Prometheus 텍스트 노출 형식(`render()`)으로 내보낼 수 있는 히스토그램 싱크"""
+
+    def __init__(self, namespace: str = "mentoring", buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(buckets)
+        self.namespace = namespace
+
+    def render(self) -> str:
+        """`/metrics` 응답 본문 (text/plain; version=0.0.4)"""
+        name = f"{self.namespace}_stage_seconds"
+        lines: List[str] = []
+        with self._lock:
+            if self._histograms:
+                lines.append(f"# HELP {name} 매칭 단계별 소요 시간")
+                lines.append(f"# TYPE {name} histogram")
+            for stage, histogram in sorted(self._histograms.items()):
+                cumulative = 0
+                for bound, count in zip((*self.buckets, "+Inf"), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.total!r}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+            for counter, value in sorted(self._counters.items()):
+                metric = f"{self.namespace}_{counter.replace('.', '_')}_total"
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value}")
+        return "\n".join(lines) + "\n"
+
+
+class JsonLogSink(MetricsSink):
+    """측정값마다 JSON 한 줄을 기록하는 싱크 (`stream`이 없으면 로거의 INFO 레벨로)"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None, stream: Optional[TextIO] = None):
+        self.logger = logger or logging.getLogger("services.metrics.events")
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def observe(self, stage: str, seconds: float) -> None:
+        self._emit({"type": "stage", "name": stage, "seconds": seconds})
+
+    def increment(self, name: str, value: float = 1) -> None:
+        self._emit({"type": "counter", "name": name, "value": value})
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        event["ts"] = time.time()
+        if self.stream is None:
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(json.dumps(event, ensure_ascii=False))
+            return
+        with self._lock:
+            self.stream.write(json.dumps(event, ensure_ascii=False) + "\n")
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _StageTimer:
+    __slots__ = ("metrics", "stage", "start")
+
+    def __init__(self, metrics: "Metrics", stage: str):
+        self.metrics = metrics
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.observe(self.stage, time.perf_counter() - self.start)
+        return False
+
+
+class Metrics:
+    """계측 진입점: 단계 타이머 / 카운터 / 토큰 사용량을 등록된 싱크로 전달"""
+
+    def __init__(self, sinks: Iterable[MetricsSink] = ()):
+        self.sinks: List[MetricsSink] = list(sinks)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.sinks)
+
+    def add_sink(self, sink: MetricsSink) -> MetricsSink:
+        self.sinks.append(sink)
+        return sink
+
+    def remove_sink(self, sink: MetricsSink) -> None:
+        self.sinks.remove(sink)
+
+    def stage(self, name: str):
+        """`with metrics.stage("score"):` 블록의 소요 시간 기록 (예외가 나도 기록)"""
+        if not self.sinks:
+            return _NULL_TIMER
+        return _StageTimer(self, name)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        for sink in self.sinks:
+            sink.observe(stage, seconds)
+
+    def count(self, name: str, value: float = 1) -> None:
+        for sink in self.sinks:
+            sink.increment(name, value)
+
+    def record_usage(self, usage: Any) -> None:
+        """LLM 응답의 `usage` 필드(prompt/completion/total / 캐시된 프롬프트 토큰)를 카운터로 기록"""
+        if usage is None or not self.sinks:
+            return
+        for field in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            value = _field(usage, field)
+            if value:
+                self.count(f"llm.{field}", value)
+        # 제공자 프롬프트 캐시에서 처리된 프롬프트 토큰 (지원되는 API 버전에서만)
+        cached = _field(_field(usage, "prompt_tokens_details"), "cached_tokens")
+        if cached:
+            self.count("llm.cached_prompt_tokens", cached)
+
+
+def _field(value: Any, name: str) -> Any:
+    """객체 속성 또는 딕셔너리 키 조회 (없으면 None)"""
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
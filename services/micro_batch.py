@@ -0,0 +1,109 @@
+"""
+비동기 마이크로 배치
+
+짧은 시간(`max_wait`) 동안 동시에 들어온 요청을 모아 배치 함수 한 번으로 처리합니다.
+배치 함수는 전용 스레드 하나에서 실행되므로, 스레드 안전하지 않은 백엔드
+(`MatchingService`)도 이벤트 루프를 막지 않고 한 번에 한 배치씩 안전하게 쓸 수 있습니다.
+
+대기열 길이는 `max_pending`으로 제한되며, 가득 차면 `Overloaded`를 바로 발생시켜
+호출자가 요청을 거절(예: HTTP 503)하도록 합니다 (백프레셔).
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
+
+class Overloaded(Exception):
+    """대기 중인 요청이 한도를 넘어 새 요청을 받을 수 없음"""
+
+
+class MicroBatcher(Generic[ItemT, ResultT]):
+    """요청을 모아 `handler(items) -> results`를 전용 스레드에서 실행"""
+
+    def __init__(
+        self,
+        handler: Callable[[List[ItemT]], Sequence[ResultT]],
+        max_batch: int = 32,
+        max_wait: float = 0.002,
+        max_pending: int = 256,
+        executor: Optional[ThreadPoolExecutor] = None
+    ):
+        """
+        Args:
+            handler: 요청 목록을 받아 같은 순서의 결과 목록을 돌려주는 함수
+            max_batch: 배치 하나에 담을 최대 요청 수
+            max_wait: 첫 요청 이후 배치를 채우려고 기다리는 최대 시간 (초)
+            max_pending: 대기 + 처리 중인 요청 수 한도 (넘으면 `Overloaded`)
+            executor: 배치를 실행할 단일 스레드 실행기 (None이면 새로 만듦)
+        """
+        self.handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.max_pending = max_pending
+        self.executor = executor or ThreadPoolExecutor(1, thread_name_prefix="micro-batch")
+        self.pending = 0
+        self.batches = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def submit(self, item: ItemT) -> ResultT:
+        """요청 하나를 배치에 넣고 결과를 기다림"""
+        if self.pending >= self.max_pending:
+            raise Overloaded(f"대기 중인 요청이 {self.pending}개입니다.")
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending += 1
+        try:
+            self._queue.put_nowait((item, future))
+            return await future
+        finally:
+            self.pending -= 1
+
+    async def run_exclusive(self, func: Callable[..., Any], *args: Any) -> Any:
+        """배치와 같은 스레드에서 `func(*args)` 실행 (배치 사이에 끼워 넣음)"""
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def close(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        self.executor.shutdown(wait=False)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            # 배치가 다 차지 않았으면 max_wait만큼 더 모은 뒤 대기열에 있는 만큼 꺼냄
+            if self._queue.qsize() + 1 < self.max_batch and self.max_wait > 0:
+                await asyncio.sleep(self.max_wait)
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            # 대기 중 호출자가 끊긴(취소된) 요청은 처리하지 않음
+            batch = [(item, future) for item, future in batch if not future.done()]
+            if batch:
+                await self._dispatch(batch)
+
+    async def _dispatch(self, batch: List[Tuple[ItemT, asyncio.Future]]) -> None:
+        self.batches += 1
+        items = [item for item, _ in batch]
+        try:
+            results = await asyncio.get_running_loop().run_in_executor(self.executor, self.handler, items)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
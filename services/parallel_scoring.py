@@ -0,0 +1,139 @@
+"""
+멀티 프로세스 샤딩 채점기
+
+프로그램 카탈로그는 워커 초기화 시 한 번만 전달되고, 이후 작업에는 멘토/멘티와
+카탈로그 위치(샤드)만 전달됩니다. 각 워커는 샤드의 상위 top_k개만 돌려주며,
+메인 프로세스에서 (점수 내림차순, 카탈로그 위치 오름차순)으로 병합하므로
+단일 프로세스 경로와 순위가 같습니다.
+"""
+
+import heapq
+import itertools
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from models import Mentor, Mentee, MentoringProgram
+
+
+# 대량 매칭에서 작업 하나에 담을 멘토 수
+BULK_MENTORS_PER_TASK = 8
+
+# 워커 프로세스 전역 상태 (초기화 시 한 번 구성)
+_worker_service = None
+
+
+def _init_worker(programs: List[MentoringProgram], vectorized: bool, local_only: bool) -> None:
+    """워커 초기화: 카탈로그로 워커 전용 MatchingService 구성"""
+    global _worker_service
+    from services.matching_service import MatchingService
+
+    _worker_service = MatchingService(vectorized=vectorized, local_only=local_only)
+    _worker_service.programs = programs
+    if vectorized:
+        _worker_service._get_columns()
+
+
+def _select_shard(
+    positions: np.ndarray,
+    mentor: Mentor,
+    mentee: Mentee,
+    top_k: int
+) -> List[Tuple[int, float]]:
+    """워커: 샤드 하나의 상위 top_k개 (카탈로그 위치, 점수)"""
+    return _worker_service._select_local(_worker_service._catalog, positions, mentor, mentee, top_k)
+
+
+def _select_bulk_chunk(
+    start: int,
+    mentors: List[Mentor],
+    mentees: List[Mentee],
+    top_k: int
+) -> List[Tuple[int, int, List[Tuple[int, float]]]]:
+    """워커: 멘토 묶음 × 전체 멘티의 상위 top_k개"""
+    return [
+        (i, j, winners)
+        for i, _, j, _, winners in _worker_service.iter_bulk_winners(mentors, mentees, top_k, start)
+    ]
+
+
+def merge_top_k(shards: Iterable[List[Tuple[int, float]]], top_k: int) -> List[Tuple[int, float]]:
+    """샤드별 상위 결과를 (점수 내림차순, 카탈로그 위치 오름차순)으로 병합"""
+    candidates = itertools.chain.from_iterable(shards)
+    winners = heapq.nsmallest(top_k, ((-score, pos) for pos, score in candidates))
+    return [(pos, -neg_score) for neg_score, pos in winners]
+
+
+class ShardedScorer:
+    """카탈로그를 여러 프로세스에 나눠 채점하는 프로세스 풀"""
+
+    def __init__(
+        self,
+        programs: Sequence[MentoringProgram],
+        workers: int,
+        vectorized: bool = True,
+        local_only: bool = False
+    ):
+        self.workers = workers
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(list(programs), vectorized, local_only),
+        )
+
+    def select(
+        self,
+        positions: np.ndarray,
+        mentor: Mentor,
+        mentee: Mentee,
+        top_k: int
+    ) -> List[Tuple[int, float]]:
+        """후보 위치를 워커 수만큼 나눠 채점하고 상위 top_k개로 병합"""
+        futures = [
+            self._executor.submit(_select_shard, shard, mentor, mentee, top_k)
+            for shard in np.array_split(positions, self.workers)
+            if len(shard)
+        ]
+        return merge_top_k((f.result() for f in futures), top_k)
+
+    def select_bulk(
+        self,
+        mentors: Iterable[Mentor],
+        mentees: Sequence[Mentee],
+        top_k: int
+    ) -> Iterator[Tuple[int, Mentor, int, Mentee, List[Tuple[int, float]]]]:
+        """
+        멘토 묶음 단위로 워커에 나눠 대량 매칭 1단계를 실행
+
+        처리 중인 작업 수를 워커 수의 2배로 제한하므로 멘토 목록을 스트리밍으로
+        받아도 메모리가 일정하게 유지되며, 결과는 입력 순서대로 반환됩니다.
+        """
+        mentees = list(mentees)
+        mentor_iter = iter(mentors)
+        pending: Deque[Tuple[int, List[Mentor], Future]] = deque()
+        start = 0
+
+        def submit_next() -> bool:
+            nonlocal start
+            chunk = list(itertools.islice(mentor_iter, BULK_MENTORS_PER_TASK))
+            if not chunk:
+                return False
+            future = self._executor.submit(_select_bulk_chunk, start, chunk, mentees, top_k)
+            pending.append((start, chunk, future))
+            start += len(chunk)
+            return True
+
+        while len(pending) < self.workers * 2 and submit_next():
+            pass
+
+        while pending:
+            offset, chunk, future = pending.popleft()
+            for i, j, winners in future.result():
+                yield i, chunk[i - offset], j, mentees[j], winners
+            submit_next()
+
+    def close(self) -> None:
+        """워커 프로세스 종료"""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,397 @@
+"""
+프로그램 인덱스 (예산 정렬 인덱스 + program_id 해시 맵)
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from models import MentoringProgram
+from services.regions import NATIONWIDE_REGION, REGIONS
+from services.response_cache import canonical_json, content_hash
+from services.schedule import program_days
+
+
+class ProgramPayload(NamedTuple):
+    """프로그램 하나의 직렬화 결과 (처음 요청될 때 한 번만 계산)"""
+
+    data: Dict[str, Any]    # model_dump() 결과 (공유 객체이므로 수정하지 말 것)
+    json: str               # 정렬된 키의 JSON 문자열
+    version: str            # 내용 해시 (AI 응답 캐시 키에 사용)
+
+
+class ProgramIndex:
+    """프로그램 카탈로그 인덱스
+
+    - `programs`: 카탈로그 순서의 프로그램 목록 (위치 = 추가 순서)
+    - 비용 오름차순으로 정렬된 (비용, 위치) 목록: 예산 내 프로그램을 bisect로 조회
+    - `program_id -> 카탈로그 위치` 해시 맵: ID 조회를 O(1)로 처리
+    - `지역 노드 -> 카탈로그 위치` 맵: 지역 제한 조회에서 후보를 미리 거름
+    - 위치별 진행 요일 마스크: 함께 가능한 요일에 진행되지 않는 프로그램을 미리 거름
+    - 위치별 직렬화 캐시: AI 요청마다 같은 프로그램을 다시 `model_dump()`하지 않음
+    """
+
+    def __init__(self, programs: Iterable[MentoringProgram] = ()):
+        self.programs: Sequence[MentoringProgram] = []
+        self._by_id: Dict[str, int] = {}
+        # 스냅샷에서 열었으면 program_id 맵은 처음 조회할 때 구성
+        self._pending_ids: Optional[Callable[[], List[str]]] = None
+        # 지역 인덱스는 처음 조회할 때 구성 (위치별 지역 노드, 지역 노드 -> 위치 목록)
+        self._pending_locations: Optional[Callable[[], List[str]]] = None
+        self._regions: Optional[List[int]] = None
+        self._by_region: Dict[int, List[int]] = {}
+        self._local_masks: Dict[int, np.ndarray] = {}
+        # 진행 요일 마스크도 처음 조회할 때 구성
+        self._pending_days: Optional[Callable[[], np.ndarray]] = None
+        self._days: Optional[List[int]] = None
+        self._days_array: Optional[np.ndarray] = None
+        self._costs: List[int] = []
+        self._positions: List[int] = []
+        self._positions_array: Optional[np.ndarray] = None
+        self._payloads: List[Optional[ProgramPayload]] = []
+        self.extend(programs)
+
+    def __len__(self) -> int:
+        return len(self.programs)
+
+    @classmethod
+    def from_columns(
+        cls,
+        programs: Sequence[MentoringProgram],
+        costs: np.ndarray,
+        program_ids: Callable[[], List[str]],
+        locations: Optional[Callable[[], List[str]]] = None,
+        days: Optional[Callable[[], np.ndarray]] = None
+    ) -> "ProgramIndex":
+        """
+        이미 컬럼으로 가진 비용/ID로 인덱스 구성 (스냅샷용)
+
+        Args:
+            programs: 위치로 조회하는 프로그램 목록 (필요한 항목만 만드는 지연 목록 가능)
+            costs: 위치별 비용 배열
+            program_ids: 위치별 program_id 목록을 돌려주는 함수 (ID 조회가 처음 필요할 때 호출)
+            locations: 위치별 지역 문자열 목록을 돌려주는 함수 (지역 조회가 처음 필요할 때 호출,
+                없으면 프로그램 목록에서 읽음)
+            days: 위치별 진행 요일 마스크 배열을 돌려주는 함수 (위와 같이 처음 필요할 때 호출)
+        """
+        index = cls()
+        index.programs = programs
+        index._payloads = [None] * len(programs)
+        order = np.argsort(costs, kind="stable")
+        index._costs = costs[order].tolist()
+        index._positions = order.tolist()
+        index._positions_array = order.astype(np.int64)
+        index._pending_ids = program_ids
+        index._pending_locations = locations
+        index._pending_days = days
+        return index
+
+    def copy(self) -> "ProgramIndex":
+        """
+        변경용 사본 (copy-on-write)
+
+        사본만 `add()` / `replace()` / `remove()`로 수정하고 통째로 교체하면,
+        원본을 읽고 있는 요청은 끝까지 일관된 카탈로그를 봅니다.
+        지연 구성된 지역 마스크는 사본에서 필요할 때 다시 만듭니다.
+        """
+        index = ProgramIndex()
+        index.programs = list(self.programs)
+        index._by_id = dict(self._by_id)
+        index._pending_ids = self._pending_ids
+        index._pending_locations = self._pending_locations
+        index._regions = None if self._regions is None else list(self._regions)
+        index._by_region = {region: list(positions) for region, positions in self._by_region.items()}
+        index._pending_days = self._pending_days
+        index._days = None if self._days is None else list(self._days)
+        index._days_array = self._days_array
+        index._costs = list(self._costs)
+        index._positions = list(self._positions)
+        index._positions_array = self._positions_array
+        index._payloads = list(self._payloads)
+        return index
+
+    def add(self, program: MentoringProgram) -> int:
+        """프로그램을 추가하고 카탈로그 위치를 반환"""
+        self._materialize()
+        pos = len(self.programs)
+        self.programs.append(program)
+        self._payloads.append(None)
+        # 같은 ID가 여러 번 추가되면 먼저 추가된 프로그램을 유지
+        self._by_id.setdefault(program.program_id, pos)
+        self._insert_sorted(program.estimated_cost, pos)
+        if self._regions is not None:
+            region = REGIONS.resolve(program.location)
+            self._regions.append(region)
+            self._by_region.setdefault(region, []).append(pos)
+        self._local_masks.clear()
+        if self._days is not None:
+            self._days.append(program_days(program))
+            self._days_array = None
+        return pos
+
+    def extend(self, programs: Iterable[MentoringProgram]) -> None:
+        """여러 프로그램 추가 (비용 정렬 목록은 프로그램마다 끼워 넣지 않고 한 번에 병합)"""
+        programs = list(programs)
+        if not programs:
+            return
+        if self.programs:
+            self._materialize()
+            start = len(self.programs)
+            for pos, program in enumerate(programs, start):
+                self.programs.append(program)
+                self._payloads.append(None)
+                self._by_id.setdefault(program.program_id, pos)
+                if self._regions is not None:
+                    region = REGIONS.resolve(program.location)
+                    self._regions.append(region)
+                    self._by_region.setdefault(region, []).append(pos)
+                if self._days is not None:
+                    self._days.append(program_days(program))
+            # 새 프로그램만 정렬한 뒤 기존 목록 사이사이에 구간 단위로 병합
+            # (같은 비용이면 먼저 추가된 프로그램이 앞, `add()`와 같은 순서)
+            added = sorted(
+                ((program.estimated_cost, pos) for pos, program in enumerate(programs, start)),
+                key=lambda entry: entry[0],
+            )
+            costs: List[int] = []
+            positions: List[int] = []
+            lo = 0
+            for cost, pos in added:
+                i = bisect_right(self._costs, cost, lo)
+                costs.extend(self._costs[lo:i])
+                positions.extend(self._positions[lo:i])
+                costs.append(cost)
+                positions.append(pos)
+                lo = i
+            costs.extend(self._costs[lo:])
+            positions.extend(self._positions[lo:])
+            self._costs = costs
+            self._positions = positions
+            self._positions_array = None
+            self._local_masks.clear()
+            self._days_array = None
+            return
+
+        self.programs = programs
+        self._payloads = [None] * len(programs)
+        for pos, program in enumerate(programs):
+            self._by_id.setdefault(program.program_id, pos)
+        order = sorted(range(len(programs)), key=lambda pos: programs[pos].estimated_cost)
+        self._costs = [programs[pos].estimated_cost for pos in order]
+        self._positions = order
+        self._positions_array = None
+        self._regions = None
+        self._local_masks.clear()
+        self._days = None
+        self._days_array = None
+
+    def replace(self, pos: int, program: MentoringProgram) -> None:
+        """위치 `pos`의 프로그램을 같은 위치에서 새 내용으로 교체"""
+        self._materialize()
+        old = self.programs[pos]
+        i = bisect_left(self._costs, old.estimated_cost)
+        while self._positions[i] != pos:
+            i += 1
+        del self._costs[i]
+        del self._positions[i]
+
+        self.programs[pos] = program
+        self._payloads[pos] = None
+        if old.program_id != program.program_id:
+            if self._by_id.get(old.program_id) == pos:
+                del self._by_id[old.program_id]
+            self._by_id.setdefault(program.program_id, pos)
+        self._insert_sorted(program.estimated_cost, pos)
+
+        if self._regions is not None:
+            region = REGIONS.resolve(program.location)
+            if region != self._regions[pos]:
+                self._by_region[self._regions[pos]].remove(pos)
+                insort(self._by_region.setdefault(region, []), pos)
+                self._regions[pos] = region
+        self._local_masks.clear()
+        if self._days is not None:
+            self._days[pos] = program_days(program)
+            self._days_array = None
+
+    def remove(self, positions: Iterable[int]) -> None:
+        """지정한 위치의 프로그램 제거 (뒤의 프로그램은 위치가 앞으로 당겨짐)"""
+        removed = set(positions)
+        if not removed:
+            return
+        self._materialize()
+
+        new_position: List[int] = []
+        next_pos = 0
+        for pos in range(len(self.programs)):
+            new_position.append(next_pos)
+            if pos not in removed:
+                next_pos += 1
+
+        kept = [
+            (cost, new_position[pos])
+            for cost, pos in zip(self._costs, self._positions)
+            if pos not in removed
+        ]
+        self._costs = [cost for cost, _ in kept]
+        self._positions = [pos for _, pos in kept]
+        self.programs = [p for pos, p in enumerate(self.programs) if pos not in removed]
+        self._payloads = [p for pos, p in enumerate(self._payloads) if pos not in removed]
+        self._by_id = {}
+        for pos, program in enumerate(self.programs):
+            self._by_id.setdefault(program.program_id, pos)
+        self._positions_array = None
+        # 뒤의 위치가 모두 바뀌므로 지역 인덱스는 다음 조회 때 다시 구성
+        self._regions = None
+        self._local_masks.clear()
+        if self._days is not None:
+            self._days = [days for pos, days in enumerate(self._days) if pos not in removed]
+            self._days_array = None
+
+    def get(self, program_id: str) -> Optional[MentoringProgram]:
+        """program_id로 프로그램 조회"""
+        pos = self._ids().get(program_id)
+        return None if pos is None else self.programs[pos]
+
+    def position_of(self, program_id: str) -> Optional[int]:
+        """program_id의 카탈로그 위치 (없으면 None)"""
+        return self._ids().get(program_id)
+
+    def program_ids(self) -> List[str]:
+        """인덱스에 등록된 program_id 목록"""
+        return list(self._ids())
+
+    def payload(self, pos: int) -> ProgramPayload:
+        """위치 `pos` 프로그램의 직렬화 결과 (프로그램이 교체되면 다시 계산)"""
+        payload = self._payloads[pos]
+        if payload is None:
+            data = self.programs[pos].model_dump()
+            text = canonical_json(data)
+            payload = self._payloads[pos] = ProgramPayload(data, text, content_hash(text)[:16])
+        return payload
+
+    def count_affordable(self, budget: int) -> int:
+        """예산 이하 프로그램 개수"""
+        return bisect_right(self._costs, budget)
+
+    def affordable_positions(self, budget: int) -> np.ndarray:
+        """예산 이하 프로그램의 카탈로그 위치 (비용 오름차순)"""
+        if self._positions_array is None:
+            self._positions_array = np.asarray(self._positions, dtype=np.int64)
+        return self._positions_array[:self.count_affordable(budget)]
+
+    def affordable(self, budget: int) -> List[MentoringProgram]:
+        """예산 이하 프로그램 목록 (비용 오름차순)"""
+        return [self.programs[pos] for pos in self._positions[:self.count_affordable(budget)]]
+
+    def region_positions(self, location: str) -> np.ndarray:
+        """`location`과 같은 생활권(상위/하위 지역 포함)인 프로그램의 카탈로그 위치 (오름차순)"""
+        by_region = self._region_index()
+        positions = [
+            pos
+            for region in REGIONS.related(REGIONS.resolve(location))
+            for pos in by_region.get(region, ())
+        ]
+        return np.unique(np.asarray(positions, dtype=np.int64))
+
+    def local_mask(self, location: str) -> np.ndarray:
+        """카탈로그 위치별: `location` 생활권이거나 지역 제약이 없는(전국) 프로그램인지"""
+        region = REGIONS.resolve(location)
+        mask = self._local_masks.get(region)
+        if mask is None:
+            mask = np.zeros(len(self.programs), dtype=bool)
+            mask[self.region_positions(location)] = True
+            mask[self._region_index().get(NATIONWIDE_REGION, [])] = True
+            self._local_masks[region] = mask
+        return mask
+
+    def schedule_positions(self, positions: np.ndarray, days: int) -> np.ndarray:
+        """`positions` 중 요일 마스크 `days`의 요일에 하루라도 진행되는 프로그램만 남김"""
+        if self._days_array is None:
+            self._days_array = np.asarray(self._day_list(), dtype=np.uint8)
+        return positions[(self._days_array[positions] & days) != 0]
+
+    def _day_list(self) -> List[int]:
+        if self._days is None:
+            if self._pending_days is not None:
+                self._days = self._pending_days().tolist()
+                self._pending_days = None
+            else:
+                self._days = [program_days(program) for program in self.programs]
+        return self._days
+
+    def _region_index(self) -> Dict[int, List[int]]:
+        if self._regions is None:
+            if self._pending_locations is not None:
+                locations = self._pending_locations()
+                self._pending_locations = None
+            else:
+                locations = [program.location for program in self.programs]
+            self._regions = [REGIONS.resolve(location) for location in locations]
+            self._by_region = {}
+            for pos, region in enumerate(self._regions):
+                self._by_region.setdefault(region, []).append(pos)
+        return self._by_region
+
+    def _ids(self) -> Dict[str, int]:
+        if self._pending_ids is not None:
+            for pos, program_id in enumerate(self._pending_ids()):
+                self._by_id.setdefault(program_id, pos)
+            self._pending_ids = None
+        return self._by_id
+
+    def _materialize(self) -> None:
+        """변경 전에 지연 목록을 일반 리스트로 바꿈 (ID 맵도 함께 구성)"""
+        self._ids()
+        if self._pending_locations is not None:
+            self._region_index()
+        if self._pending_days is not None:
+            self._day_list()
+        if not isinstance(self.programs, list):
+            self.programs = list(self.programs)
+
+    def _insert_sorted(self, cost: int, pos: int) -> None:
+        i = bisect_right(self._costs, cost)
+        self._costs.insert(i, cost)
+        self._positions.insert(i, pos)
+        self._positions_array = None
+
+
+@dataclass
+class CatalogDiff:
+    """두 카탈로그 사이의 program_id 기준 변경분"""
+
+    added: List[MentoringProgram] = field(default_factory=list)
+    updated: List[MentoringProgram] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+    def summary(self) -> str:
+        return f"추가 {len(self.added)}개, 변경 {len(self.updated)}개, 삭제 {len(self.removed)}개"
+
+
+def diff_programs(index: ProgramIndex, programs: Iterable[MentoringProgram]) -> CatalogDiff:
+    """
+    현재 인덱스와 새 프로그램 목록을 program_id 기준으로 비교
+
+    같은 ID가 여러 번 나오면 인덱스와 마찬가지로 처음 나온 프로그램을 기준으로 합니다.
+    """
+    diff = CatalogDiff()
+    seen = set()
+    for program in programs:
+        if program.program_id in seen:
+            continue
+        seen.add(program.program_id)
+
+        current = index.get(program.program_id)
+        if current is None:
+            diff.added.append(program)
+        elif current != program:
+            diff.updated.append(program)
+
+    diff.removed = [program_id for program_id in index.program_ids() if program_id not in seen]
+    return diff
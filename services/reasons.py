@@ -0,0 +1,60 @@
+"""
+규칙 기반 추천 이유 코드와 문장 렌더링
+
+점수 계산은 문장 대신 (이유 코드, 점수, 인자) 튜플만 기록하고, 한국어 문장은
+최종 추천 결과(RecommendedProgram)를 만들 때만 템플릿으로 렌더링합니다.
+같은 코드 목록은 API 응답에서 구조화된 데이터(`MatchReason`)로도 쓰입니다.
+"""
+
+from typing import Any, Dict, Iterable, List, NamedTuple
+
+from models import MatchReason
+
+
+class ReasonCode(NamedTuple):
+    """점수 항목 하나의 추천 이유 (코드는 "항목.결과" 형식)"""
+
+    code: str
+    points: float
+    params: Dict[str, Any]
+
+
+# 이유 코드 -> 문장 템플릿 (목록 인자는 ", "로 이어 붙임)
+REASON_TEMPLATES: Dict[str, str] = {
+    "location.match": "✓ 지역이 적합합니다 ({location})",
+    "location.nationwide": "✓ 지역 제약이 없습니다",
+    "location.other": "△ 지역이 다소 다릅니다",
+    "budget.cheap": "✓ 예산 대비 매우 저렴합니다 ({cost:,}원)",
+    "budget.fair": "✓ 예산 범위 내 적정 가격입니다 ({cost:,}원)",
+    "budget.within": "✓ 예산 내에서 가능합니다 ({cost:,}원)",
+    "interest.match": "✓ 공통 관심사와 일치합니다: {interests}",
+    "interest.common": "✓ 멘토와 멘티의 공통 관심사가 있습니다: {interests}",
+    "interest.partial": "△ 일부 관심사와 연관됩니다: {interests}",
+    "interest.new": "△ 새로운 경험이 될 수 있습니다",
+    "job.match": "✓ 직무에 적합한 활동입니다",
+    "job.open": "△ 모든 직군에 열려있습니다",
+    "schedule.match": "✓ 함께 가능한 요일에 진행됩니다 ({days})",
+    "schedule.miss": "✗ 함께 가능한 요일에 진행되지 않습니다",
+}
+
+
+def render_reason(reason: ReasonCode) -> str:
+    """이유 코드 하나를 한국어 문장으로 렌더링"""
+    params = {
+        name: ", ".join(value) if isinstance(value, (list, tuple)) else value
+        for name, value in reason.params.items()
+    }
+    return REASON_TEMPLATES[reason.code].format(**params)
+
+
+def render_reasons(reasons: Iterable[ReasonCode]) -> str:
+    """이유 코드 목록을 " | "로 이은 추천 이유 문장으로 렌더링"""
+    return " | ".join(render_reason(reason) for reason in reasons)
+
+
+def to_match_reasons(reasons: Iterable[ReasonCode]) -> List[MatchReason]:
+    """이유 코드 목록을 API 응답용 모델로 변환"""
+    return [
+        MatchReason(code=reason.code, points=reason.points, params=reason.params)
+        for reason in reasons
+    ]
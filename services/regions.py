@@ -0,0 +1,222 @@
+"""
+한국 행정구역 계층 (시/도 → 시/군/구)
+
+`location` 문자열("서울", "서울 강남", "경기 성남시 분당", "서울 전역", "전국" 등)을
+지역 노드 ID로 정규화하고, 두 지역이 같은 생활권인지(한쪽이 다른 쪽을 포함하는지)
+판정합니다. 예: "서울 강남" ⊂ "서울" → 일치, "서울 강남" vs "서울 마포" → 불일치.
+
+- 노드 0(`NATIONWIDE_REGION`)은 전국 (지역 제약 없음: "전국", "전역", "온라인")
+- "서울 전역"처럼 지역 뒤의 "전역"은 그 지역 전체를 뜻함 (= "서울")
+- 계층에 없는 하위 지명("서울 한강")은 알 수 있는 가장 깊은 지역("서울")으로 정규화
+- 계층에 없는 최상위 지명("해외")은 같은 문자열끼리만 일치하는 노드를 새로 만듦
+
+문자열마다 한 번만 해석하고 결과를 메모해 두므로, 로드 시점에 카탈로그의 고유
+지역 문자열을 정규화한 뒤에는 비교가 정수 연산만으로 끝납니다.
+"""
+
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+NATIONWIDE_REGION = 0
+
+# 지역 전체 / 전국을 뜻하는 단어
+_WHOLE_AREA_WORDS = frozenset({"전역", "전체", "전지역", "일대"})
+_NATIONWIDE_WORDS = frozenset({"전국", "전역", "온라인", "비대면"})
+_AREA_WORDS = _WHOLE_AREA_WORDS | _NATIONWIDE_WORDS
+
+# 시/도: (정식 명칭, 별칭, 시/군/구 목록)
+_PROVINCES: Sequence[Tuple[str, Tuple[str, ...], str]] = (
+    ("서울특별시", ("서울", "서울시"),
+     "종로구 중구 용산구 성동구 광진구 동대문구 중랑구 성북구 강북구 도봉구 노원구 은평구 "
+     "서대문구 마포구 양천구 강서구 구로구 금천구 영등포구 동작구 관악구 서초구 강남구 송파구 강동구"),
+    ("부산광역시", ("부산", "부산시"),
+     "중구 서구 동구 영도구 부산진구 동래구 남구 북구 해운대구 사하구 금정구 강서구 연제구 "
+     "수영구 사상구 기장군"),
+    ("대구광역시", ("대구", "대구시"), "중구 동구 서구 남구 북구 수성구 달서구 달성군 군위군"),
+    ("인천광역시", ("인천", "인천시"),
+     "중구 동구 미추홀구 연수구 남동구 부평구 계양구 서구 강화군 옹진군"),
+    ("광주광역시", ("광주", "광주시"), "동구 서구 남구 북구 광산구"),
+    ("대전광역시", ("대전", "대전시"), "동구 중구 서구 유성구 대덕구"),
+    ("울산광역시", ("울산", "울산시"), "중구 남구 동구 북구 울주군"),
+    ("세종특별자치시", ("세종", "세종시"), ""),
+    ("경기도", ("경기",),
+     "수원시 성남시 의정부시 안양시 부천시 광명시 평택시 동두천시 안산시 고양시 과천시 구리시 "
+     "남양주시 오산시 시흥시 군포시 의왕시 하남시 용인시 파주시 이천시 안성시 김포시 화성시 "
+     "광주시 양주시 포천시 여주시 연천군 가평군 양평군"),
+    ("강원특별자치도", ("강원", "강원도"),
+     "춘천시 원주시 강릉시 동해시 태백시 속초시 삼척시 홍천군 횡성군 영월군 평창군 정선군 "
+     "철원군 화천군 양구군 인제군 고성군 양양군"),
+    ("충청북도", ("충북",),
+     "청주시 충주시 제천시 보은군 옥천군 영동군 증평군 진천군 괴산군 음성군 단양군"),
+    ("충청남도", ("충남",),
+     "천안시 공주시 보령시 아산시 서산시 논산시 계룡시 당진시 금산군 부여군 서천군 청양군 "
+     "홍성군 예산군 태안군"),
+    ("전북특별자치도", ("전북", "전라북도"),
+     "전주시 군산시 익산시 정읍시 남원시 김제시 완주군 진안군 무주군 장수군 임실군 순창군 "
+     "고창군 부안군"),
+    ("전라남도", ("전남",),
+     "목포시 여수시 순천시 나주시 광양시 담양군 곡성군 구례군 고흥군 보성군 화순군 장흥군 "
+     "강진군 해남군 영암군 무안군 함평군 영광군 장성군 완도군 진도군 신안군"),
+    ("경상북도", ("경북",),
+     "포항시 경주시 김천시 안동시 구미시 영주시 영천시 상주시 문경시 경산시 의성군 청송군 "
+     "영양군 영덕군 청도군 고령군 성주군 칠곡군 예천군 봉화군 울진군 울릉군"),
+    ("경상남도", ("경남",),
+     "창원시 진주시 통영시 사천시 김해시 밀양시 거제시 양산시 의령군 함안군 창녕군 고성군 "
+     "남해군 하동군 산청군 함양군 거창군 합천군"),
+    ("제주특별자치도", ("제주", "제주도"), "제주시 서귀포시"),
+)
+
+# 자주 쓰는 동네 / 상권 이름 -> (시/도 별칭, 시/군/구, 없으면 시/도 전체)
+_LANDMARKS: Dict[str, Tuple[str, Optional[str]]] = {
+    "홍대": ("서울", "마포구"), "합정": ("서울", "마포구"), "연남동": ("서울", "마포구"),
+    "상암": ("서울", "마포구"), "신촌": ("서울", "서대문구"), "성수": ("서울", "성동구"),
+    "이태원": ("서울", "용산구"), "한남동": ("서울", "용산구"), "삼청동": ("서울", "종로구"),
+    "인사동": ("서울", "종로구"), "광화문": ("서울", "종로구"), "명동": ("서울", "중구"),
+    "을지로": ("서울", "중구"), "여의도": ("서울", "영등포구"), "잠실": ("서울", "송파구"),
+    "건대": ("서울", "광진구"), "신림": ("서울", "관악구"), "압구정": ("서울", "강남구"),
+    "청담": ("서울", "강남구"), "역삼": ("서울", "강남구"), "삼성동": ("서울", "강남구"),
+    "한강": ("서울", None), "북한산": ("서울", None),
+    "판교": ("경기", "성남시"), "분당": ("경기", "성남시"), "일산": ("경기", "고양시"),
+    "광교": ("경기", "수원시"), "동탄": ("경기", "화성시"),
+    "서면": ("부산", "부산진구"), "광안리": ("부산", "수영구"), "송도": ("인천", "연수구"),
+}
+
+
+def _short_name(name: str) -> str:
+    """'강남구' -> '강남', '성남시' -> '성남' (한 글자만 남으면 그대로: '중구')"""
+    if len(name) > 2 and name[-1] in "시군구":
+        return name[:-1]
+    return name
+
+
+class RegionTree:
+    """시/도 → 시/군/구 2단계 지역 계층 (노드 0은 전국)"""
+
+    def __init__(self):
+        self.names: List[str] = ["전국"]
+        self.parent: List[int] = [NATIONWIDE_REGION]
+        self._provinces: Dict[str, int] = {}
+        self._districts: Dict[Tuple[int, str], int] = {}
+        # 시/군/구 이름만으로 찾기 (여러 시/도에 같은 이름이 있으면 None)
+        self._unique_districts: Dict[str, Optional[int]] = {}
+        self._resolved: Dict[str, int] = {}
+        self._parent_array: Optional[np.ndarray] = None
+        self._lock = threading.Lock()
+
+        for name, aliases, districts in _PROVINCES:
+            province = self._add_node(name, NATIONWIDE_REGION)
+            for key in (name, *aliases):
+                self._provinces[key] = province
+            for district in districts.split():
+                node = self._add_node(f"{name} {district}", province)
+                for key in {district, _short_name(district)}:
+                    self._districts[(province, key)] = node
+                    self._unique_districts[key] = (
+                        node if key not in self._unique_districts else None
+                    )
+
+        for landmark, (province_name, district) in _LANDMARKS.items():
+            province = self._provinces[province_name]
+            node = province if district is None else self._districts[(province, district)]
+            self._districts[(province, landmark)] = node
+            self._unique_districts.setdefault(landmark, node)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def _add_node(self, name: str, parent: int) -> int:
+        self.names.append(name)
+        self.parent.append(parent)
+        self._parent_array = None
+        return len(self.names) - 1
+
+    def resolve(self, location: str) -> int:
+        """`location` 문자열의 지역 노드 ID (문자열마다 한 번만 해석)"""
+        node = self._resolved.get(location)
+        if node is None:
+            with self._lock:
+                node = self._resolved.get(location)
+                if node is None:
+                    node = self._resolved[location] = self._parse(location)
+        return node
+
+    def _parse(self, location: str) -> int:
+        words = location.replace(",", " ").replace("/", " ").split()
+        node = NATIONWIDE_REGION
+        unknown: List[str] = []
+        for word in words:
+            if node == NATIONWIDE_REGION:
+                found = self._provinces.get(word)
+                if found is None:
+                    found = self._unique_districts.get(word) or self._unique_districts.get(_short_name(word))
+            elif self.parent[node] == NATIONWIDE_REGION:
+                found = self._districts.get((node, word)) or self._districts.get((node, _short_name(word)))
+            else:
+                # 시/군/구보다 아래(동, 건물명 등)는 계층에 없으므로 무시
+                found = None
+
+            if found is not None:
+                node = found
+            elif node == NATIONWIDE_REGION and word not in _AREA_WORDS:
+                unknown.append(word)
+
+        if node == NATIONWIDE_REGION and unknown:
+            # 계층에 없는 지명: 같은 문자열끼리만 일치하도록 최상위 노드를 새로 만듦
+            name = " ".join(unknown)
+            node = self._provinces.get(name)
+            if node is None:
+                node = self._provinces[name] = self._add_node(name, NATIONWIDE_REGION)
+        return node
+
+    def is_nationwide(self, node: int) -> bool:
+        return node == NATIONWIDE_REGION
+
+    def compatible(self, a: int, b: int) -> bool:
+        """같은 지역이거나 한쪽이 다른 쪽을 포함하는지 (전국은 어느 지역과도 일치로 보지 않음)"""
+        if a == NATIONWIDE_REGION or b == NATIONWIDE_REGION:
+            return False
+        return a == b or self.parent[a] == b or self.parent[b] == a
+
+    def compatible_mask(self, nodes: np.ndarray, node: int) -> np.ndarray:
+        """`nodes` 각각이 `node`와 일치하는지 (`compatible()`의 벡터 버전)"""
+        if node == NATIONWIDE_REGION:
+            return np.zeros(len(nodes), dtype=bool)
+        parent = self._parents()
+        return (
+            (nodes == node)
+            | (parent[nodes] == node)
+            | ((nodes == self.parent[node]) & (nodes != NATIONWIDE_REGION))
+        )
+
+    def related(self, node: int) -> List[int]:
+        """`node`와 일치하는 모든 노드 (상위 지역 + 자신 + 하위 지역)"""
+        if node == NATIONWIDE_REGION:
+            return []
+        nodes = [node]
+        if self.parent[node] != NATIONWIDE_REGION:
+            nodes.append(self.parent[node])
+        nodes.extend(child for child, parent in enumerate(self.parent) if parent == node and child != node)
+        return nodes
+
+    def _parents(self) -> np.ndarray:
+        parent = self._parent_array
+        if parent is None or len(parent) != len(self.parent):
+            parent = self._parent_array = np.asarray(self.parent, dtype=np.int32)
+        return parent
+
+
+# 프로세스 전역 지역 계층 (노드 ID는 프로세스 안에서만 의미가 있음)
+REGIONS = RegionTree()
+
+
+def region_of(location: str) -> int:
+    """지역 문자열의 노드 ID"""
+    return REGIONS.resolve(location)
+
+
+def regions_match(a: str, b: str) -> bool:
+    """두 지역 문자열이 같은 생활권인지 ("서울 강남"과 "서울"은 일치)"""
+    return REGIONS.compatible(REGIONS.resolve(a), REGIONS.resolve(b))
@@ -0,0 +1,70 @@
+"""
+프로세스 전역 MatchingService 레지스트리
+
+Streamlit은 버튼을 누를 때마다 스크립트를 다시 실행하므로, 서비스를 매번 만들면
+프로그램 파일 파싱과 Azure OpenAI 클라이언트(HTTP 연결 풀) 생성이 반복됩니다.
+이 레지스트리는 (모드, 프로그램 파일)마다 미리 준비된 서비스 하나를 유지하고,
+프로그램 파일이 바뀌면 바뀐 프로그램만 카탈로그에 반영합니다 (`CatalogWatcher`).
+"""
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from services.catalog_watcher import CatalogWatcher
+from services.matching_service import MatchingService
+from services.snapshot import is_snapshot
+
+
+DEFAULT_PROGRAMS_PATH = "data/sample_programs.json"
+
+
+@dataclass
+class _Entry:
+    service: MatchingService
+    watcher: Optional[CatalogWatcher]  # 스냅샷 파일이면 감시하지 않음
+
+
+_lock = threading.Lock()
+_services: Dict[Tuple[bool, str], _Entry] = {}
+
+
+def get_matching_service(
+    use_ai: bool = False,
+    programs_path: str = DEFAULT_PROGRAMS_PATH
+) -> MatchingService:
+    """
+    모드별로 하나씩 유지되는 MatchingService 반환
+
+    Args:
+        use_ai: True면 AI 모드 서비스, False면 규칙 기반 서비스
+        programs_path: 프로그램 JSON / JSON Lines / 스냅샷 파일 경로
+
+    Returns:
+        프로그램이 로드된 MatchingService (JSON 파일이 바뀌었으면 변경분이 반영됨)
+    """
+    path = Path(programs_path).resolve()
+    key = (use_ai, str(path))
+
+    with _lock:
+        entry = _services.get(key)
+
+        if entry is None:
+            service = MatchingService(use_ai=use_ai)
+            watcher = None if is_snapshot(str(path)) else CatalogWatcher(service, str(path))
+            service.load_programs_from_file(str(path))
+            _services[key] = _Entry(service, watcher)
+            return service
+
+        if entry.watcher is not None:
+            entry.watcher.check()
+        return entry.service
+
+
+def clear_matching_services() -> None:
+    """레지스트리 비우기 (워커 프로세스 종료 포함)"""
+    with _lock:
+        for entry in _services.values():
+            entry.service.close()
+        _services.clear()
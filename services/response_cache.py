@@ -0,0 +1,167 @@
+"""
+AI 추천 응답 캐시 (메모리 LRU + SQLite 디스크 2단 캐시)
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+
+@dataclass
+class CacheStats:
+    """캐시 적중/미스 카운터"""
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def canonical_json(value: Any) -> str:
+    """키 정렬 + 공백 없는 JSON 문자열 (같은 내용이면 항상 같은 문자열)"""
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+
+
+def content_hash(text: str) -> str:
+    """문자열의 SHA-256 16진수 해시"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_cache_key(**parts: Any) -> str:
+    """요청 구성 요소로 안정적인 캐시 키(SHA-256) 생성"""
+    return content_hash(canonical_json(parts))
+
+
+class ResponseCache:
+    """내용 주소 기반 응답 캐시
+
+    - 메모리 계층: 최대 `max_entries`개를 LRU로 유지
+    - 디스크 계층(선택): SQLite 파일, 최대 `max_disk_entries`개를 최근 사용 순으로 유지
+    - 모든 항목은 `ttl_seconds`가 지나면 만료
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: float = 3600,
+        db_path: Optional[str] = None,
+        max_disk_entries: int = 10_000
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_disk_entries = max_disk_entries
+        self.stats = CacheStats()
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at <= self.ttl_seconds:
+                    self._memory.move_to_end(key)
+                    self.stats.memory_hits += 1
+                    return json.loads(value)
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    value, created_at = row
+                    if now - created_at <= self.ttl_seconds:
+                        self._db.execute(
+                            "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+                        )
+                        self._db.commit()
+                        self._remember(key, created_at, value)
+                        self.stats.disk_hits += 1
+                        return json.loads(value)
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self._db.commit()
+
+            self.stats.misses += 1
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """캐시 저장 (JSON 직렬화 가능한 값)"""
+        now = time.time()
+        serialized = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, now, serialized)
+            self.stats.stores += 1
+
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, serialized, now, now),
+                )
+                self._db.execute(
+                    "DELETE FROM responses WHERE created_at < ?", (now - self.ttl_seconds,)
+                )
+                self._db.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """모든 계층 비우기"""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._db.commit()
+
+    def close(self) -> None:
+        """디스크 연결 종료"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, created_at: float, value: str) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
@@ -0,0 +1,86 @@
+"""
+요일 일정 (7비트 요일 마스크)
+
+멘토/멘티의 활동 가능 요일과 프로그램 진행 요일을 월=bit0 ... 일=bit6 마스크로
+바꿔 겹치는 요일을 비트 AND로 판정합니다.
+
+- 멘토와 멘티가 함께 가능한 요일이 없으면 그 쌍은 추천하지 않음 (하드 필터)
+- 프로그램이 함께 가능한 요일에 진행되지 않으면 후보에서 제외 (하드 필터)
+- 함께 가능한 요일 중 프로그램이 진행되는 비율만큼 일정 점수 부여 (최대 `SCHEDULE_WEIGHT`)
+"""
+
+from typing import TYPE_CHECKING, List, Sequence
+
+import numpy as np
+
+from models import Mentor, Mentee, MentoringProgram
+
+if TYPE_CHECKING:
+    from services.snapshot import Snapshot
+
+
+DAY_NAMES = ["월", "화", "수", "목", "금", "토", "일"]
+ALL_DAYS = (1 << len(DAY_NAMES)) - 1
+
+# 요일 묶음 표현
+_DAY_GROUPS = {"평일": 0b0011111, "주말": 0b1100000, "매일": ALL_DAYS}
+
+# 일정 적합성 점수 (함께 가능한 요일을 모두 커버하면 만점)
+SCHEDULE_WEIGHT = 5
+
+# 마스크별 요일 수
+DAY_COUNT = np.array([bin(mask).count("1") for mask in range(ALL_DAYS + 1)], dtype=np.int64)
+
+
+def encode_days(days: Sequence[str]) -> int:
+    """요일 목록을 7비트 마스크로 변환 (월=bit0 ... 일=bit6, "월요일"/"평일"/"주말"도 인식)"""
+    mask = 0
+    for day in days:
+        day = day.strip()
+        if day in _DAY_GROUPS:
+            mask |= _DAY_GROUPS[day]
+            continue
+        if day.endswith("요일"):
+            day = day[:-2]
+        if day in DAY_NAMES:
+            mask |= 1 << DAY_NAMES.index(day)
+    return mask
+
+
+def decode_days(mask: int) -> List[str]:
+    """7비트 마스크를 요일 목록으로 변환"""
+    return [name for bit, name in enumerate(DAY_NAMES) if mask >> bit & 1]
+
+
+def pair_days(mentor: Mentor, mentee: Mentee) -> int:
+    """멘토와 멘티가 함께 가능한 요일 마스크 (0이면 만날 수 있는 요일이 없음)"""
+    return encode_days(mentor.available_days) & encode_days(mentee.available_days)
+
+
+def program_days(program: MentoringProgram) -> int:
+    """프로그램 진행 요일 마스크 (지정하지 않았으면 모든 요일)"""
+    return encode_days(program.available_days) or ALL_DAYS
+
+
+def schedule_points(shared_days: int, days: int) -> float:
+    """함께 가능한 요일(`shared_days`) 중 프로그램이 진행되는 요일 비율만큼의 점수"""
+    if not shared_days:
+        return 0.0
+    return SCHEDULE_WEIGHT * int(DAY_COUNT[shared_days & days]) / int(DAY_COUNT[shared_days])
+
+
+def snapshot_program_days(snapshot: "Snapshot") -> np.ndarray:
+    """프로그램 스냅샷의 `available_days` 컬럼에서 프로그램별 요일 마스크 배열 계산"""
+    table = np.asarray(
+        [encode_days([day]) for day in snapshot.strings("available_days").tolist()],
+        dtype=np.uint8,
+    )
+    codes = snapshot.column("available_days.codes")
+    owner = np.repeat(
+        np.arange(len(snapshot), dtype=np.int64),
+        np.diff(snapshot.column("available_days.offsets")),
+    )
+    days = np.zeros(len(snapshot), dtype=np.uint8)
+    np.bitwise_or.at(days, owner, table[codes])
+    days[days == 0] = ALL_DAYS
+    return days
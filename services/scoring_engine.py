@@ -0,0 +1,381 @@
+"""
+컬럼 기반 규칙 점수 엔진 (NumPy 벡터화)
+
+`MatchingService._calculate_match_score`와 동일한 5단계 규칙(지역/예산/관심사/직무/일정)을
+프로그램 전체에 대해 한 번의 NumPy 연산으로 계산합니다.
+"""
+
+import copy
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+from models import Mentor, Mentee, MentoringProgram
+from services.regions import NATIONWIDE_REGION, REGIONS
+from services.schedule import DAY_COUNT, SCHEDULE_WEIGHT, encode_days, program_days, snapshot_program_days
+from services.vocabulary import Vocabulary, any_common, rows_to_matrix, to_words, widen
+
+if TYPE_CHECKING:
+    from services.snapshot import Snapshot
+
+
+ALL_ROLES = "모든 직군"
+
+
+def activity_keywords(program: MentoringProgram) -> str:
+    """관심사 매칭에 사용하는 활동 키워드 문자열 (활동 유형 + 태그, 소문자)"""
+    return program.activity_type.lower() + " " + " ".join(program.tags).lower()
+
+
+def _words(keywords: str) -> List[str]:
+    """활동 키워드 문자열의 단어 (공백 기준)"""
+    return keywords.split()
+
+
+def _is_word_term(term: str) -> bool:
+    """공백이 없는 관심사인지 (단어 비트셋으로 판정 가능)
+
+    공백이 없는 문자열이 키워드 문자열에 포함되면 반드시 한 단어 안에 들어 있으므로
+    `term in keywords`는 "term을 포함하는 단어가 키워드 문자열에 있는지"와 같습니다.
+    """
+    return term.split() == [term]
+
+
+class ProgramColumns:
+    """프로그램 카탈로그의 컬럼 표현
+
+    로드 시점에 한 번 만들어지며, 이후 멘토/멘티 쌍마다 `score()`로
+    모든 프로그램의 점수를 한 번에 계산합니다. 카탈로그가 바뀌면
+    `append()` / `replace()` / `remove()`로 바뀐 행만 반영합니다.
+
+    관심사와 직무 비교는 어휘 사전(`services/vocabulary.py`) 위의 비트셋으로 처리합니다.
+    - 활동 키워드 문자열마다 포함된 단어의 비트셋(`keyword_words`)을 두고, 관심사는
+      "관심사를 포함하는 단어" 비트셋으로 한 번만 풀어 둔 뒤 AND로 판정
+    - 프로그램마다 추천 직군 비트셋(`job_bits`)을 두고, 프로필은 "직무명에 들어 있는
+      직군" 비트셋으로 한 번만 풀어 둔 뒤 AND로 판정
+    """
+
+    def __init__(self, programs: Sequence[MentoringProgram]):
+        self.size = 0
+
+        # 비용 / 진행 요일 마스크 컬럼
+        self.cost = np.empty(0, dtype=np.int64)
+        self.days = np.empty(0, dtype=np.uint8)
+
+        # 지역 / 활동 키워드는 고유 문자열 테이블 + 코드로 저장
+        self.locations = Vocabulary()
+        self.location_code = np.empty(0, dtype=np.int32)
+        # 지역 테이블별 지역 노드 ID (`services/regions.py`)
+        self.location_region = np.empty(0, dtype=np.int32)
+        self.keywords = Vocabulary()
+        self.keyword_code = np.empty(0, dtype=np.int32)
+
+        # 키워드 문자열별 단어 비트셋 [키워드 수, 단어 비트셋 길이]
+        self.words = Vocabulary()
+        self.keyword_words = np.zeros((0, 1), dtype=np.uint64)
+
+        # 프로그램별 추천 직군 비트셋 [프로그램 수, 직군 비트셋 길이]
+        self.jobs = Vocabulary()
+        self.job_bits = np.zeros((0, 1), dtype=np.uint64)
+
+        # 공백이 들어간 관심사(소문자) -> 키워드 테이블 위의 포함 여부 마스크 (요청 간 재사용)
+        self._term_masks: Dict[str, np.ndarray] = {}
+
+        self.append(programs)
+
+    @classmethod
+    def from_snapshot(cls, snapshot: "Snapshot") -> "ProgramColumns":
+        """
+        프로그램 스냅샷의 컬럼으로 바로 구성 (MentoringProgram 객체를 만들지 않음)
+
+        스냅샷의 코드 배열은 이 클래스의 코드 체계(고유 문자열 테이블 + 코드)와 같으므로
+        테이블만 디코딩하고 숫자 컬럼은 복사해 사용합니다 (이후 제자리 갱신 가능).
+        """
+        columns = cls(())
+        columns.size = len(snapshot)
+        columns.cost = np.array(snapshot.column("estimated_cost"), dtype=np.int64)
+        columns.days = snapshot_program_days(snapshot)
+
+        columns.locations = Vocabulary(snapshot.strings("location").tolist())
+        columns.location_code = np.array(snapshot.column("location.codes"))
+        columns.keywords = Vocabulary(snapshot.strings("@keywords").tolist())
+        columns.keyword_code = np.array(snapshot.column("@keywords.codes"))
+        columns.jobs = Vocabulary(snapshot.strings("recommended_for").tolist())
+
+        # (프로그램, 직군 코드) 쌍을 비트셋 행렬에 한 번에 OR
+        job_code = np.asarray(snapshot.column("recommended_for.codes"), dtype=np.int64)
+        job_program = np.repeat(
+            np.arange(columns.size, dtype=np.int64),
+            np.diff(snapshot.column("recommended_for.offsets")),
+        )
+        columns.job_bits = np.zeros((columns.size, columns.jobs.n_words), dtype=np.uint64)
+        np.bitwise_or.at(
+            columns.job_bits,
+            (job_program, job_code >> 6),
+            np.left_shift(np.uint64(1), (job_code & 63).astype(np.uint64)),
+        )
+
+        columns._extend_tables(0, 0)
+        return columns
+
+    def copy(self) -> "ProgramColumns":
+        """
+        변경용 사본 (copy-on-write, `ProgramIndex.copy()`와 함께 사용)
+
+        제자리에서 바뀌는 컬럼과 어휘 사전만 복사하고, 통째로 다시 만드는 파생 배열은 공유합니다.
+        """
+        columns = copy.copy(self)
+        columns.cost = self.cost.copy()
+        columns.days = self.days.copy()
+        columns.location_code = self.location_code.copy()
+        columns.keyword_code = self.keyword_code.copy()
+        columns.job_bits = self.job_bits.copy()
+        columns.locations = self.locations.copy()
+        columns.keywords = self.keywords.copy()
+        columns.words = self.words.copy()
+        columns.jobs = self.jobs.copy()
+        columns._term_masks = {}
+        return columns
+
+    def append(self, programs: Iterable[MentoringProgram]) -> None:
+        """프로그램을 카탈로그 끝에 추가 (기존 행은 그대로 유지)"""
+        programs = list(programs)
+        tables = self._table_sizes()
+
+        location_code = [self.locations.add(p.location) for p in programs]
+        keyword_code = [self.keywords.add(activity_keywords(p)) for p in programs]
+        job_bits = [self.jobs.bits(p.recommended_for) for p in programs]
+
+        self.size += len(programs)
+        self.cost = np.concatenate([
+            self.cost, np.asarray([p.estimated_cost for p in programs], dtype=np.int64)
+        ])
+        self.days = np.concatenate([
+            self.days, np.asarray([program_days(p) for p in programs], dtype=np.uint8)
+        ])
+        self.location_code = np.concatenate([
+            self.location_code, np.asarray(location_code, dtype=np.int32)
+        ])
+        self.keyword_code = np.concatenate([
+            self.keyword_code, np.asarray(keyword_code, dtype=np.int32)
+        ])
+        n_words = self.jobs.n_words
+        self.job_bits = np.concatenate([
+            widen(self.job_bits, n_words), rows_to_matrix(job_bits, n_words)
+        ])
+        self._extend_tables(*tables)
+
+    def replace(self, pos: int, program: MentoringProgram) -> None:
+        """위치 `pos`의 프로그램을 새 내용으로 교체 (다른 행은 그대로 유지)"""
+        tables = self._table_sizes()
+
+        self.cost[pos] = program.estimated_cost
+        self.days[pos] = program_days(program)
+        self.location_code[pos] = self.locations.add(program.location)
+        self.keyword_code[pos] = self.keywords.add(activity_keywords(program))
+
+        job_bits = self.jobs.bits(program.recommended_for)
+        self.job_bits = widen(self.job_bits, self.jobs.n_words)
+        self.job_bits[pos] = to_words(job_bits, self.jobs.n_words)
+        self._extend_tables(*tables)
+
+    def remove(self, positions: Iterable[int]) -> None:
+        """지정한 위치의 프로그램 제거 (뒤의 행은 앞으로 당겨짐, `ProgramIndex.remove`와 동일)"""
+        keep = np.ones(self.size, dtype=bool)
+        keep[list(positions)] = False
+
+        # 문자열 테이블은 그대로 둠 (쓰이지 않는 항목은 점수에 영향 없음)
+        self.size = int(keep.sum())
+        self.cost = self.cost[keep]
+        self.days = self.days[keep]
+        self.location_code = self.location_code[keep]
+        self.keyword_code = self.keyword_code[keep]
+        self.job_bits = self.job_bits[keep]
+
+    def _table_sizes(self) -> Tuple[int, int]:
+        return len(self.locations), len(self.keywords)
+
+    def _extend_tables(self, location_count: int, keyword_count: int) -> None:
+        """새로 생긴 지역/키워드 문자열에 맞춰 파생 배열을 늘림"""
+        new_locations = self.locations.terms[location_count:]
+        if new_locations:
+            self.location_region = np.concatenate([
+                self.location_region,
+                np.asarray([REGIONS.resolve(loc) for loc in new_locations], dtype=np.int32),
+            ])
+
+        new_keywords = self.keywords.terms[keyword_count:]
+        if new_keywords:
+            rows = [self.words.bits(_words(keywords)) for keywords in new_keywords]
+            n_words = self.words.n_words
+            self.keyword_words = np.concatenate([
+                widen(self.keyword_words, n_words), rows_to_matrix(rows, n_words)
+            ])
+            for term, mask in self._term_masks.items():
+                self._term_masks[term] = np.concatenate([
+                    mask, np.asarray([term in keywords for keywords in new_keywords], dtype=bool)
+                ])
+
+    def __len__(self) -> int:
+        return self.size
+
+    def keyword_mask(self, term: str) -> np.ndarray:
+        """`term`이 포함된 활동 키워드 문자열 마스크 (키워드 테이블 기준)"""
+        if _is_word_term(term):
+            return any_common(self.keyword_words, self.words.containing(term))
+        mask = self._term_masks.get(term)
+        if mask is None:
+            mask = np.fromiter(
+                (term in keywords for keywords in self.keywords.terms),
+                dtype=bool,
+                count=len(self.keywords),
+            )
+            self._term_masks[term] = mask
+        return mask
+
+    def _any_keyword_mask(self, interests: Iterable[str]) -> np.ndarray:
+        # 단어 하나짜리 관심사는 비트셋을 모아 한 번에 AND, 나머지만 문자열 마스크로 OR
+        word_bits = 0
+        mask = np.zeros(len(self.keywords), dtype=bool)
+        for interest in interests:
+            term = interest.lower()
+            if _is_word_term(term):
+                word_bits |= self.words.containing(term)
+            else:
+                mask |= self.keyword_mask(term)
+        if word_bits:
+            mask |= any_common(self.keyword_words, word_bits)
+        return mask
+
+    def profile_features(self, profile: Union[Mentor, Mentee]) -> "ProfileFeatures":
+        """멘토 또는 멘티 한 명에 대해 쌍과 무관한 특징을 미리 계산"""
+        location_hit = REGIONS.compatible_mask(
+            self.location_region, REGIONS.resolve(profile.location)
+        )
+
+        interests = set(profile.interests)
+        return ProfileFeatures(
+            location_hit=location_hit,
+            job_bits=self.jobs.within(profile.job_title),
+            days=encode_days(profile.available_days),
+            interests=interests,
+            interest_mask=self._any_keyword_mask(interests),
+        )
+
+    def score(
+        self,
+        mentor: Mentor,
+        mentee: Mentee,
+        positions: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        멘토/멘티 쌍에 대한 프로그램 점수를 한 번에 계산
+
+        Args:
+            mentor: 멘토 프로필
+            mentee: 멘티 프로필
+            positions: 점수를 계산할 프로그램 위치 (None이면 전체)
+
+        Returns:
+            `_calculate_match_score`와 동일한 점수 배열 (float64)
+        """
+        return self.score_features(
+            self.profile_features(mentor),
+            self.profile_features(mentee),
+            mentee.budget_limit,
+            positions,
+        )
+
+    def score_features(
+        self,
+        mentor: "ProfileFeatures",
+        mentee: "ProfileFeatures",
+        budget: int,
+        positions: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """미리 계산한 멘토/멘티 특징으로 점수 계산 (대량 매칭에서 재사용)"""
+        idx = slice(None) if positions is None else positions
+
+        # 1. 지역 매칭 (25점) - 고유 지역 문자열마다 한 번만 판정
+        location_points = np.where(
+            mentor.location_hit | mentee.location_hit,
+            25.0,
+            np.where(self.location_region == NATIONWIDE_REGION, 20.0, 5.0),
+        )
+        score = location_points[self.location_code[idx]]
+
+        # 2. 예산 적합성 (25점)
+        cost = self.cost[idx]
+        if budget:
+            ratio = cost / budget
+        else:
+            ratio = np.zeros(cost.shape, dtype=np.float64)
+        budget_points = np.where(ratio <= 0.5, 25, np.where(ratio <= 0.8, 20, 15))
+        score += np.where(cost <= budget, budget_points, 0)
+
+        # 3. 관심사 일치도 (30점)
+        common_interests = mentor.interests & mentee.interests
+        keyword_code = self.keyword_code[idx]
+        if common_interests:
+            hit = self._any_keyword_mask(common_interests)[keyword_code]
+            score += np.where(hit, 30, 20)
+        else:
+            hit = (mentor.interest_mask | mentee.interest_mask)[keyword_code]
+            score += np.where(hit, 15, 5)
+
+        # 4. 직무 적합성 (15점) - "모든 직군" 프로그램은 항상 일치
+        job_bits = mentor.job_bits | mentee.job_bits
+        all_roles = self.jobs.get(ALL_ROLES)
+        if all_roles is not None:
+            job_bits |= 1 << all_roles
+        job_match = any_common(self.job_bits[idx], job_bits)
+        score += np.where(job_match, 15, 8)
+
+        # 5. 일정 적합성 (5점) - 함께 가능한 요일 중 프로그램이 진행되는 비율
+        pair_days = mentor.days & mentee.days
+        if pair_days:
+            common = DAY_COUNT[self.days[idx] & pair_days]
+            score += SCHEDULE_WEIGHT * common / DAY_COUNT[pair_days]
+
+        # 점수 정규화 (0-100)
+        return np.minimum(100, score)
+
+
+@dataclass
+class ProfileFeatures:
+    """프로그램 카탈로그 기준으로 미리 계산한 프로필 특징"""
+
+    location_hit: np.ndarray    # 지역 테이블별: 프로그램 지역과 프로필 지역이 서로 포함 관계인지
+    job_bits: int               # 직군 어휘 비트셋: 프로필 직무명에 포함되는 직군
+    interests: Set[str]         # 관심사 집합
+    interest_mask: np.ndarray   # 키워드 테이블별: 관심사 중 하나라도 포함되는지
+    days: int                   # 활동 가능 요일 마스크
+
+
+def select_top_k(scores: np.ndarray, positions: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수 상위 k개를 부분 선택 (O(N + k log k))
+
+    동점은 카탈로그 위치(`positions`)가 작은 쪽이 앞서므로 전체 안정 정렬과
+    같은 결과를 돌려줍니다.
+
+    Returns:
+        `scores` 기준 인덱스 배열 (점수 내림차순, 동점이면 위치 오름차순)
+    """
+    n = len(scores)
+    if k <= 0 or n == 0:
+        return np.empty(0, dtype=np.int64)
+    if k < n:
+        # k번째 점수(경계값)를 찾고, 경계값보다 큰 것은 모두, 같은 것은 위치 순으로 채움
+        threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        above = np.flatnonzero(scores > threshold)
+        ties = np.flatnonzero(scores == threshold)
+        need = k - len(above)
+        if need < len(ties):
+            ties = ties[np.argpartition(positions[ties], need - 1)[:need]]
+        candidates = np.concatenate([above, ties])
+    else:
+        candidates = np.arange(n)
+    order = np.lexsort((positions[candidates], -scores[candidates]))
+    return candidates[order]
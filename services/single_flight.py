@@ -0,0 +1,85 @@
+"""
+진행 중인 동일 요청 합치기 (single-flight)
+
+같은 키의 호출이 이미 진행 중이면 새로 호출하지 않고 그 결과(또는 예외)를 함께 받습니다.
+응답 캐시는 호출이 끝난 뒤에야 채워지므로, 몇 초씩 걸리는 LLM 호출이 끝나기 전에
+같은 요청이 여러 번 들어오는 경우(여러 사용자, 대량 매칭)는 이 계층이 막아 줍니다.
+
+- `do(key, func)`: 스레드용. 먼저 온 호출자가 `func()`를 실행하고 나머지는 결과를 기다림
+- `ado(key, factory)`: 비동기용. `factory()`가 만든 코루틴 하나를 태스크로 실행하고
+  같은 이벤트 루프의 호출자들이 함께 기다림 (먼저 온 호출자가 취소돼도 태스크는 계속 진행)
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class SingleFlight:
+    """키별로 진행 중인 호출을 하나로 합치는 도우미 (스레드 / 비동기 경로 각각)"""
+
+    def __init__(self, on_coalesced: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            on_coalesced: 호출이 합쳐질 때마다(새로 실행하지 않고 기다릴 때) 불리는 콜백
+        """
+        self.on_coalesced = on_coalesced
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._tasks: Dict[Tuple[int, Hashable], asyncio.Task] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """`key`로 진행 중인 호출이 있으면 그 결과를, 없으면 `func()`를 실행해 반환"""
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if not leader:
+            self._joined()
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    async def ado(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """`do`의 비동기 버전 (같은 이벤트 루프 안에서만 합침)"""
+        # 태스크는 만든 루프에 묶이므로 루프별로 구분
+        loop = asyncio.get_running_loop()
+        task_key = (id(loop), key)
+        task = self._tasks.get(task_key)
+        if task is None or task.get_loop() is not loop:
+            task = self._tasks[task_key] = loop.create_task(factory())
+            task.add_done_callback(lambda done: self._forget(task_key, done))
+        else:
+            self._joined()
+        # shield: 기다리던 호출자 하나가 취소돼도 다른 호출자의 결과는 유지
+        return await asyncio.shield(task)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._calls) + len(self._tasks)
+
+    def _forget(self, task_key: Tuple[int, Hashable], task: asyncio.Task) -> None:
+        if self._tasks.get(task_key) is task:
+            del self._tasks[task_key]
+        # 기다리던 호출자가 모두 취소된 경우에도 "예외를 확인하지 않음" 경고가 나지 않도록 조회
+        if not task.cancelled():
+            task.exception()
+
+    def _joined(self) -> None:
+        with self._lock:
+            self.coalesced += 1
+        if self.on_coalesced is not None:
+            self.on_coalesced()
@@ -0,0 +1,338 @@
+"""
+바이너리 컬럼 스냅샷 (빠른 시작용)
+
+프로그램 카탈로그나 멘토/멘티 목록을 한 번 검증한 뒤 컬럼 형식의 바이너리 파일로
+저장합니다. 다시 열 때는 파일을 메모리 맵으로 열고 헤더만 읽으므로 JSON 파싱과
+Pydantic 검증이 없으며, 모델 객체는 실제로 필요한 레코드만 만들어집니다.
+
+파일 구조:
+    MAGIC(8바이트) | 형식 버전(uint32) | 헤더 길이(uint32) | 헤더(JSON) | 컬럼 데이터...
+
+- 숫자 필드: 고정 폭 int64 컬럼 (Optional이면 null 마스크 컬럼 추가)
+- 문자열 필드: 고유 문자열 테이블 + int32 코드 (None은 -1)
+- 문자열 목록 필드: 레코드별 오프셋(int64) + 코드(int32) + 고유 문자열 테이블
+- 모든 컬럼은 64바이트 경계에 정렬되어 `np.frombuffer`로 복사 없이 읽습니다.
+"""
+
+import json
+import mmap
+import os
+import struct
+import typing
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+import numpy as np
+from pydantic import BaseModel
+
+from models import Mentor, Mentee, MentoringProgram
+from services.data_loader import trusted_constructor
+from services.scoring_engine import activity_keywords
+
+
+SNAPSHOT_MAGIC = b"MTCHSNAP"
+# 파일 구조나 파생 컬럼 정의가 바뀌면 올림 (다른 버전의 파일은 열지 않음)
+SNAPSHOT_FORMAT_VERSION = 2
+SNAPSHOT_SUFFIX = ".snap"
+
+_PREAMBLE = struct.Struct("<8sII")
+_ALIGNMENT = 64
+
+SNAPSHOT_MODELS: Dict[str, Type[BaseModel]] = {
+    "MentoringProgram": MentoringProgram,
+    "Mentor": Mentor,
+    "Mentee": Mentee,
+}
+
+# 모델별 파생 컬럼 (점수 엔진이 바로 쓰는 값을 저장 시점에 미리 계산)
+DERIVED_COLUMNS: Dict[str, Dict[str, Callable[[Any], str]]] = {
+    "MentoringProgram": {"keywords": activity_keywords},
+}
+
+
+def is_snapshot(file_path: str) -> bool:
+    """파일이 스냅샷 형식인지 (앞 8바이트로 판단)"""
+    try:
+        with open(file_path, "rb") as f:
+            return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+
+def _field_kind(annotation: Any) -> Tuple[str, bool]:
+    """필드 타입을 (종류, Optional 여부)로 분류: 종류는 int / str / str_list"""
+    optional = False
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        optional = len(args) < len(typing.get_args(annotation))
+        annotation = args[0] if len(args) == 1 else annotation
+
+    if annotation is int:
+        return "int", optional
+    if annotation is str:
+        return "str", optional
+    if typing.get_origin(annotation) in (list, List) and typing.get_args(annotation) == (str,):
+        return "str_list", optional
+    raise TypeError(f"스냅샷에 저장할 수 없는 필드 타입입니다: {annotation}")
+
+
+class _StringInterner:
+    def __init__(self):
+        self.codes: Dict[str, int] = {}
+        self.table: List[str] = []
+
+    def code(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.table)
+            self.table.append(value)
+        return code
+
+    def arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(UTF-8 바이트 blob, 문자열 경계 오프셋)"""
+        encoded = [value.encode("utf-8") for value in self.table]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+        return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+def write_snapshot(records: Iterable[BaseModel], model: Type[BaseModel], file_path: str) -> int:
+    """
+    모델 목록을 컬럼 스냅샷 파일로 저장
+
+    Args:
+        records: 저장할 모델 (한 번만 순회)
+        model: 모델 클래스 (MentoringProgram, Mentor, Mentee)
+        file_path: 출력 파일 경로 (임시 파일에 쓴 뒤 교체하므로 읽는 쪽과 충돌하지 않음)
+
+    Returns:
+        저장한 레코드 수
+    """
+    model_name = model.__name__
+    if SNAPSHOT_MODELS.get(model_name) is not model:
+        raise ValueError(f"스냅샷을 지원하지 않는 모델입니다: {model_name}")
+
+    fields = {name: _field_kind(info.annotation) for name, info in model.model_fields.items()}
+    derived = DERIVED_COLUMNS.get(model_name, {})
+
+    ints: Dict[str, List[int]] = {name: [] for name, (kind, _) in fields.items() if kind == "int"}
+    nulls: Dict[str, List[bool]] = {name: [] for name, (kind, opt) in fields.items() if kind == "int" and opt}
+    codes: Dict[str, List[int]] = {}
+    interners: Dict[str, _StringInterner] = {}
+    list_offsets: Dict[str, List[int]] = {}
+    for name, (kind, _) in list(fields.items()) + [(f"@{name}", ("str", False)) for name in derived]:
+        if kind in ("str", "str_list"):
+            codes[name] = []
+            interners[name] = _StringInterner()
+        if kind == "str_list":
+            list_offsets[name] = [0]
+
+    count = 0
+    for record in records:
+        for name, (kind, _) in fields.items():
+            value = getattr(record, name)
+            if kind == "int":
+                ints[name].append(0 if value is None else value)
+                if name in nulls:
+                    nulls[name].append(value is None)
+            elif kind == "str":
+                codes[name].append(interners[name].code(value))
+            else:
+                interner = interners[name]
+                codes[name].extend(interner.code(item) for item in value or ())
+                list_offsets[name].append(len(codes[name]))
+        for name, func in derived.items():
+            codes[f"@{name}"].append(interners[f"@{name}"].code(func(record)))
+        count += 1
+
+    columns: Dict[str, np.ndarray] = {}
+    for name, values in ints.items():
+        columns[name] = np.asarray(values, dtype=np.int64)
+    for name, values in nulls.items():
+        columns[f"{name}.null"] = np.asarray(values, dtype=np.bool_)
+    for name, values in codes.items():
+        columns[f"{name}.codes"] = np.asarray(values, dtype=np.int32)
+        columns[f"{name}.table.blob"], columns[f"{name}.table.offsets"] = interners[name].arrays()
+    for name, values in list_offsets.items():
+        columns[f"{name}.offsets"] = np.asarray(values, dtype=np.int64)
+
+    _write_columns(file_path, {
+        "model": model_name,
+        "count": count,
+        "fields": {name: [kind, optional] for name, (kind, optional) in fields.items()},
+        "derived": sorted(derived),
+    }, columns)
+    return count
+
+
+def _write_columns(file_path: str, meta: Dict[str, Any], columns: Dict[str, np.ndarray]) -> None:
+    # 헤더 길이가 컬럼 오프셋에 영향을 주므로, 오프셋은 헤더 뒤 데이터 영역 기준으로 기록
+    layout: Dict[str, Dict[str, Any]] = {}
+    offset = 0
+    for name, array in columns.items():
+        layout[name] = {"dtype": array.dtype.str, "count": int(array.size), "offset": offset}
+        offset = _align(offset + array.nbytes)
+    header = json.dumps({**meta, "columns": layout}, ensure_ascii=False).encode("utf-8")
+    data_start = _align(_PREAMBLE.size + len(header))
+
+    path = Path(file_path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(_PREAMBLE.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header)))
+        f.write(header)
+        for name, array in columns.items():
+            f.seek(data_start + layout[name]["offset"])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+class StringTable(Sequence):
+    """스냅샷의 고유 문자열 테이블 (필요한 항목만 디코딩)"""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+        self._decoded: Dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, code: int) -> str:
+        value = self._decoded.get(code)
+        if value is None:
+            start, end = self._offsets[code], self._offsets[code + 1]
+            value = self._decoded[code] = self._blob[start:end].tobytes().decode("utf-8")
+        return value
+
+    def tolist(self) -> List[str]:
+        """테이블 전체를 한 번에 디코딩"""
+        text = self._blob.tobytes()
+        bounds = self._offsets.tolist()
+        return [text[start:end].decode("utf-8") for start, end in zip(bounds, bounds[1:])]
+
+
+class Snapshot:
+    """메모리 맵으로 연 스냅샷 파일 (읽기 전용)"""
+
+    def __init__(self, file_path: str):
+        self.path = Path(file_path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, header_size = _PREAMBLE.unpack_from(self._mmap, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"스냅샷 파일이 아닙니다: {file_path}")
+        if version != SNAPSHOT_FORMAT_VERSION:
+            raise ValueError(
+                f"스냅샷 형식 버전이 다릅니다 (파일 v{version}, 지원 v{SNAPSHOT_FORMAT_VERSION}). "
+                "`python main.py snapshot`으로 다시 만들어주세요."
+            )
+
+        header = json.loads(self._mmap[_PREAMBLE.size:_PREAMBLE.size + header_size].decode("utf-8"))
+        self.model: Type[BaseModel] = SNAPSHOT_MODELS[header["model"]]
+        self.count: int = header["count"]
+        self.fields: Dict[str, Tuple[str, bool]] = {
+            name: (kind, optional) for name, (kind, optional) in header["fields"].items()
+        }
+        self.derived: List[str] = header["derived"]
+        self._layout: Dict[str, Dict[str, Any]] = header["columns"]
+        self._data_start = _align(_PREAMBLE.size + header_size)
+        self._tables: Dict[str, StringTable] = {}
+        self._construct = trusted_constructor(self.model)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def column(self, name: str) -> np.ndarray:
+        """컬럼 배열 (파일을 직접 가리키는 읽기 전용 뷰)"""
+        spec = self._layout[name]
+        return np.frombuffer(
+            self._mmap,
+            dtype=np.dtype(spec["dtype"]),
+            count=spec["count"],
+            offset=self._data_start + spec["offset"],
+        )
+
+    def strings(self, name: str) -> StringTable:
+        """문자열 / 문자열 목록 필드의 고유 문자열 테이블 (파생 컬럼은 `@이름`)"""
+        table = self._tables.get(name)
+        if table is None:
+            table = self._tables[name] = StringTable(
+                self.column(f"{name}.table.blob"), self.column(f"{name}.table.offsets")
+            )
+        return table
+
+    def string_values(self, name: str) -> List[Optional[str]]:
+        """문자열 필드의 레코드별 값 (전체 디코딩)"""
+        table = self.strings(name).tolist()
+        return [table[code] if code >= 0 else None for code in self.column(f"{name}.codes").tolist()]
+
+    def record(self, i: int) -> Dict[str, Any]:
+        """i번째 레코드를 dict로 복원"""
+        values: Dict[str, Any] = {}
+        for name, (kind, optional) in self.fields.items():
+            if kind == "int":
+                value = int(self.column(name)[i])
+                if optional and self.column(f"{name}.null")[i]:
+                    value = None
+            elif kind == "str":
+                code = int(self.column(f"{name}.codes")[i])
+                value = self.strings(name)[code] if code >= 0 else None
+            else:
+                offsets = self.column(f"{name}.offsets")
+                table = self.strings(name)
+                value = [table[code] for code in self.column(f"{name}.codes")[offsets[i]:offsets[i + 1]].tolist()]
+            values[name] = value
+        return values
+
+    def model_at(self, i: int) -> BaseModel:
+        """i번째 레코드를 모델로 생성 (저장 시점에 검증된 값이므로 다시 검증하지 않음)"""
+        return self._construct(self.record(i))
+
+    def models(self) -> "LazyModelList":
+        """필요한 레코드만 모델로 만드는 지연 목록"""
+        return LazyModelList(self)
+
+
+class LazyModelList(Sequence):
+    """접근한 위치의 레코드만 모델로 만들어 캐시하는 읽기 전용 목록"""
+
+    def __init__(self, snapshot: Snapshot):
+        self._snapshot = snapshot
+        self._cache: Dict[int, BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._snapshot)
+
+    def __getitem__(self, pos):
+        if isinstance(pos, slice):
+            return [self[i] for i in range(*pos.indices(len(self)))]
+        if pos < 0:
+            pos += len(self)
+        if not 0 <= pos < len(self):
+            raise IndexError(pos)
+        model = self._cache.get(pos)
+        if model is None:
+            model = self._cache[pos] = self._snapshot.model_at(pos)
+        return model
+
+    def __iter__(self) -> Iterator[BaseModel]:
+        for pos in range(len(self)):
+            yield self[pos]
+
+
+def open_snapshot(file_path: str, model: Optional[Type[BaseModel]] = None) -> Snapshot:
+    """스냅샷 파일 열기 (model을 주면 저장된 모델과 같은지 확인)"""
+    snapshot = Snapshot(file_path)
+    if model is not None and snapshot.model is not model:
+        raise ValueError(
+            f"{file_path}은(는) {snapshot.model.__name__} 스냅샷입니다 ({model.__name__} 필요)"
+        )
+    return snapshot
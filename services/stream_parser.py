@@ -0,0 +1,86 @@
+"""
+스트리밍 응답용 증분 JSON 파서
+
+`{"recommendations": [{...}, {...}]}` 형태의 응답이 조각(chunk)으로 도착할 때,
+배열 안의 추천 객체가 하나 완성될 때마다 바로 꺼내 줍니다.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+
+
+class RecommendationStreamParser:
+    """추천 배열의 원소를 완성되는 즉시 반환하는 증분 파서"""
+
+    def __init__(self, array_key: str = "recommendations"):
+        self.array_key = array_key
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._last_string: Optional[str] = None
+        self._last_key: Optional[str] = None
+        self._array_depth: Optional[int] = None
+        self._object_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        응답 조각을 추가하고 새로 완성된 추천 객체 목록을 반환
+
+        Args:
+            chunk: 스트리밍으로 받은 텍스트 조각
+
+        Returns:
+            이번 조각으로 완성된 추천 객체들 (없으면 빈 목록)
+        """
+        self._text += chunk
+        completed: List[Dict[str, Any]] = []
+        text = self._text
+
+        for i in range(self._pos, len(text)):
+            ch = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._array_depth is None:
+                        self._last_string = text[self._string_start:i]
+                continue
+
+            if ch == '"':
+                self._in_string = True
+                self._string_start = i + 1
+            elif ch == ":":
+                self._last_key = self._last_string
+            elif ch in "{[":
+                self._depth += 1
+                if ch == "[" and self._array_depth is None and self._last_key == self.array_key:
+                    self._array_depth = self._depth
+                elif ch == "{" and self._array_depth is not None and self._depth == self._array_depth + 1:
+                    self._object_start = i
+            elif ch in "}]":
+                if (
+                    ch == "}"
+                    and self._object_start is not None
+                    and self._depth == self._array_depth + 1
+                ):
+                    completed.append(json.loads(text[self._object_start:i + 1]))
+                    self._object_start = None
+                elif ch == "]" and self._array_depth == self._depth:
+                    self._array_depth = None
+                    self._last_key = None
+                self._depth -= 1
+
+        # 진행 중인 객체/문자열이 없으면 이미 읽은 부분은 버림
+        if self._object_start is None and not self._in_string:
+            self._text = ""
+            self._pos = 0
+        else:
+            self._pos = len(text)
+        return completed
@@ -0,0 +1,125 @@
+"""
+문자열 어휘 사전과 비트셋 연산
+
+관심사 / 태그 / 활동 유형 단어 / 직군 키워드를 정수 ID로 바꾸고, 집합을
+비트셋으로 표현합니다. 비트셋은 두 가지 형태를 씁니다.
+
+- 파이썬 int: 한 개의 집합 (멘토/멘티 관심사, 직무명에 포함된 직군 등), 길이 제한 없음
+- uint64 행렬 `[행 수, 단어 수]`: 프로그램/키워드 문자열별 집합, NumPy로 한 번에 AND
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+
+WORD_BITS = 64
+
+
+class Vocabulary:
+    """문자열 <-> 정수 ID 사전 (ID는 추가 순서대로 0부터, 삭제 없음)"""
+
+    def __init__(self, terms: Iterable[str] = ()):
+        self.terms: List[str] = []
+        self._ids: Dict[str, int] = {}
+        # 부분 문자열 관계 메모: 문자열 -> [비트셋, 확인한 항목 수] (어휘가 늘면 새 항목만 확인)
+        self._containing: Dict[str, List[int]] = {}
+        self._within: Dict[str, List[int]] = {}
+        for term in terms:
+            self.add(term)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def copy(self) -> "Vocabulary":
+        """같은 ID 체계의 사본 (부분 문자열 메모는 사본에서 다시 계산)"""
+        vocabulary = Vocabulary()
+        vocabulary.terms = list(self.terms)
+        vocabulary._ids = dict(self._ids)
+        return vocabulary
+
+    def __contains__(self, term: str) -> bool:
+        return term in self._ids
+
+    def add(self, term: str) -> int:
+        """term의 ID (처음 보는 문자열이면 새 ID 부여)"""
+        term_id = self._ids.get(term)
+        if term_id is None:
+            term_id = self._ids[term] = len(self.terms)
+            self.terms.append(term)
+        return term_id
+
+    def get(self, term: str) -> Optional[int]:
+        return self._ids.get(term)
+
+    @property
+    def n_words(self) -> int:
+        """비트셋 행렬에 필요한 uint64 단어 수"""
+        return word_count(len(self.terms))
+
+    def bits(self, terms: Iterable[str]) -> int:
+        """terms의 비트셋 (처음 보는 문자열은 등록)"""
+        return bits_of(self.add(term) for term in terms)
+
+    def containing(self, text: str) -> int:
+        """`text`를 부분 문자열로 포함하는 항목의 비트셋 (`text in 항목`)"""
+        return self._resolve(self._containing, text, lambda term: text in term)
+
+    def within(self, text: str) -> int:
+        """`text`에 부분 문자열로 들어 있는 항목의 비트셋 (`항목 in text`)"""
+        return self._resolve(self._within, text, lambda term: term in text)
+
+    def _resolve(self, memo: Dict[str, List[int]], text: str, related: Callable[[str], bool]) -> int:
+        entry = memo.get(text)
+        if entry is None:
+            entry = memo[text] = [0, 0]
+        bits, checked = entry
+        if checked < len(self.terms):
+            for term_id in range(checked, len(self.terms)):
+                if related(self.terms[term_id]):
+                    bits |= 1 << term_id
+            entry[0], entry[1] = bits, len(self.terms)
+        return bits
+
+
+def word_count(bits: int) -> int:
+    return max(1, (bits + WORD_BITS - 1) // WORD_BITS)
+
+
+def bits_of(ids: Iterable[int]) -> int:
+    """ID 목록 -> 파이썬 int 비트셋"""
+    bits = 0
+    for term_id in ids:
+        bits |= 1 << term_id
+    return bits
+
+
+def to_words(bits: int, n_words: int) -> np.ndarray:
+    """파이썬 int 비트셋 -> uint64 배열 (하위 단어부터)"""
+    return np.frombuffer(bits.to_bytes(n_words * 8, "little"), dtype="<u8").astype(np.uint64)
+
+
+def rows_to_matrix(rows: List[int], n_words: int) -> np.ndarray:
+    """파이썬 int 비트셋 목록 -> uint64 행렬 `[len(rows), n_words]`"""
+    if not rows:
+        return np.zeros((0, n_words), dtype=np.uint64)
+    raw = b"".join(bits.to_bytes(n_words * 8, "little") for bits in rows)
+    return np.frombuffer(raw, dtype="<u8").astype(np.uint64).reshape(len(rows), n_words)
+
+
+def widen(matrix: np.ndarray, n_words: int) -> np.ndarray:
+    """어휘가 늘어 단어 수가 늘었으면 0으로 채운 열을 덧붙임"""
+    missing = n_words - matrix.shape[1]
+    if missing <= 0:
+        return matrix
+    return np.pad(matrix, ((0, 0), (0, missing)))
+
+
+def any_common(matrix: np.ndarray, bits: int) -> np.ndarray:
+    """행마다 `bits`와 겹치는 비트가 있는지 (행 AND 후 0이 아닌지)"""
+    if bits == 0:
+        return np.zeros(matrix.shape[0], dtype=bool)
+    words = to_words(bits, matrix.shape[1])
+    if matrix.shape[1] == 1:
+        return (matrix[:, 0] & words[0]) != 0
+    return (matrix & words).any(axis=1)
@@ -0,0 +1,58 @@
+"""
+pytest 공통 설정: 저장소 루트를 import 경로에 추가하고 공용 픽스처 제공
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from models import Mentee, Mentor, MentoringProgram  # noqa: E402
+from services.data_loader import iter_models  # noqa: E402
+
+
+@pytest.fixture
+def sample_programs():
+    """`data/sample_programs.json`의 프로그램 목록"""
+    return list(iter_models(ROOT / "data" / "sample_programs.json", MentoringProgram))
+
+
+@pytest.fixture
+def synthetic_programs(sample_programs):
+    """샘플 프로그램을 바탕으로 지역 / 비용 / 태그 / 직군을 섞은 프로그램 600개 (고정 시드)"""
+    rng = random.Random(7)
+    locations = ["서울", "서울 강남", "서울 홍대", "서울 전역", "부산", "경기 성남", "온라인"]
+    interests = ["카페", "독서", "게임", "운동", "미술관", "영화", "등산", "식사", "보드게임", "실내"]
+    jobs = ["개발자", "마케터", "디자이너", "기획자", "영업", "모든 직군"]
+    return [
+        rng.choice(sample_programs).model_copy(update={
+            "program_id": f"SYN{i:04d}",
+            "location": rng.choice(locations),
+            "estimated_cost": rng.randrange(0, 60_000, 1_000),
+            "tags": rng.sample(interests, 3),
+            "recommended_for": rng.sample(jobs, 2),
+        })
+        for i in range(600)
+    ]
+
+
+@pytest.fixture
+def sample_mentors():
+    return list(iter_models(ROOT / "data" / "sample_mentors.json", Mentor))
+
+
+@pytest.fixture
+def sample_mentees():
+    return list(iter_models(ROOT / "data" / "sample_mentees.json", Mentee))
+
+
+@pytest.fixture
+def azure_env(monkeypatch):
+    """실제 엔드포인트 / 디스크 캐시를 쓰지 않는 Azure OpenAI 설정"""
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "mock-key")
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://mock.openai.azure.com")
+    monkeypatch.setenv("AZURE_OPENAI_CACHE_PATH", "")
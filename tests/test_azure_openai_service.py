@@ -0,0 +1,173 @@
+"""
+AzureOpenAIService 테스트: 비동기 클라이언트 수명, 배치 추천 분할 (모의 HTTP 전송, 실제 엔드포인트 없음)
+"""
+
+import asyncio
+import json
+
+import openai
+import pytest
+
+try:
+    import httpx
+except ImportError:  # httpx를 httpx2라는 이름으로 포함하는 openai 배포판
+    import httpx2 as httpx
+
+from services.azure_openai_service import AzureOpenAIService
+from services.response_cache import ResponseCache
+
+
+def completion(program_id: str):
+    """추천 하나가 담긴 단일 쌍 응답"""
+    return chat_response(json.dumps({
+        "recommendations": [{"program_id": program_id, "match_score": 90, "reason": "모의 응답"}]
+    }))
+
+
+def chat_response(content: str):
+    """`content`를 담은 Chat Completion 응답"""
+    return httpx.Response(200, json={
+        "id": "mock",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "mock",
+        "choices": [
+            {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+        ],
+    })
+
+
+class MockedAzureOpenAIService(AzureOpenAIService):
+    """비동기 클라이언트의 HTTP 전송만 모의 전송으로 바꾸고, 만든 클라이언트를 기록"""
+
+    def __init__(self, **kwargs):
+        self.created = []
+        super().__init__(**kwargs)
+
+    def _create_async_client(self):
+        client = openai.AsyncAzureOpenAI(
+            api_key=self.api_key,
+            api_version=self.api_version,
+            azure_endpoint=self.endpoint,
+            max_retries=0,
+            http_client=openai.DefaultAsyncHttpxClient(
+                transport=httpx.MockTransport(lambda request: completion("PROG001"))
+            ),
+        )
+        self.created.append(client)
+        return client
+
+
+@pytest.fixture
+def service(azure_env):
+    return MockedAzureOpenAIService(cache=ResponseCache(max_entries=0))
+
+
+def request(name: str):
+    return {
+        "mentor_profile": {"name": f"멘토{name}", "interests": ["카페"]},
+        "mentee_profile": {"name": f"멘티{name}", "budget_limit": 50000},
+        "available_programs": [{"program_id": "PROG001", "title": "카페", "estimated_cost": 10000}],
+        "top_k": 1,
+    }
+
+
+def test_new_event_loop_closes_previous_async_client(service):
+    first = asyncio.run(service.agenerate_recommendations(**request("a")))
+    assert [rec["program_id"] for rec in first] == ["PROG001"]
+    assert len(service.created) == 1
+    assert not service.created[0].is_closed()
+
+    async def second_loop():
+        result = await service.agenerate_recommendations(**request("b"))
+        await service.aclose()
+        return result
+
+    second = asyncio.run(second_loop())
+    assert [rec["program_id"] for rec in second] == ["PROG001"]
+    assert len(service.created) == 2
+    assert all(client.is_closed() for client in service.created)
+
+
+def test_same_event_loop_reuses_async_client(service):
+    async def run():
+        await asyncio.gather(*(service.agenerate_recommendations(**request(str(i))) for i in range(3)))
+        await service.aclose()
+
+    asyncio.run(run())
+    assert len(service.created) == 1
+    assert service.created[0].is_closed()
+
+
+class BatchBackend:
+    """배치 / 단일 쌍 프롬프트에 응답하는 모의 동기 엔드포인트 (`replies`를 차례로 사용)"""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = []
+
+    def __call__(self, request):
+        prompt = json.loads(request.content)["messages"][-1]["content"]
+        if "## 쌍 목록" in prompt:
+            pairs = json.loads(prompt.split("## 쌍 목록\n")[1].strip())
+            self.calls.append(len(pairs))
+        else:
+            pairs = None
+            self.calls.append("single")
+        reply = self.replies.pop(0) if self.replies else "ok"
+        if reply == "429":
+            return httpx.Response(429, json={"error": {"code": "429", "message": "Rate limit exceeded"}})
+        if reply == "garbage":
+            return chat_response("결과 없음")
+        if pairs is None:
+            return completion("PROG001")
+        # "drop-last"면 마지막 쌍을 응답에서 뺌
+        answered = pairs[:-1] if reply == "drop-last" else pairs
+        return chat_response(json.dumps({"results": {
+            pair["id"]: [{"program_id": pair["candidates"][0], "match_score": 80, "reason": "배치"}]
+            for pair in answered
+        }}))
+
+
+def batch_service(backend: BatchBackend) -> AzureOpenAIService:
+    service = AzureOpenAIService(cache=ResponseCache(max_entries=0))
+    service.client = openai.AzureOpenAI(
+        api_key=service.api_key,
+        api_version=service.api_version,
+        azure_endpoint=service.endpoint,
+        max_retries=0,
+        http_client=openai.DefaultHttpxClient(transport=httpx.MockTransport(backend)),
+    )
+    return service
+
+
+def batch_requests(count: int):
+    programs = [{"program_id": "PROG001", "title": "카페", "estimated_cost": 10000}]
+    return [dict(request(str(i)), available_programs=programs) for i in range(count)], programs
+
+
+def test_batch_rate_limit_fails_chunk_without_splitting(azure_env):
+    backend = BatchBackend("429")
+    requests, catalog = batch_requests(4)
+    results = batch_service(backend).generate_batch_recommendations(requests, catalog, pairs_per_prompt=4)
+
+    assert backend.calls == [4]
+    assert all(isinstance(result, openai.RateLimitError) for result in results)
+
+
+def test_batch_missing_pair_is_requested_again(azure_env):
+    backend = BatchBackend("drop-last")
+    requests, catalog = batch_requests(3)
+    results = batch_service(backend).generate_batch_recommendations(requests, catalog, pairs_per_prompt=3)
+
+    assert backend.calls == [3, "single"]
+    assert [[rec["program_id"] for rec in result] for result in results] == [["PROG001"]] * 3
+
+
+def test_batch_unparseable_response_is_split(azure_env):
+    backend = BatchBackend("garbage")
+    requests, catalog = batch_requests(4)
+    results = batch_service(backend).generate_batch_recommendations(requests, catalog, pairs_per_prompt=4)
+
+    assert backend.calls == [4, 2, 2]
+    assert all(isinstance(result, list) and len(result) == 1 for result in results)
@@ -0,0 +1,82 @@
+"""
+CatalogWatcher 테스트 (프로그램 파일 변경분 반영)
+"""
+
+import json
+import os
+
+import pytest
+
+from models import MentoringProgram
+from services.catalog_watcher import CatalogWatcher
+from services.matching_service import MatchingService
+from services.snapshot import write_snapshot
+
+
+def write_programs(path, programs):
+    path.write_text(
+        json.dumps([program.model_dump(mode="json") for program in programs], ensure_ascii=False),
+        encoding="utf-8"
+    )
+    # mtime 해상도가 낮은 파일 시스템에서도 변경으로 보이도록 mtime을 앞으로 옮김
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def watched(tmp_path, sample_programs):
+    path = tmp_path / "programs.json"
+    write_programs(path, sample_programs)
+    service = MatchingService()
+    watcher = CatalogWatcher(service, str(path))
+    service.load_programs_from_file(str(path))
+    return service, watcher, path
+
+
+def test_check_applies_added_updated_and_removed_programs(watched, sample_programs):
+    service, watcher, path = watched
+    version = service.catalog_version
+    assert watcher.check() is None
+
+    updated = sample_programs[0].model_copy(update={"estimated_cost": 1234})
+    added = sample_programs[1].model_copy(update={"program_id": "NEW001", "title": "새 프로그램"})
+    write_programs(path, [updated] + sample_programs[2:] + [added])
+
+    diff = watcher.check()
+    assert [p.program_id for p in diff.added] == ["NEW001"]
+    assert [p.program_id for p in diff.updated] == [updated.program_id]
+    assert diff.removed == [sample_programs[1].program_id]
+    assert service.catalog_version == version + 1
+    assert service.index.get(updated.program_id).estimated_cost == 1234
+    assert service.index.get("NEW001") is not None
+    assert service.index.get(sample_programs[1].program_id) is None
+    assert len(service.programs) == len(sample_programs)
+
+    # 다시 확인하면 바뀐 것이 없음
+    assert watcher.check() is None
+    assert service.catalog_version == version + 1
+
+
+def test_check_keeps_catalog_when_file_is_missing(watched, sample_programs):
+    service, watcher, path = watched
+    path.unlink()
+    assert watcher.check() is None
+    assert len(service.programs) == len(sample_programs)
+
+    write_programs(path, sample_programs[1:])
+    diff = watcher.check()
+    assert diff.removed == [sample_programs[0].program_id]
+
+
+def test_snapshot_file_is_rejected(tmp_path, sample_programs):
+    path = tmp_path / "programs.snap"
+    write_snapshot(sample_programs, MentoringProgram, str(path))
+    with pytest.raises(ValueError, match="스냅샷"):
+        CatalogWatcher(MatchingService(), str(path))
+
+
+def test_file_replaced_by_snapshot_is_ignored(watched, sample_programs):
+    service, watcher, path = watched
+    write_snapshot(sample_programs[1:], MentoringProgram, str(path))
+    assert watcher.check() is None
+    assert len(service.programs) == len(sample_programs)
@@ -0,0 +1,86 @@
+"""
+프로그램 / 멘토 / 멘티 파일 로더와 바이너리 스냅샷 왕복 테스트
+"""
+
+import json
+
+import pytest
+
+from models import Mentee, Mentor, MentoringProgram
+from services.data_loader import iter_models
+from services.matching_service import MatchingService
+from services.snapshot import is_snapshot, open_snapshot, write_snapshot
+
+
+def dump(models):
+    return [model.model_dump(mode="json") for model in models]
+
+
+@pytest.fixture(params=["array", "lines"])
+def programs_file(request, tmp_path, synthetic_programs):
+    if request.param == "array":
+        path = tmp_path / "programs.json"
+        path.write_text(json.dumps(dump(synthetic_programs), ensure_ascii=False, indent=2), encoding="utf-8")
+    else:
+        path = tmp_path / "programs.jsonl"
+        path.write_text(
+            "\n".join(json.dumps(record, ensure_ascii=False) for record in dump(synthetic_programs)) + "\n",
+            encoding="utf-8"
+        )
+    return path
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_json_round_trip(programs_file, synthetic_programs, trusted, chunk_size):
+    loaded = list(iter_models(str(programs_file), MentoringProgram, chunk_size=chunk_size, trusted=trusted))
+    assert loaded == synthetic_programs
+
+
+def test_invalid_record_reports_its_position(tmp_path, sample_programs):
+    records = dump(sample_programs)
+    records[2]["estimated_cost"] = "무료"
+    path = tmp_path / "programs.json"
+    path.write_text(json.dumps(records, ensure_ascii=False), encoding="utf-8")
+
+    with pytest.raises(ValueError, match="estimated_cost"):
+        list(iter_models(str(path), MentoringProgram))
+
+
+@pytest.mark.parametrize("model, fixture", [
+    (MentoringProgram, "synthetic_programs"),
+    (Mentor, "sample_mentors"),
+    (Mentee, "sample_mentees"),
+])
+def test_snapshot_round_trip(request, tmp_path, model, fixture):
+    records = request.getfixturevalue(fixture)
+    path = tmp_path / "records.snap"
+    assert write_snapshot(records, model, str(path)) == len(records)
+
+    assert is_snapshot(str(path))
+    assert list(open_snapshot(str(path), model).models()) == records
+    assert list(iter_models(str(path), model, chunk_size=5)) == records
+
+
+def test_snapshot_of_another_model_is_rejected(tmp_path, sample_mentors):
+    path = tmp_path / "mentors.snap"
+    write_snapshot(sample_mentors, Mentor, str(path))
+    with pytest.raises(ValueError, match="Mentor"):
+        open_snapshot(str(path), MentoringProgram)
+
+
+def test_snapshot_catalog_matches_json_catalog(
+    programs_file, tmp_path, synthetic_programs, sample_mentors, sample_mentees
+):
+    snapshot_path = tmp_path / "programs.snap"
+    write_snapshot(synthetic_programs, MentoringProgram, str(snapshot_path))
+    from_json, from_snapshot = MatchingService(), MatchingService()
+    from_json.load_programs_from_file(str(programs_file))
+    from_snapshot.load_programs_from_file(str(snapshot_path))
+
+    for mentor in sample_mentors:
+        for mentee in sample_mentees:
+            expected = from_json.find_matches(mentor, mentee, 5)
+            actual = from_snapshot.find_matches(mentor, mentee, 5)
+            assert [(r.program, r.match_score, r.reason) for r in actual] == \
+                [(r.program, r.match_score, r.reason) for r in expected]
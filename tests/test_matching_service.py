@@ -0,0 +1,70 @@
+"""
+MatchingService 테스트
+"""
+
+import threading
+
+import pytest
+
+from services.matching_service import MatchingService
+from services.metrics import HistogramSink
+
+
+def program_ids(recommendations):
+    return [rec.program.program_id for rec in recommendations]
+
+
+class BlockingAIService:
+    """`release`가 설정될 때까지 응답하지 않는 AI 서비스"""
+
+    max_concurrency = 1
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = 0
+
+    def generate_recommendations(self, **request):
+        self.calls += 1
+        self.release.wait(5)
+        return []
+
+
+def test_hedge_skips_ai_call_when_pool_is_busy(sample_programs, sample_mentors, sample_mentees):
+    service = MatchingService(ai_latency_budget=0.05)
+    service.programs = sample_programs
+    mentor, mentee = sample_mentors[0], sample_mentees[0]
+    rule_based = service.find_matches(mentor, mentee, 3)
+    assert rule_based
+
+    sink = service.metrics.add_sink(HistogramSink())
+    ai = BlockingAIService()
+    service.use_ai, service.ai_service = True, ai
+    try:
+        # 첫 요청: AI 호출이 예산을 넘겨 규칙 기반 결과
+        assert program_ids(service.find_matches(mentor, mentee, 3)) == program_ids(rule_based)
+        # 두 번째 요청: 스레드가 모두 바쁘므로 AI 호출을 대기열에 쌓지 않음
+        assert program_ids(service.find_matches(mentor, mentee, 3)) == program_ids(rule_based)
+        assert ai.calls == 1
+        counters = sink.summary()["counters"]
+        assert counters["ai_over_budget"] == 1
+        assert counters["ai_hedge_skipped"] == 1
+    finally:
+        ai.release.set()
+        service.close()
+
+
+@pytest.mark.parametrize("mentee_interests, activity_type, code", [
+    # 공통 관심사가 있지만 활동과 겹치지 않음
+    (["등산", "독서", "카페"], "전시", "interest.common"),
+    # 공통 관심사는 없고 멘토 관심사가 활동과 겹침
+    (["보드게임"], "독서 모임 카페 등산", "interest.partial"),
+])
+def test_interest_reasons_keep_input_order(
+    sample_programs, sample_mentors, sample_mentees, mentee_interests, activity_type, code
+):
+    program = sample_programs[0].model_copy(update={"activity_type": activity_type, "tags": []})
+    mentor = sample_mentors[0].model_copy(update={"interests": ["카페", "독서", "등산"]})
+    mentee = sample_mentees[0].model_copy(update={"interests": mentee_interests})
+
+    _, reasons = MatchingService()._calculate_match_score(program, mentor, mentee)
+    assert [reason.params["interests"] for reason in reasons if reason.code == code] == [["카페", "독서"]]
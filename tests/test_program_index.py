@@ -0,0 +1,115 @@
+"""
+ProgramIndex와 카탈로그 변경분(diff_programs / apply_catalog_diff / add_program) 테스트
+"""
+
+import random
+
+import pytest
+
+from services.matching_service import MatchingService
+from services.program_index import ProgramIndex, diff_programs
+
+
+def recommendations(service, mentors, mentees, top_k=5):
+    return [
+        [(r.program, r.match_score, r.reason) for r in service.find_matches(mentor, mentee, top_k)]
+        for mentor in mentors
+        for mentee in mentees
+    ]
+
+
+def assert_same_index(actual: ProgramIndex, expected: ProgramIndex):
+    assert list(actual.programs) == list(expected.programs)
+    assert actual._costs == expected._costs
+    assert actual._positions == expected._positions
+    assert actual._by_id == expected._by_id
+
+
+@pytest.mark.parametrize("count", [1, 17, 300])
+def test_extend_matches_adding_one_by_one(synthetic_programs, count):
+    # 같은 ID가 여러 번 나오고 지역 / 요일 인덱스가 이미 만들어진 경우까지 포함
+    programs = synthetic_programs[:300] + [
+        program.model_copy(update={"program_id": f"SYN{i % 50:04d}"})
+        for i, program in enumerate(synthetic_programs[300:])
+    ]
+    extended, added = ProgramIndex(programs[:300]), ProgramIndex(programs[:300])
+    for index in (extended, added):
+        index.region_positions("서울")
+        index.schedule_positions(index.affordable_positions(60_000), 0b1111111)
+
+    extended.extend(programs[300:300 + count])
+    for program in programs[300:300 + count]:
+        added.add(program)
+
+    assert_same_index(extended, added)
+    assert extended._regions == added._regions
+    assert extended._days == added._days
+
+
+def test_copy_is_independent(synthetic_programs):
+    index = ProgramIndex(synthetic_programs[:100])
+    copy = index.copy()
+    copy.extend(synthetic_programs[100:110])
+    copy.remove([0, 1])
+
+    assert list(index.programs) == synthetic_programs[:100]
+    assert index.get(synthetic_programs[0].program_id) == synthetic_programs[0]
+    assert index.get(synthetic_programs[105].program_id) is None
+
+
+def test_diff_programs(synthetic_programs):
+    index = ProgramIndex(synthetic_programs[:100])
+    updated = synthetic_programs[5].model_copy(update={"estimated_cost": 999})
+    new = synthetic_programs[:5] + [updated] + synthetic_programs[7:100] + synthetic_programs[100:103]
+
+    diff = diff_programs(index, new)
+    assert [p.program_id for p in diff.added] == [p.program_id for p in synthetic_programs[100:103]]
+    assert diff.updated == [updated]
+    assert diff.removed == [synthetic_programs[6].program_id]
+    assert not diff_programs(index, synthetic_programs[:100])
+
+
+def test_apply_catalog_diff_matches_fresh_load(synthetic_programs, sample_mentors, sample_mentees):
+    rng = random.Random(3)
+    old = synthetic_programs[:500]
+    new = [
+        program.model_copy(update={"estimated_cost": rng.randrange(0, 60_000, 1_000)})
+        if rng.random() < 0.1 else program
+        for program in old if rng.random() > 0.1
+    ] + synthetic_programs[500:]
+
+    service = MatchingService()
+    service.programs = old
+    before = recommendations(service, sample_mentors, sample_mentees)
+    version = service.catalog_version
+
+    diff = diff_programs(service.index, new)
+    assert service.apply_catalog_diff(diff) == version + 1
+
+    fresh = MatchingService()
+    fresh.programs = new
+    assert sorted(p.program_id for p in service.programs) == sorted(p.program_id for p in new)
+    assert recommendations(service, sample_mentors, sample_mentees) == \
+        recommendations(fresh, sample_mentors, sample_mentees)
+
+    # 반영 전에 잡아 둔 카탈로그는 바뀌지 않음
+    service.programs = old
+    assert recommendations(service, sample_mentors, sample_mentees) == before
+
+
+def test_added_programs_are_applied_in_one_copy(synthetic_programs, sample_mentors, sample_mentees):
+    service = MatchingService()
+    service.programs = synthetic_programs[:300]
+    version = service.catalog_version
+
+    for program in synthetic_programs[300:]:
+        service.add_program(program)
+    # 추가분은 다음 조회 때 한 번에 반영
+    assert service.catalog_version == version
+    assert list(service.programs) == synthetic_programs
+    assert service.catalog_version == version + 1
+
+    fresh = MatchingService()
+    fresh.programs = synthetic_programs
+    assert recommendations(service, sample_mentors, sample_mentees) == \
+        recommendations(fresh, sample_mentors, sample_mentees)
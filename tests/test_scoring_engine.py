@@ -0,0 +1,62 @@
+"""
+벡터화 점수 계산(ProgramColumns)과 규칙 기반 점수(`_calculate_match_score`)의 일치 여부
+"""
+
+import numpy as np
+
+from services.matching_service import MatchingService
+from services.scoring_engine import ProgramColumns
+
+
+def scalar_scores(service, programs, mentor, mentee):
+    return np.array([
+        service._calculate_match_score(program, mentor, mentee, with_reason=False)[0]
+        for program in programs
+    ])
+
+
+def test_vector_scores_match_scalar_scores(synthetic_programs, sample_mentors, sample_mentees):
+    service = MatchingService()
+    columns = ProgramColumns(synthetic_programs)
+    for mentor in sample_mentors:
+        for mentee in sample_mentees:
+            np.testing.assert_allclose(
+                columns.score(mentor, mentee),
+                scalar_scores(service, synthetic_programs, mentor, mentee),
+            )
+
+
+def test_vector_scores_match_after_append_replace_remove(synthetic_programs, sample_mentors, sample_mentees):
+    programs = list(synthetic_programs[:400])
+    columns = ProgramColumns(programs)
+
+    columns.append(synthetic_programs[400:])
+    programs.extend(synthetic_programs[400:])
+    replaced = programs[10].model_copy(update={"location": "부산", "estimated_cost": 0, "tags": ["등산"]})
+    columns.replace(10, replaced)
+    programs[10] = replaced
+    removed = {3, 250, 599}
+    columns.remove(sorted(removed))
+    programs = [program for pos, program in enumerate(programs) if pos not in removed]
+
+    service = MatchingService()
+    for mentor in sample_mentors:
+        for mentee in sample_mentees:
+            np.testing.assert_allclose(
+                columns.score(mentor, mentee), scalar_scores(service, programs, mentor, mentee)
+            )
+
+
+def test_vectorized_and_scalar_services_recommend_the_same(synthetic_programs, sample_mentors, sample_mentees):
+    vectorized, scalar = MatchingService(), MatchingService(vectorized=False)
+    for service in (vectorized, scalar):
+        service.programs = synthetic_programs
+
+    for mentor in sample_mentors:
+        for mentee in sample_mentees:
+            for top_k in (1, 5, 50):
+                expected = scalar.find_matches(mentor, mentee, top_k)
+                actual = vectorized.find_matches(mentor, mentee, top_k)
+                assert [(r.program.program_id, r.match_score) for r in actual] == \
+                    [(r.program.program_id, r.match_score) for r in expected]
+                assert [r.reason for r in actual] == [r.reason for r in expected]